@@ -0,0 +1,182 @@
+"""
+Бенчмарк пропускной способности стека обработки апдейтов.
+
+Синтетические Update подаются напрямую в Dispatcher (тот же, что собирает
+src.bot.factory): LoggingMiddleware -> DbSessionMiddleware -> роутеры -> БД.
+Бот работает через FakeSession, БД — временная SQLite. Запуск:
+
+    python -m benchmarks.bot_handlers --updates 5000 --concurrency 50
+
+Сценарии: start (/start), add (FSM добавления сайта: кнопка + URL),
+list (кнопка «Мои сайты»). Отчет: апдейтов/с, p50/p99 задержки хендлера,
+соединения с БД и аллокации на апдейт.
+"""
+
+import gc
+import os
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+import tracemalloc
+from typing import Any
+from collections import Counter
+
+from benchmarks.common import create_schema, percentile, quiet_logs, setup_environment
+from benchmarks.fake_telegram import FakeSession, message_update
+
+
+SCENARIOS = ("start", "add", "list")
+USER_ID_BASE = 5_000_000
+
+
+class PoolStats:
+    """Счетчики пула соединений SQLAlchemy через события движка."""
+
+    def __init__(self, engine) -> None:
+        from sqlalchemy import event
+
+        self.connects = 0
+        self.checkouts = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "connect", self._on_connect)
+        event.listen(sync_engine, "checkout", self._on_checkout)
+        event.listen(sync_engine, "checkin", self._on_checkin)
+
+    def _on_connect(self, *args: Any) -> None:
+        self.connects += 1
+
+    def _on_checkout(self, *args: Any) -> None:
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, *args: Any) -> None:
+        self.in_use -= 1
+
+
+def _script(scenario: str, user_id: int, step: int) -> list[dict[str, Any]]:
+    """Последовательность апдейтов одного шага виртуального пользователя."""
+    from src.bot.lexicon import Buttons
+
+    if scenario == "start":
+        return [message_update(user_id, "/start")]
+    if scenario == "list":
+        return [message_update(user_id, Buttons.START["menu_my_sites"])]
+    return [
+        message_update(user_id, Buttons.START["menu_add_site"]),
+        message_update(user_id, f"https://site-{user_id}-{step}.example.com"),
+    ]
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from aiogram.types import Update
+
+    from src.bot.factory import create_bot, create_dispatcher
+    from src.infrastructure.database.manager import db_manager
+
+    if not args.keep_logs:
+        quiet_logs()
+    await create_schema(db_manager.engine)
+
+    session = FakeSession()
+    bot = create_bot(session=session)
+    dp = create_dispatcher()
+    pool = PoolStats(db_manager.engine)
+    scenarios = args.scenarios.split(",")
+
+    latencies: list[float] = []
+    per_scenario: Counter[str] = Counter()
+    remaining = args.updates
+
+    async def feed(payload: dict[str, Any]) -> None:
+        update = Update.model_validate(payload, context={"bot": bot})
+        started = time.perf_counter()
+        await dp.feed_update(bot, update)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    async def virtual_user(index: int) -> None:
+        nonlocal remaining
+        user_id = USER_ID_BASE + index
+        rng = random.Random(index)
+        step = 0
+        while remaining > 0:
+            scenario = rng.choice(scenarios)
+            batch = _script(scenario, user_id, step)
+            remaining -= len(batch)
+            step += 1
+            per_scenario[scenario] += 1
+            # Апдейты одного пользователя идут последовательно, как в Telegram
+            for payload in batch:
+                await feed(payload)
+
+    gc_before = gc.get_stats()[0]["collections"]
+    started = time.perf_counter()
+    await asyncio.gather(*(virtual_user(i) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    gc_collections = gc.get_stats()[0]["collections"] - gc_before
+
+    total = len(latencies)
+    print(f"апдейтов: {total} за {elapsed:.2f} с ({total / elapsed:.0f} апдейтов/с)")
+    print(f"сценарии: {dict(per_scenario)}, конкурентность: {args.concurrency}")
+    print(
+        f"задержка хендлера: p50={percentile(latencies, 50):.2f} мс "
+        f"p99={percentile(latencies, 99):.2f} мс"
+    )
+    print(
+        f"БД: новых соединений {pool.connects}, checkout {pool.checkouts} "
+        f"({pool.checkouts / total:.2f} на апдейт), пик одновременно {pool.peak_in_use}"
+    )
+    print(f"gc gen0 на 1000 апдейтов: {gc_collections * 1000 / total:.1f}")
+    print(f"вызовы Bot API: {dict(session.calls)}")
+
+    # Отдельный последовательный прогон под tracemalloc: он искажает тайминги
+    tracemalloc.start()
+    peaks: list[int] = []
+    user_id = USER_ID_BASE + args.concurrency
+    for step in range(args.alloc_samples):
+        for payload in _script(scenarios[step % len(scenarios)], user_id, step):
+            update = Update.model_validate(payload, context={"bot": bot})
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            await dp.feed_update(bot, update)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+    print(
+        f"аллокации на апдейт (пик tracemalloc): "
+        f"p50={percentile(peaks, 50) / 1024:.1f} КиБ "
+        f"p99={percentile(peaks, 99) / 1024:.1f} КиБ"
+    )
+
+    await db_manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=3000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Через запятую: start,add,list"
+    )
+    parser.add_argument("--alloc-samples", type=int, default=200)
+    parser.add_argument(
+        "--keep-logs",
+        action="store_true",
+        help="Не глушить логи (их цена — часть пути)",
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.scenarios.split(",")) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"неизвестные сценарии: {', '.join(sorted(unknown))}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_environment(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
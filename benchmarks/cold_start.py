@@ -0,0 +1,156 @@
+"""
+Проверка холодного старта бота против бюджета.
+
+Каждый прогон — отдельный процесс, который запускает src.__main__.main()
+с FakeSession и останавливается на первом getUpdates (бот готов принимать
+апдейты). Время меряется снаружи, от запуска интерпретатора, и изнутри —
+по фазам StartupTimer: imports, bot, db, ready, first_poll.
+
+    python -m benchmarks.cold_start --runs 5 --budget 3
+
+Если медиана превышает бюджет (по умолчанию STARTUP_BUDGET_SECONDS),
+процесс завершается с кодом 1 — проверку можно ставить в CI.
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import asyncio
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from benchmarks.common import create_schema, setup_environment
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PREFIX = "COLD_START "
+
+
+def _child() -> None:
+    """Тело дочернего процесса: обычный старт бота до первого опроса."""
+    # Таймер — первым, до aiogram и прочих тяжелых модулей
+    from src.core.startup import startup_timer
+    from src.__main__ import main
+
+    from benchmarks.fake_telegram import FakeSession
+
+    def on_poll() -> None:
+        if "first_poll" in startup_timer.phases:
+            return
+        startup_timer.mark("first_poll")
+        report = {name: seconds for name, seconds in startup_timer.phases.items()}
+        print(REPORT_PREFIX + json.dumps(report), flush=True)
+        # Штатная остановка polling'а, как по Ctrl+C
+        signal.raise_signal(signal.SIGINT)
+
+    asyncio.run(main(session=FakeSession(on_poll=on_poll)))
+
+
+def _run_once(workdir: str, verbose: bool) -> tuple[float, dict[str, float]]:
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.cold_start", "--child"],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=None if verbose else subprocess.DEVNULL,
+        text=True,
+    )
+    assert process.stdout is not None
+    phases: dict[str, float] | None = None
+    wall = 0.0
+    for line in process.stdout:
+        if line.startswith(REPORT_PREFIX):
+            wall = time.perf_counter() - started
+            phases = json.loads(line[len(REPORT_PREFIX) :])
+    if process.wait(timeout=60) != 0 or phases is None:
+        raise RuntimeError(f"дочерний процесс завершился с кодом {process.returncode}")
+    return wall, phases
+
+
+def _slowest_imports(workdir: str, top: int) -> list[tuple[int, str]]:
+    """Самые дорогие прямые импорты src.__main__ по -X importtime."""
+    env = {**os.environ, "PYTHONPATH": REPO_ROOT}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.__main__"],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Вложенность показана отступом по два пробела; берем то,
+        # что src.__main__ импортирует напрямую
+        depth = (len(name) - len(name.lstrip())) // 2
+        if cumulative.strip().isdigit() and depth == 1:
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=None,
+        help="Секунды до первого getUpdates (по умолчанию STARTUP_BUDGET_SECONDS)",
+    )
+    parser.add_argument("--top-imports", type=int, default=10)
+    parser.add_argument("--verbose", action="store_true", help="Показывать логи бота")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child()
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_environment(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        from src.core.config import settings
+        from src.infrastructure.database.manager import db_manager
+
+        async def prepare() -> None:
+            await create_schema(db_manager.engine)
+            await db_manager.close()
+
+        asyncio.run(prepare())
+        budget = settings.STARTUP_BUDGET_SECONDS if args.budget is None else args.budget
+
+        walls: list[float] = []
+        phase_runs: list[dict[str, float]] = []
+        for run in range(1, args.runs + 1):
+            wall, phases = _run_once(tmp, args.verbose)
+            walls.append(wall)
+            phase_runs.append(phases)
+            detail = ", ".join(f"{k}={v * 1000:.0f}" for k, v in phases.items())
+            print(f"прогон {run}: {wall:.2f} с ({detail} мс)")
+
+        median = statistics.median(walls)
+        print(f"медиана до первого getUpdates: {median:.2f} с, бюджет {budget:.2f} с")
+        for name in phase_runs[0]:
+            values = [phases[name] * 1000 for phases in phase_runs]
+            print(f"  {name}: медиана {statistics.median(values):.0f} мс")
+
+        if args.top_imports:
+            print("самые дорогие импорты:")
+            for cumulative, name in _slowest_imports(tmp, args.top_imports):
+                print(f"  {cumulative / 1000:8.1f} мс  {name}")
+
+    if median > budget:
+        print(f"РЕГРЕССИЯ: старт {median:.2f} с > {budget:.2f} с")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import os
+import sys
+import math
+import time
+import asyncio
+from typing import Sequence
+
+
+# Токен проходит валидацию aiogram, но в сеть с ним никто не ходит
+FAKE_TOKEN = "123456789:AAFakeTokenForOfflineBenchmarks000000"
+
+
+def setup_environment(db_url: str) -> None:
+    """Подготавливает переменные окружения до импорта модулей src.
+
+    Настройки читаются один раз при импорте src.core.config, поэтому
+    функцию нужно вызывать до любых импортов из пакета src.
+
+    Args:
+        db_url: Строка подключения к временной БД бенчмарка.
+    """
+    os.environ["BOT_TOKEN"] = FAKE_TOKEN
+    os.environ["DB_URL"] = db_url
+    os.environ["DB_ECHO"] = "false"
+
+
+def quiet_logs(level: str = "WARNING") -> None:
+    """Оставляет в логах только предупреждения, чтобы не искажать замеры."""
+    from loguru import logger
+
+    logger.remove()
+    logger.add(sys.stderr, level=level)
+
+
+async def create_schema(engine) -> None:
+    """Создаёт таблицы во временной БД без прогона миграций."""
+    from src.infrastructure.database.models import BaseModel
+
+    async with engine.begin() as conn:
+        await conn.run_sync(BaseModel.metadata.create_all)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Перцентиль методом ближайшего ранга (q в диапазоне 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def rss_bytes() -> int:
+    """Текущий RSS процесса в байтах (на Linux — из /proc, иначе пиковый)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # На macOS ru_maxrss в байтах, на Linux — в килобайтах
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class LoopLagSampler:
+    """
+    Замер задержки планирования event loop'а.
+    Фоновая задача спит фиксированный интервал и записывает, насколько
+    позже запланированного она проснулась.
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.samples_ms: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - started - self.interval
+            self.samples_ms.append(max(0.0, lag) * 1000)
@@ -0,0 +1,151 @@
+import asyncio
+import itertools
+from html.parser import HTMLParser
+from typing import Any, Callable
+from datetime import datetime, timezone
+from collections import Counter
+from collections.abc import AsyncGenerator
+
+from aiogram import Bot
+from aiogram.enums import ChatType
+from aiogram.methods import GetUpdates, TelegramMethod
+from aiogram.client.session.base import BaseSession
+from aiogram.types import Chat, Message, User
+
+
+# Теги, которые Bot API принимает в parse_mode=HTML
+_TELEGRAM_TAGS = frozenset(
+    {
+        "b", "strong", "i", "em", "u", "ins", "s", "strike", "del", "span",
+        "tg-spoiler", "a", "code", "pre", "blockquote", "tg-emoji",
+    }
+)  # fmt: skip
+
+
+class _EntityChecker(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.stack: list[str] = []
+        self.error: str | None = None
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag not in _TELEGRAM_TAGS:
+            self.error = self.error or f'Unsupported start tag "{tag}"'
+        self.stack.append(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self.stack or self.stack[-1] != tag:
+            self.error = self.error or f'Unmatched end tag "{tag}"'
+            return
+        self.stack.pop()
+
+
+def html_entities_error(text: str) -> str | None:
+    """
+    Ошибка разбора текста так, как ее вернул бы Bot API для parse_mode=HTML
+    (\"can't parse entities\"); None — текст примется. Проверяются только
+    теги: неизвестные, непарные и незакрытые.
+    """
+    checker = _EntityChecker()
+    checker.feed(text)
+    checker.close()
+    if checker.error is None and checker.stack:
+        checker.error = (
+            f'Can\'t find end tag corresponding to start tag "{checker.stack[-1]}"'
+        )
+    return checker.error
+
+
+class FakeSession(BaseSession):
+    """
+    Сессия aiogram, которая не ходит в сеть.
+    Запоминает вызванные методы и возвращает правдоподобные ответы,
+    чтобы хендлеры отрабатывали так же, как с настоящим Bot API.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        on_poll: Callable[[], None] | None = None,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+        # Вызывается на каждый getUpdates (long polling): так видно, что бот готов
+        self.on_poll = on_poll
+        self.calls: Counter[str] = Counter()
+        self._message_ids = itertools.count(1)
+
+    async def close(self) -> None:
+        pass
+
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[Any],
+        timeout: int | None = None,
+    ) -> Any:
+        self.calls[type(method).__name__] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if isinstance(method, GetUpdates):
+            if self.on_poll is not None:
+                self.on_poll()
+            # Пустой long polling: без паузы цикл опроса занял бы весь loop
+            await asyncio.sleep(max(self.latency, 0.05))
+            return []
+
+        returning = method.__returning__
+        if returning is Message:
+            chat_id = getattr(method, "chat_id", 0)
+            return Message(
+                message_id=next(self._message_ids),
+                date=datetime.now(timezone.utc),
+                chat=Chat(id=chat_id, type=ChatType.PRIVATE),
+                text=getattr(method, "text", None),
+            )
+        if returning is User:
+            return User(id=bot.id, is_bot=True, first_name="FakeBot")
+        return True
+
+    async def stream_content(
+        self,
+        url: str,
+        headers: dict[str, Any] | None = None,
+        timeout: int = 30,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True,
+    ) -> AsyncGenerator[bytes, None]:
+        yield b""
+
+
+_update_ids = itertools.count(1)
+
+
+def message_update(user_id: int, text: str) -> dict[str, Any]:
+    """Собирает JSON-апдейт с текстовым сообщением от пользователя.
+
+    Args:
+        user_id: Telegram ID отправителя (совпадает с ID приватного чата).
+        text: Текст сообщения.
+
+    Returns:
+        Словарь в формате Bot API, пригодный для Update.model_validate.
+    """
+    update_id = next(_update_ids)
+    payload: dict[str, Any] = {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(datetime.now(timezone.utc).timestamp()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "Bench"},
+            "text": text,
+        },
+    }
+    if text.startswith("/"):
+        command = text.split(maxsplit=1)[0]
+        payload["message"]["entities"] = [
+            {"type": "bot_command", "offset": 0, "length": len(command)}
+        ]
+    return payload
@@ -0,0 +1,221 @@
+"""
+Бенчмарк движка мониторинга на синтетических целях.
+
+Поднимает ферму фейковых эндпоинтов (см. target_farm), засевает N мониторов
+во временную SQLite и прогоняет несколько циклов monitoring_task со
+стаб-ботом. Работает полностью офлайн:
+
+    python -m benchmarks.monitoring_engine --monitors 5000 --cycles 3
+
+Выводит checks/s, время цикла, p99 задержки event loop'а, RSS на монитор,
+количество отправленных в Telegram сообщений и загрузку стадий конвейера. С --max-cycle-seconds
+завершится с кодом 1, если цикл медленнее порога (для CI). Код 1 и тогда,
+когда стаб-бот встретил алерт с разметкой, которую Bot API отверг бы
+(проверка шаблонов: --contains "<title>").
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from collections import Counter
+
+from benchmarks.common import (
+    LoopLagSampler,
+    create_schema,
+    percentile,
+    quiet_logs,
+    rss_bytes,
+    setup_environment,
+)
+from benchmarks.fake_telegram import html_entities_error
+from benchmarks.target_farm import FarmConfig, Farm, make_self_signed_cert, start_farm
+
+
+class StubBot:
+    """
+    Подмена aiogram.Bot: считает сообщения вместо отправки.
+    Разметку проверяет как Bot API (бот работает с parse_mode=HTML):
+    сообщение, которое Telegram отверг бы, не считается отправленным.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay  # Имитация медленного Telegram API (flood control)
+        self.sent = 0
+        self.rejected: Counter[str] = Counter()
+        self.by_user: Counter[int] = Counter()
+
+    async def send_message(self, chat_id: int, text: str, **kwargs) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        error = html_entities_error(text)
+        if error is not None:
+            self.rejected[error] += 1
+            return
+        self.sent += 1
+        self.by_user[chat_id] += 1
+
+
+async def _seed(farm: Farm, monitors: int, per_user: int, contains: str | None) -> None:
+    from src.infrastructure.database.manager import db_manager
+    from src.infrastructure.database.models import MonitorModel
+
+    await create_schema(db_manager.engine)
+    async with db_manager.session_maker() as session:
+        session.add_all(
+            MonitorModel(
+                user_id=1_000_000 + i // per_user,
+                url=farm.url(i),
+                check_interval=300,
+                is_active=True,
+                content_rules=(
+                    [{"kind": "contains", "pattern": contains}] if contains else None
+                ),
+            )
+            for i in range(monitors)
+        )
+        await session.commit()
+
+
+async def _run(args: argparse.Namespace, farm: Farm) -> int:
+    from src.infrastructure.database.manager import db_manager
+    from src.infrastructure.scheduler.tasks import monitoring_task
+    from src.infrastructure.scheduler.pipeline import monitoring_pipeline
+    from src.infrastructure.scheduler.adaptive import check_schedule
+    from src.infrastructure.network.shared import shared_client
+
+    quiet_logs("ERROR")
+    await _seed(farm, args.monitors, args.per_user, args.contains)
+
+    bot = StubBot(delay=args.send_delay)
+    sampler = LoopLagSampler()
+    baseline_rss = rss_bytes()
+    cycle_times: list[float] = []
+
+    sampler.start()
+    try:
+        for cycle in range(1, args.cycles + 1):
+            # Каждый цикл — полный прогон: сбрасываем сроки следующих проверок
+            check_schedule.retain(())
+            started = time.perf_counter()
+            await monitoring_task(bot)
+            elapsed = time.perf_counter() - started
+            cycle_times.append(elapsed)
+            print(
+                f"цикл {cycle}: {elapsed:.2f} с, "
+                f"{args.monitors / elapsed:.0f} проверок/с, отправлено {bot.sent}"
+            )
+        redirects = shared_client.get().redirects.stats()
+        conditional = shared_client.get().validators.stats()
+    finally:
+        await sampler.stop()
+        await shared_client.close()
+        await db_manager.close()
+
+    rss_delta = max(0, rss_bytes() - baseline_rss)
+    best = min(cycle_times)
+    print("---")
+    print(f"мониторов: {args.monitors}, циклов: {args.cycles}")
+    print(f"проверок/с (лучший цикл): {args.monitors / best:.0f}")
+    print(f"время цикла: min={best:.2f} с, max={max(cycle_times):.2f} с")
+    print(
+        f"задержка loop: p50={percentile(sampler.samples_ms, 50):.1f} мс "
+        f"p99={percentile(sampler.samples_ms, 99):.1f} мс"
+    )
+    print(f"RSS на монитор: {rss_delta / args.monitors:.0f} байт")
+    print(
+        f"сообщений в Telegram: {bot.sent} "
+        f"({bot.sent / args.cycles:.0f} за цикл, пользователей: {len(bot.by_user)})"
+    )
+    for error, count in bot.rejected.most_common():
+        print(f"  отклонено Telegram ({error}): {count}")
+
+    print(
+        f"редиректы: адресов в кэше {redirects.cached}, "
+        f"пропущено запросов {redirects.hops_skipped}"
+    )
+    print(
+        f"условные запросы: {conditional.conditional}, "
+        f"ответов 304: {conditional.not_modified}, "
+        f"не скачано {conditional.bytes_saved / 2**20:.1f} МБ"
+    )
+    # Счетчики стадий накопительные за все циклы: видно, какая стадия узкое место
+    for stage in monitoring_pipeline.stats():
+        print(
+            f"стадия {stage.name} ×{stage.workers}: обработано {stage.processed}, "
+            f"занятость {stage.utilization:.0f}%, отброшено {stage.shed}, "
+            f"ошибок {stage.failed}"
+        )
+
+    if bot.rejected:
+        print("ОШИБКА: Telegram не принял бы часть алертов (разметка HTML)")
+        return 1
+    if args.max_cycle_seconds and best > args.max_cycle_seconds:
+        print(f"РЕГРЕССИЯ: цикл {best:.2f} с > {args.max_cycle_seconds} с")
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--monitors", type=int, default=2000)
+    parser.add_argument("--per-user", type=int, default=5)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--ports", type=int, default=8)
+    parser.add_argument("--latency", default="lognormal:40:0.6")
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--hang-rate", type=float, default=0.005)
+    parser.add_argument("--tls-rate", type=float, default=0.0)
+    parser.add_argument("--redirect-rate", type=float, default=0.0)
+    parser.add_argument("--redirect-hops", type=int, default=2)
+    parser.add_argument("--body-size", type=int, default=2048)
+    parser.add_argument("--etag", action="store_true", help="ETag и 304 на ферме")
+    parser.add_argument(
+        "--contains", default=None, help="правило содержимого для всех мониторов"
+    )
+    parser.add_argument("--timeout", type=int, default=3, help="REQUEST_TIMEOUT, с")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--send-delay", type=float, default=0.0, help="задержка отправки алерта, с"
+    )
+    parser.add_argument("--max-cycle-seconds", type=float, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = FarmConfig(
+            endpoints=args.monitors,
+            ports=args.ports,
+            latency=args.latency,
+            error_rate=args.error_rate,
+            hang_rate=args.hang_rate,
+            tls_rate=args.tls_rate,
+            redirect_rate=args.redirect_rate,
+            redirect_hops=args.redirect_hops,
+            etag=args.etag,
+            body_size=args.body_size,
+            seed=args.seed,
+        )
+        if args.tls_rate > 0:
+            cert = make_self_signed_cert(tmp)
+            if cert is None:
+                print("openssl не найден, TLS-эндпоинты отключены")
+                config.tls_rate = 0.0
+            else:
+                config.cert_file, config.key_file = cert
+
+        setup_environment(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        os.environ["REQUEST_TIMEOUT"] = str(args.timeout)
+
+        farm = start_farm(config)
+        try:
+            code = asyncio.run(_run(args, farm))
+        finally:
+            farm.stop()
+
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Бенчмарк памяти и скорости кольцевых буферов истории проверок.
+
+Сравнивает колоночный ResultRing со списком объектов CheckResult:
+байты на сохраненный результат (по tracemalloc), скорость добавления
+и расчета статистики окна.
+
+    python -m benchmarks.ring_buffer --monitors 2000 --capacity 512
+"""
+
+import time
+import random
+import argparse
+import tracemalloc
+from collections import deque
+
+from benchmarks.common import setup_environment
+
+
+def _results(count: int, seed: int = 1) -> list:
+    from src.infrastructure.network.client import CheckResult, ErrorCategory
+
+    rng = random.Random(seed)
+    pool = []
+    for i in range(count):
+        up = rng.random() > 0.05
+        pool.append(
+            CheckResult(
+                url=f"https://site-{i}.example.com",
+                is_up=up,
+                status_code=200 if up else 503,
+                response_time_ms=rng.randint(20, 900),
+                error=None if up else "Status 503",
+                error_category=ErrorCategory.NONE if up else ErrorCategory.HTTP_STATUS,
+            )
+        )
+    return pool
+
+
+def _measure_ring(monitors: int, capacity: int, pool: list) -> tuple[float, float]:
+    from src.infrastructure.scheduler.history import ResultHistory
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    history = ResultHistory(capacity=capacity, memory_limit_bytes=1 << 40)
+    started = time.perf_counter()
+    ts = 1_700_000_000
+    for step in range(capacity):
+        for monitor_id in range(monitors):
+            history.record(monitor_id, pool[monitor_id % len(pool)], ts=ts + step)
+    elapsed = time.perf_counter() - started
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    stored = monitors * capacity
+    print(
+        f"ResultRing:  {used / stored:6.1f} байт/результат, "
+        f"добавление {elapsed / stored * 1e9:.0f} нс"
+    )
+
+    ring = history.get(0)
+    started = time.perf_counter()
+    for _ in range(1000):
+        ring.stats(last=100)
+    last100 = (time.perf_counter() - started) / 1000
+    started = time.perf_counter()
+    for _ in range(1000):
+        ring.stats(since_ts=ts + capacity - 60)
+    last_hour = (time.perf_counter() - started) / 1000
+    print(
+        f"             stats(last=100) {last100 * 1e6:.1f} мкс, "
+        f"stats(since=...) {last_hour * 1e6:.1f} мкс"
+    )
+    return used / stored, elapsed / stored
+
+
+def _measure_objects(monitors: int, capacity: int) -> float:
+    from dataclasses import replace
+    from datetime import datetime, timezone
+
+    pool = _results(64)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    buffers = [deque(maxlen=capacity) for _ in range(monitors)]
+    for step in range(capacity):
+        checked_at = datetime.fromtimestamp(1_700_000_000 + step, timezone.utc)
+        for monitor_id, buffer in enumerate(buffers):
+            # Копия на каждую проверку, как это было бы при хранении объектов
+            buffer.append((checked_at, replace(pool[monitor_id % len(pool)])))
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    stored = monitors * capacity
+    print(f"CheckResult: {used / stored:6.1f} байт/результат (deque объектов)")
+    return used / stored
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--monitors", type=int, default=1000)
+    parser.add_argument("--capacity", type=int, default=512)
+    parser.add_argument(
+        "--skip-objects", action="store_true", help="Не мерить вариант с объектами"
+    )
+    args = parser.parse_args()
+
+    setup_environment("sqlite+aiosqlite:///:memory:")
+    from src.infrastructure.scheduler.history import BYTES_PER_RESULT
+
+    print(f"мониторов: {args.monitors}, емкость буфера: {args.capacity}")
+    print(f"теоретически: {BYTES_PER_RESULT} байт/результат")
+    ring_bytes, _ = _measure_ring(args.monitors, args.capacity, _results(64))
+    if not args.skip_objects:
+        object_bytes = _measure_objects(args.monitors, args.capacity)
+        print(f"экономия: в {object_bytes / ring_bytes:.0f} раз")
+
+
+if __name__ == "__main__":
+    main()
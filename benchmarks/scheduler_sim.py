@@ -0,0 +1,510 @@
+"""
+Детерминированная симуляция планировщика проверок на виртуальных часах.
+
+Реальные CheckSchedule и AdaptiveIntervalPolicy прогоняются по виртуальному
+времени: тики APScheduler (interval-задача с max_instances=1, поэтому тик,
+пришедшийся на незавершенный цикл, пропускается), сетевой клиент заменен
+скриптовой моделью задержек и сбоев. Двое суток работы 100k мониторов
+считаются за несколько минут (около 3.5 мин), а не за двое суток:
+
+    python -m benchmarks.scheduler_sim --monitors 100000 --days 2 --restart-at 30
+
+Отчет по фазам (холодный старт, стабильная работа, догон после рестарта):
+опоздание проверок относительно срока (перцентили), дрейф фактического
+интервала от заданного по мониторам, проверок за цикл, пиковая
+конкурентность, длительность циклов и пропущенные тики. После рестарта —
+разрыв между последней проверкой до него и первой после; он обязан
+укладываться в интервал + простой + окно догона (RESTART_CATCHUP_TICKS
+тиков), иначе симуляция падает. Одинаковый --seed дает одинаковый отчет.
+"""
+
+import math
+import time
+import random
+import argparse
+from dataclasses import dataclass, field
+from collections import Counter
+
+from benchmarks.common import percentile, setup_environment
+
+
+# Смесь интервалов: (доля, фиксированный интервал | (мин, макс) для адаптивного)
+INTERVAL_MIX: tuple[tuple[float, int | tuple[int, int]], ...] = (
+    (0.15, 60),
+    (0.05, 90),
+    (0.45, 300),
+    (0.10, 600),
+    (0.05, 3600),
+    (0.20, (60, 3600)),
+)
+
+
+@dataclass(slots=True)
+class SimMonitor:
+    """Монитор в симуляции: ровно те поля, что читает CheckSchedule."""
+
+    id: int
+    check_interval: int
+    min_interval: int | None = None
+    max_interval: int | None = None
+
+
+class VirtualClock:
+    """Виртуальное время в секундах; движется только явно."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+
+    def advance_to(self, moment: float) -> None:
+        self.now = max(self.now, moment)
+
+
+class ScriptedNetwork:
+    """
+    Скриптовая замена NetworkClient: задержка и исход проверки
+    определяются seed'ом, а не сетью.
+
+    - У каждого монитора своя базовая задержка (логнормальная).
+    - Доля «нестабильных» мониторов падает с вероятностью flaky_fail.
+    - Заранее расписанные аварии: монитор недоступен в окне [start, end),
+      половина аварий — таймауты (занимают соединение на timeout секунд).
+    - Редкие всплески задержки (x5), на которые реагирует адаптивная политика.
+    """
+
+    def __init__(
+        self,
+        monitors: int,
+        span: float,
+        rng: random.Random,
+        timeout: float,
+        flaky_share: float = 0.02,
+        flaky_fail: float = 0.2,
+        outages_per_day: float = 0.01,
+        spike_rate: float = 0.005,
+    ) -> None:
+        from src.infrastructure.network.client import CheckResult, ErrorCategory
+
+        self._result_cls = CheckResult
+        self._category = ErrorCategory
+        self.rng = rng
+        self.timeout = timeout
+        self.spike_rate = spike_rate
+        self.flaky_fail = flaky_fail
+        self.base_ms = [
+            min(timeout * 1000, rng.lognormvariate(math.log(150), 0.6))
+            for _ in range(monitors)
+        ]
+        # Разброс задержки от проверки к проверке: таблица вместо
+        # lognormvariate на каждый вызов — в разы быстрее, распределение то же
+        self._jitter = [rng.lognormvariate(0, 0.25) for _ in range(4096)]
+        # Результаты неизменяемы для расписания, поэтому переиспользуются
+        self._up_results: dict[int, CheckResult] = {}
+        self._failures = {
+            category: CheckResult(url="", is_up=False, error_category=category)
+            for category in ErrorCategory
+        }
+        self.flaky = {i for i in range(monitors) if rng.random() < flaky_share}
+        self.outages: dict[int, list[tuple[float, float, bool]]] = {}
+        for _ in range(round(monitors * outages_per_day * span / 86400)):
+            monitor_id = rng.randrange(monitors)
+            start = rng.uniform(0, span)
+            end = start + rng.uniform(5 * 60, 2 * 60 * 60)
+            self.outages.setdefault(monitor_id, []).append(
+                (start, end, rng.random() < 0.5)
+            )
+
+    def check(self, monitor_id: int, now: float):
+        """Возвращает (CheckResult, длительность проверки в секундах)."""
+        outages = self.outages.get(monitor_id)
+        if outages is not None:
+            for start, end, is_timeout in outages:
+                if start <= now < end:
+                    if is_timeout:
+                        return self._failures[self._category.TIMEOUT], self.timeout
+                    return self._failures[self._category.CONNECTION], 0.005
+
+        rng = self.rng
+        if monitor_id in self.flaky and rng.random() < self.flaky_fail:
+            return self._failures[self._category.HTTP_STATUS], 0.05
+
+        latency_ms = self.base_ms[monitor_id] * self._jitter[rng.getrandbits(12)]
+        if rng.random() < self.spike_rate:
+            latency_ms *= 5
+        latency = int(min(latency_ms, self.timeout * 1000))
+        result = self._up_results.get(latency)
+        if result is None:
+            result = self._up_results[latency] = self._result_cls(
+                url="", is_up=True, status_code=200, response_time_ms=latency
+            )
+        return result, latency / 1000
+
+
+@dataclass(slots=True)
+class PhaseMetrics:
+    """Метрики одной фазы; гистограммы вместо списков — миллионы проверок."""
+
+    name: str
+    checks: int = 0
+    cycles: int = 0
+    skipped_ticks: int = 0
+    peak_inflight: int = 0
+    lateness: Counter[int] = field(default_factory=Counter)  # секунды -> число
+    # |факт - задано| для отдельных интервалов, секунды -> число
+    jitter: Counter[int] = field(default_factory=Counter)
+    cycle_seconds: list[float] = field(default_factory=list)
+    cycle_checks: list[int] = field(default_factory=list)
+
+
+def _hist_percentile(hist: Counter[int], q: float) -> int:
+    total = sum(hist.values())
+    if not total:
+        return 0
+    rank = max(1, math.ceil(q / 100 * total))
+    seen = 0
+    for value in sorted(hist):
+        seen += hist[value]
+        if seen >= rank:
+            return value
+    return max(hist)
+
+
+class SchedulerSimulation:
+    """
+    Цикл monitoring_task на виртуальных часах.
+
+    Вместо просмотра всех мониторов на каждом тике (как делает is_due в
+    реальном цикле) мониторы разложены по корзинам тиков, в которых они
+    станут «due» с тем же допуском в полтика — результат тот же, а работа
+    пропорциональна числу проверок. С verify каждый выбранный монитор
+    дополнительно сверяется с настоящим CheckSchedule.is_due.
+
+    Длительность цикла: проверки идут параллельно, но не больше connections
+    одновременно (лимит TCPConnector aiohttp по умолчанию — 100), плюс
+    cpu_ms последовательной обработки на проверку.
+    """
+
+    def __init__(
+        self,
+        monitors: list[SimMonitor],
+        network: ScriptedNetwork,
+        clock: VirtualClock,
+        tick: int,
+        connections: int,
+        cpu_ms: float,
+        catchup_window: float,
+        verify: bool = False,
+    ) -> None:
+        self.monitors = monitors
+        self.network = network
+        self.clock = clock
+        self.tick = tick
+        self.connections = connections
+        self.cpu_ms = cpu_ms
+        self.catchup_window = catchup_window
+        self.verify = verify
+        self.schedule = self._new_schedule()
+        self._buckets: dict[int, list[SimMonitor]] = {}
+        self._origin = clock.now
+        self._started_at = clock.now
+        self._last_check: list[float | None] = [None] * len(monitors)
+        # Мониторы, еще не проверенные после рестарта, и допустимый разрыв
+        self._after_restart = bytearray(len(monitors))
+        self._gap_allowance = 0.0
+        self.restart_gap_excess = 0.0  # Худший разрыв сверх интервала, с
+        self._expected: list[float] = [0.0] * len(monitors)
+        self._drift_sum: list[float] = [0.0] * len(monitors)
+        self._expected_sum: list[float] = [0.0] * len(monitors)
+        self.phases: dict[str, PhaseMetrics] = {}
+        self._start_label = "холодный старт"
+        self._fill_buckets()
+
+    def _new_schedule(self):
+        from src.core.config import settings
+        from src.infrastructure.scheduler.adaptive import (
+            AdaptiveIntervalPolicy,
+            CheckSchedule,
+        )
+
+        return CheckSchedule(
+            policy=AdaptiveIntervalPolicy(
+                stable_checks=settings.ADAPTIVE_STABLE_CHECKS,
+                growth=settings.ADAPTIVE_GROWTH,
+                latency_spike=settings.ADAPTIVE_LATENCY_SPIKE,
+            ),
+            tick=self.tick,
+            catchup_ticks=settings.RESTART_CATCHUP_TICKS,
+        )
+
+    def _tick_index(self, due: float) -> int:
+        # Первый тик k, на котором next_due <= tick_k + tick / 2
+        return max(0, math.ceil((due - self.tick / 2 - self._origin) / self.tick))
+
+    def _fill_buckets(self) -> None:
+        self._buckets.clear()
+        for monitor in self.monitors:
+            state = self.schedule.get(monitor.id)
+            due = state.next_due if state is not None else self.clock.now
+            self._buckets.setdefault(self._tick_index(due), []).append(monitor)
+
+    def _phase(self) -> PhaseMetrics:
+        if self.clock.now - self._started_at < self.catchup_window:
+            name = self._start_label
+        else:
+            name = "стабильная работа"
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseMetrics(name)
+        return phase
+
+    def run_until(self, end: float) -> None:
+        index = self._tick_index(self.clock.now)
+        busy_until = self.clock.now
+        while True:
+            tick_at = self._origin + index * self.tick
+            if tick_at >= end:
+                break
+            self.clock.advance_to(tick_at)
+            if tick_at < busy_until:
+                # max_instances=1: APScheduler пропускает запуск
+                self._phase().skipped_ticks += 1
+                index += 1
+                continue
+
+            due = []
+            for key in [k for k in self._buckets if k <= index]:
+                due.extend(self._buckets.pop(key))
+            busy_until = tick_at + self._run_cycle(due, tick_at)
+            index += 1
+        self.clock.advance_to(end)
+
+    def _run_cycle(self, due: list[SimMonitor], now: float) -> float:
+        phase = self._phase()
+        phase.cycles += 1
+        phase.checks += len(due)
+        phase.cycle_checks.append(len(due))
+        phase.peak_inflight = max(phase.peak_inflight, min(len(due), self.connections))
+
+        # Горячий цикл: миллионы итераций, поэтому все — в локальных переменных
+        schedule, check = self.schedule, self.network.check
+        lateness, jitter = phase.lateness, phase.jitter
+        last_check, expected_interval = self._last_check, self._expected
+        drift_sum, expected_sum = self._drift_sum, self._expected_sum
+        buckets, verify = self._buckets, self.verify
+        after_restart = self._after_restart
+        origin, tick, half_tick = self._origin, self.tick, self.tick / 2
+
+        longest = total = 0.0
+        for monitor in due:
+            monitor_id = monitor.id
+            if verify and not schedule.is_due(monitor, now):
+                raise AssertionError(f"монитор {monitor_id} выбран раньше срока")
+            result, seconds = check(monitor_id, now)
+            if seconds > longest:
+                longest = seconds
+            total += seconds
+
+            state = schedule.get(monitor_id)
+            if state is not None:
+                late = now - state.next_due
+                lateness[int(late) if late > 0 else 0] += 1
+            last = last_check[monitor_id]
+            if after_restart[monitor_id]:
+                # Первая проверка после рестарта: разрыв включает простой,
+                # поэтому в дрейф не идет, а сверяется с окном догона
+                after_restart[monitor_id] = 0
+                self._check_restart_gap(monitor_id, now - last)
+            elif last is not None:
+                expected = expected_interval[monitor_id]
+                delta = (now - last) - expected
+                drift_sum[monitor_id] += delta
+                expected_sum[monitor_id] += expected
+                jitter[int(abs(delta))] += 1
+
+            expected_interval[monitor_id] = schedule.record(monitor, result, now)
+            last_check[monitor_id] = now
+            # Корзина по настоящему next_due из расписания
+            next_due = schedule.get(monitor_id).next_due
+            index = math.ceil((next_due - half_tick - origin) / tick)
+            bucket = buckets.get(index)
+            if bucket is None:
+                buckets[index] = [monitor]
+            else:
+                bucket.append(monitor)
+
+        # Жадная раскладка по соединениям: не быстрее самой долгой проверки
+        # и не быстрее суммарной работы, деленной на число соединений
+        duration = (
+            max(longest, total / self.connections) + len(due) * self.cpu_ms / 1000
+        )
+        phase.cycle_seconds.append(duration)
+        return duration
+
+    def restart(self, downtime: float, snapshot: bool) -> None:
+        """
+        Рестарт процесса: состояние уходит в снимок (как save_snapshot при
+        штатной остановке), через downtime секунд поднимается из него
+        (load_snapshot) или, без снимка, с нуля.
+        """
+        data = self.schedule.dump()
+        self.clock.advance_to(self.clock.now + downtime)
+        self.schedule = self._new_schedule()
+        if snapshot:
+            self.schedule.restore(data, now=self.clock.now)
+        # Тики APScheduler отсчитываются от нового старта
+        self._origin = self._started_at = self.clock.now
+        self._start_label = "догон после рестарта"
+        # Время последних проверок сохраняется: разрыв через рестарт должен
+        # быть виден. Допуск — интервал + простой + окно догона + тик
+        # (проверка назначается на ближайший тик после срока)
+        self._gap_allowance = (
+            downtime + self.schedule.catchup_ticks * self.tick + self.tick
+        )
+        self._after_restart = bytearray(last is not None for last in self._last_check)
+        self._fill_buckets()
+
+    def _check_restart_gap(self, monitor_id: int, gap: float) -> None:
+        excess = gap - self._expected[monitor_id]
+        self.restart_gap_excess = max(self.restart_gap_excess, excess)
+        if excess > self._gap_allowance:
+            raise AssertionError(
+                f"монитор {monitor_id}: разрыв через рестарт {gap:.0f} с, "
+                f"интервал {self._expected[monitor_id]:.0f} с, "
+                f"допуск сверх интервала {self._gap_allowance:.0f} с"
+            )
+
+    def drift_percentiles(self) -> tuple[float, float, float]:
+        """Средний дрейф интервала по мониторам, % от заданного: p50, p99, max."""
+        drifts = [
+            100 * abs(drift) / expected
+            for drift, expected in zip(self._drift_sum, self._expected_sum)
+            if expected
+        ]
+        if not drifts:
+            return 0.0, 0.0, 0.0
+        return percentile(drifts, 50), percentile(drifts, 99), max(drifts)
+
+
+def build_monitors(count: int, rng: random.Random) -> list[SimMonitor]:
+    weights = [share for share, _ in INTERVAL_MIX]
+    kinds = [kind for _, kind in INTERVAL_MIX]
+    monitors = []
+    for monitor_id, kind in enumerate(rng.choices(kinds, weights, k=count)):
+        if isinstance(kind, tuple):
+            low, high = kind
+            monitors.append(SimMonitor(monitor_id, low, low, high))
+        else:
+            monitors.append(SimMonitor(monitor_id, kind))
+    return monitors
+
+
+def print_report(sim: SchedulerSimulation) -> None:
+    for phase in sim.phases.values():
+        lateness = [_hist_percentile(phase.lateness, q) for q in (50, 90, 99)]
+        print(f"[{phase.name}]")
+        print(
+            f"  проверок: {phase.checks}, циклов: {phase.cycles}, "
+            f"пропущено тиков: {phase.skipped_ticks}"
+        )
+        print(
+            f"  опоздание, с: p50 {lateness[0]}, p90 {lateness[1]}, "
+            f"p99 {lateness[2]}, max {max(phase.lateness, default=0)}"
+        )
+        jitter = [_hist_percentile(phase.jitter, q) for q in (50, 99)]
+        print(
+            f"  отклонение интервала от заданного, с: p50 {jitter[0]}, "
+            f"p99 {jitter[1]}, max {max(phase.jitter, default=0)}"
+        )
+        print(
+            f"  проверок за цикл: p50 {percentile(phase.cycle_checks, 50):.0f}, "
+            f"max {max(phase.cycle_checks, default=0)}; "
+            f"пиковая конкурентность: {phase.peak_inflight}"
+        )
+        print(
+            f"  длительность цикла, с: p50 {percentile(phase.cycle_seconds, 50):.2f}, "
+            f"p99 {percentile(phase.cycle_seconds, 99):.2f}, "
+            f"max {max(phase.cycle_seconds, default=0):.2f}"
+        )
+    if sim.restart_gap_excess:
+        print(
+            f"разрыв через рестарт сверх интервала: max {sim.restart_gap_excess:.0f} с "
+            f"(допуск: простой + окно догона + тик = {sim._gap_allowance:.0f} с)"
+        )
+    p50, p99, worst = sim.drift_percentiles()
+    print(
+        f"дрейф интервала по мониторам (|факт - задано| / задано): "
+        f"p50 {p50:.1f}%, p99 {p99:.1f}%, max {worst:.1f}%"
+    )
+    stats = sim.schedule.stats()
+    print(
+        f"сэкономлено адаптивными интервалами (после последнего старта): "
+        f"{stats.saved} ({stats.saved_percent:.1f}%)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--monitors", type=int, default=100_000)
+    parser.add_argument("--days", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--tick", type=int, default=None, help="По умолчанию SCHEDULER_TICK"
+    )
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument(
+        "--cpu-ms", type=float, default=0.1, help="Обработка одной проверки"
+    )
+    parser.add_argument(
+        "--restart-at", type=float, default=None, help="Час симуляции для рестарта"
+    )
+    parser.add_argument("--downtime", type=float, default=600, help="Простой, секунды")
+    parser.add_argument("--no-snapshot", action="store_true", help="Рестарт без снимка")
+    parser.add_argument(
+        "--verify", action="store_true", help="Сверять выбор с CheckSchedule.is_due"
+    )
+    parser.add_argument(
+        "--catchup-window",
+        type=float,
+        default=3600,
+        help="Сколько секунд после старта считать фазой догона",
+    )
+    args = parser.parse_args()
+
+    setup_environment("sqlite+aiosqlite:///:memory:")
+    from src.core.config import settings
+
+    rng = random.Random(args.seed)
+    span = args.days * 86400
+    tick = args.tick or settings.SCHEDULER_TICK
+    monitors = build_monitors(args.monitors, rng)
+    network = ScriptedNetwork(
+        args.monitors, span, rng, timeout=float(settings.REQUEST_TIMEOUT)
+    )
+    clock = VirtualClock()
+    sim = SchedulerSimulation(
+        monitors,
+        network,
+        clock,
+        tick=tick,
+        connections=args.connections,
+        cpu_ms=args.cpu_ms,
+        catchup_window=args.catchup_window,
+        verify=args.verify,
+    )
+
+    started = time.perf_counter()
+    if args.restart_at is not None:
+        sim.run_until(args.restart_at * 3600)
+        sim.restart(args.downtime, snapshot=not args.no_snapshot)
+    sim.run_until(span)
+    elapsed = time.perf_counter() - started
+
+    checks = sum(phase.checks for phase in sim.phases.values())
+    print(
+        f"{args.monitors} мониторов, {args.days:g} сут виртуального времени "
+        f"за {elapsed:.1f} с ({checks} проверок, {checks / elapsed:,.0f}/с)"
+    )
+    print_report(sim)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Ферма синтетических целей для бенчмарков мониторинга.
+
+Поднимает в отдельном процессе aiohttp-сервер (несколько портов, опционально
+с TLS), который обслуживает тысячи эндпоинтов /t/{id}. Поведение каждого
+эндпоинта детерминировано сидом: задержка из заданного распределения,
+доля ошибок 5xx, доля «зависаний», которые не отвечают вовсе, и доля
+адресов, отвечающих цепочкой редиректов (/r/{id}/{n} → ... → /t/{id}).
+С etag=True ответы несут ETag и на If-None-Match отвечают 304.
+"""
+
+import os
+import ssl
+import random
+import shutil
+import socket
+import asyncio
+import subprocess
+import multiprocessing
+from dataclasses import dataclass, field
+
+from aiohttp import web
+
+
+@dataclass(slots=True)
+class FarmConfig:
+    endpoints: int = 1000
+    ports: int = 8
+    # Распределение задержки: "fixed:50", "uniform:10:200", "lognormal:50:0.8"
+    latency: str = "lognormal:40:0.6"
+    error_rate: float = 0.02
+    hang_rate: float = 0.005
+    tls_rate: float = 0.0
+    redirect_rate: float = 0.0
+    redirect_hops: int = 2
+    etag: bool = False
+    body_size: int = 2048
+    seed: int = 42
+    cert_file: str | None = None
+    key_file: str | None = None
+
+
+@dataclass(slots=True)
+class EndpointProfile:
+    latency_ms: float
+    is_error: bool
+    hangs: bool
+    tls: bool
+    redirects: int  # Длина цепочки редиректов до эндпоинта
+
+
+@dataclass(slots=True)
+class Farm:
+    config: FarmConfig
+    http_ports: list[int] = field(default_factory=list)
+    https_ports: list[int] = field(default_factory=list)
+    process: multiprocessing.process.BaseProcess | None = None
+
+    def url(self, endpoint_id: int) -> str:
+        """Адрес эндпоинта; порт выбирается по кругу для разброса соединений."""
+        profile = endpoint_profile(self.config, endpoint_id)
+        if profile.tls and self.https_ports:
+            port = self.https_ports[endpoint_id % len(self.https_ports)]
+            return f"https://127.0.0.1:{port}/t/{endpoint_id}"
+        port = self.http_ports[endpoint_id % len(self.http_ports)]
+        if profile.redirects:
+            return f"http://127.0.0.1:{port}/r/{endpoint_id}/{profile.redirects}"
+        return f"http://127.0.0.1:{port}/t/{endpoint_id}"
+
+    def stop(self) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join(timeout=5)
+            self.process = None
+
+
+def _sample_latency(spec: str, rng: random.Random) -> float:
+    kind, *params = spec.split(":")
+    values = [float(p) for p in params]
+    if kind == "fixed":
+        return values[0]
+    if kind == "uniform":
+        return rng.uniform(values[0], values[1])
+    if kind == "lognormal":
+        # Параметры: медиана в мс и сигма логарифма
+        median, sigma = values
+        return median * rng.lognormvariate(0.0, sigma)
+    raise ValueError(f"Неизвестное распределение задержки: {spec}")
+
+
+def endpoint_profile(config: FarmConfig, endpoint_id: int) -> EndpointProfile:
+    """Детерминированный профиль эндпоинта (одинаков в ферме и в бенчмарке)."""
+    rng = random.Random(config.seed * 1_000_003 + endpoint_id)
+    return EndpointProfile(
+        latency_ms=_sample_latency(config.latency, rng),
+        is_error=rng.random() < config.error_rate,
+        hangs=rng.random() < config.hang_rate,
+        tls=rng.random() < config.tls_rate,
+        redirects=config.redirect_hops if rng.random() < config.redirect_rate else 0,
+    )
+
+
+def make_self_signed_cert(directory: str) -> tuple[str, str] | None:
+    """Генерирует самоподписанный сертификат через openssl (если он есть)."""
+    if shutil.which("openssl") is None:
+        return None
+    cert = os.path.join(directory, "farm.crt")
+    key = os.path.join(directory, "farm.key")
+    completed = subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "30", "-subj", "/CN=127.0.0.1",
+        ],
+        capture_output=True,
+    )  # fmt: skip
+    if completed.returncode != 0:
+        return None
+    return cert, key
+
+
+async def _serve(config: FarmConfig, ready: multiprocessing.Queue) -> None:
+    profiles = [endpoint_profile(config, i) for i in range(config.endpoints)]
+    body = b"<html><body>" + b"x" * config.body_size + b"</body></html>"
+    # Тело у всех эндпоинтов одинаковое и не меняется
+    headers = {"ETag": f'"farm-{config.body_size}"'} if config.etag else {}
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        try:
+            profile = profiles[int(request.match_info["id"])]
+        except (ValueError, IndexError):
+            return web.Response(status=404)
+
+        if profile.hangs:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(profile.latency_ms / 1000)
+        if profile.is_error:
+            return web.Response(status=503, text="Service Unavailable")
+        if headers and request.headers.get("If-None-Match") == headers["ETag"]:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="text/html", headers=headers)
+
+    async def redirect(request: web.Request) -> web.StreamResponse:
+        endpoint_id, left = request.match_info["id"], int(request.match_info["n"])
+        # Каждый редирект — отдельный запрос со своей задержкой
+        await asyncio.sleep(profiles[int(endpoint_id)].latency_ms / 1000)
+        if left > 1:
+            raise web.HTTPMovedPermanently(f"/r/{endpoint_id}/{left - 1}")
+        raise web.HTTPMovedPermanently(f"/t/{endpoint_id}")
+
+    app = web.Application()
+    app.router.add_get("/t/{id}", handle)
+    app.router.add_get("/r/{id}/{n}", redirect)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+
+    ssl_context = None
+    if config.cert_file and config.key_file and config.tls_rate > 0:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(config.cert_file, config.key_file)
+
+    async def listen(ssl_context: ssl.SSLContext | None) -> int:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", 0))
+        site = web.SockSite(runner, sock, ssl_context=ssl_context, backlog=4096)
+        await site.start()
+        return sock.getsockname()[1]
+
+    http_ports = [await listen(None) for _ in range(config.ports)]
+    https_ports = []
+    if ssl_context is not None:
+        https_ports = [await listen(ssl_context) for _ in range(config.ports)]
+
+    ready.put((http_ports, https_ports))
+    await asyncio.Event().wait()
+
+
+def _run(config: FarmConfig, ready: multiprocessing.Queue) -> None:
+    asyncio.run(_serve(config, ready))
+
+
+def start_farm(config: FarmConfig) -> Farm:
+    """Запускает ферму в дочернем процессе и ждёт, пока она начнёт слушать порты."""
+    ctx = multiprocessing.get_context("spawn")
+    ready = ctx.Queue()
+    process = ctx.Process(target=_run, args=(config, ready), daemon=True)
+    process.start()
+    http_ports, https_ports = ready.get(timeout=30)
+    return Farm(
+        config=config, http_ports=http_ports, https_ports=https_ports, process=process
+    )
@@ -0,0 +1,137 @@
+"""
+Фейковый отправитель Telegram для webhook-режима.
+
+Шлёт синтетические апдейты POST-запросами так же, как это делает Telegram,
+и замеряет скорость подтверждения (ack) и обработки.
+
+Без --url поднимает webhook-приложение прямо в процессе: настоящий
+диспетчер со всеми middleware, временная SQLite и бот с FakeSession.
+Запуск полностью офлайн:
+
+    python -m benchmarks.webhook_sender --updates 5000 --concurrency 200
+"""
+
+import os
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from collections import Counter
+
+import aiohttp
+
+from benchmarks.common import percentile, quiet_logs, setup_environment, create_schema
+from benchmarks.fake_telegram import FakeSession, message_update
+
+
+SECRET = "bench-secret-token"
+
+
+async def _send_all(
+    url: str, secret: str | None, total: int, concurrency: int, users: int
+) -> tuple[Counter[int], list[float], float]:
+    statuses: Counter[int] = Counter()
+    latencies: list[float] = []
+    headers = {"X-Telegram-Bot-Api-Secret-Token": secret} if secret else {}
+    queue: asyncio.Queue[dict] = asyncio.Queue()
+    for _ in range(total):
+        queue.put_nowait(message_update(random.randint(1, users), "/start"))
+
+    async def sender(session: aiohttp.ClientSession) -> None:
+        while not queue.empty():
+            payload = queue.get_nowait()
+            started = time.perf_counter()
+            async with session.post(url, json=payload, headers=headers) as response:
+                await response.read()
+                statuses[response.status] += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(sender(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return statuses, latencies, elapsed
+
+
+async def _run_local(args: argparse.Namespace) -> None:
+    from aiohttp import web
+
+    from src.core.config import settings
+    from src.bot.factory import create_bot, create_dispatcher
+    from src.bot.webhook import create_webhook_app
+    from src.infrastructure.database.manager import db_manager
+
+    quiet_logs()
+    await create_schema(db_manager.engine)
+
+    session = FakeSession(latency=args.api_latency / 1000)
+    bot = create_bot(session=session)
+    app, handler = create_webhook_app(bot, create_dispatcher(), secret_token=SECRET)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host="127.0.0.1", port=0)
+    await site.start()
+    port = runner.addresses[0][1]
+    url = f"http://127.0.0.1:{port}{settings.WEBHOOK_PATH}"
+
+    try:
+        statuses, latencies, ack_elapsed = await _send_all(
+            url, SECRET, args.updates, args.concurrency, args.users
+        )
+        started = time.perf_counter()
+        await handler.join()
+        drain_elapsed = ack_elapsed + (time.perf_counter() - started)
+    finally:
+        await runner.cleanup()
+        await db_manager.close()
+
+    _report(statuses, latencies, ack_elapsed)
+    print(f"обработано: {handler.processed} (ошибок: {handler.failed})")
+    print(f"обработка: {handler.processed / drain_elapsed:.0f} апдейтов/с")
+    print(f"вызовы Bot API: {dict(session.calls)}")
+
+
+def _report(statuses: Counter[int], latencies: list[float], elapsed: float) -> None:
+    total = sum(statuses.values())
+    print(f"отправлено: {total} за {elapsed:.2f} с ({total / elapsed:.0f} ack/с)")
+    print(f"коды ответов: {dict(statuses)}")
+    print(
+        f"ack p50={percentile(latencies, 50):.2f} мс "
+        f"p99={percentile(latencies, 99):.2f} мс"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", help="Адрес запущенного webhook (иначе локальный)")
+    parser.add_argument("--secret", default=None, help="Секрет для внешнего --url")
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument(
+        "--api-latency", type=float, default=0.0, help="Задержка Bot API, мс"
+    )
+    args = parser.parse_args()
+
+    if args.url:
+        statuses, latencies, elapsed = asyncio.run(
+            _send_all(args.url, args.secret, args.updates, args.concurrency, args.users)
+        )
+        _report(statuses, latencies, elapsed)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        setup_environment(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}")
+        os.environ["WEBHOOK_WORKERS"] = str(args.workers)
+        os.environ["WEBHOOK_QUEUE_SIZE"] = str(args.queue_size)
+        asyncio.run(_run_local(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Check results redirect time
+
+Revision ID: 29b4b0ade03d
+Revises: e3a91f6c2b47
+Create Date: 2026-10-19 22:41:17.604215
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "29b4b0ade03d"
+down_revision: Union[str, Sequence[str], None] = "e3a91f6c2b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "check_results",
+        sa.Column("redirect_time_ms", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("check_results") as batch_op:
+        batch_op.drop_column("redirect_time_ms")
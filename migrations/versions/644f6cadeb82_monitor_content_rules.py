@@ -0,0 +1,30 @@
+"""Monitor content rules
+
+Revision ID: 644f6cadeb82
+Revises: 271d96c9bb21
+Create Date: 2026-10-19 18:00:23.838669
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "644f6cadeb82"
+down_revision: Union[str, Sequence[str], None] = "271d96c9bb21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("monitors", sa.Column("content_rules", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("monitors") as batch_op:
+        batch_op.drop_column("content_rules")
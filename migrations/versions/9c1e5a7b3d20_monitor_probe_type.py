@@ -0,0 +1,35 @@
+"""Monitor probe type
+
+Revision ID: 9c1e5a7b3d20
+Revises: 644f6cadeb82
+Create Date: 2026-10-19 19:12:41.518307
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c1e5a7b3d20"
+down_revision: Union[str, Sequence[str], None] = "644f6cadeb82"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "monitors",
+        sa.Column(
+            "probe_type", sa.String(length=16), server_default="http", nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("monitors") as batch_op:
+        batch_op.drop_column("probe_type")
@@ -0,0 +1,32 @@
+"""Monitor interval bounds
+
+Revision ID: c47d2e8f1a93
+Revises: 9c1e5a7b3d20
+Create Date: 2026-10-19 19:48:05.271934
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c47d2e8f1a93"
+down_revision: Union[str, Sequence[str], None] = "9c1e5a7b3d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("monitors", sa.Column("min_interval", sa.Integer(), nullable=True))
+    op.add_column("monitors", sa.Column("max_interval", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("monitors") as batch_op:
+        batch_op.drop_column("max_interval")
+        batch_op.drop_column("min_interval")
@@ -0,0 +1,77 @@
+"""Check results and incidents
+
+Revision ID: e3a91f6c2b47
+Revises: c47d2e8f1a93
+Create Date: 2026-10-19 21:12:40.518392
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3a91f6c2b47"
+down_revision: Union[str, Sequence[str], None] = "c47d2e8f1a93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "check_results",
+        sa.Column(
+            "id",
+            sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column("monitor_id", sa.Integer(), nullable=False),
+        sa.Column("checked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("is_up", sa.Boolean(), nullable=False),
+        sa.Column("status_code", sa.SmallInteger(), nullable=True),
+        sa.Column("response_time_ms", sa.Integer(), nullable=False),
+        sa.Column("error_category", sa.SmallInteger(), nullable=False),
+        sa.Column("error", sa.String(length=512), nullable=True),
+        sa.ForeignKeyConstraint(["monitor_id"], ["monitors.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_check_results_monitor_time",
+        "check_results",
+        ["monitor_id", "checked_at"],
+        unique=False,
+    )
+    op.create_table(
+        "incidents",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("monitor_id", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ended_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("cause", sa.SmallInteger(), nullable=False),
+        sa.Column("first_error", sa.String(length=512), nullable=True),
+        sa.Column("failed_checks", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["monitor_id"], ["monitors.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_incidents_monitor_started",
+        "incidents",
+        ["monitor_id", "started_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_incidents_ended_at"), "incidents", ["ended_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_incidents_ended_at"), table_name="incidents")
+    op.drop_index("ix_incidents_monitor_started", table_name="incidents")
+    op.drop_table("incidents")
+    op.drop_index("ix_check_results_monitor_time", table_name="check_results")
+    op.drop_table("check_results")
@@ -1,62 +1,105 @@
+# Таймер импортируется первым: от него отсчитывается время старта
+from src.core.startup import startup_timer
+
 import asyncio
+from datetime import datetime
 from loguru import logger
 
-from aiogram import Bot, Dispatcher
-from aiogram.enums import ParseMode
-from aiogram.client.default import DefaultBotProperties
-
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from aiogram.client.session.base import BaseSession
 
 from src.core.config import settings
 from src.core.logger import configure_logger
-from src.bot.middlewares import DbSessionMiddleware, LoggingMiddleware
+from src.core.diagnostics import diagnostics
+from src.bot.factory import create_bot, create_dispatcher
 from src.infrastructure.database.manager import db_manager
-from src.infrastructure.scheduler.tasks import monitoring_task
+from src.infrastructure.network.shared import shared_client
+from src.infrastructure.scheduler.pipeline import monitoring_pipeline
+from src.infrastructure.scheduler.snapshot import load_snapshot, save_snapshot
+from src.infrastructure.scheduler.incidents import purge_check_results
+from src.infrastructure.scheduler.status_board import status_board
 
-from src.bot.handlers import (
-    user_router,
-    monitor_router,
-)
 
+async def main(session: BaseSession | None = None):
+    startup_timer.mark("imports")
 
-async def main():
     # 1. Настройка логгера
     configure_logger()
     logger.info("Запуск приложения...")
 
     # 2. Инициализация бота
-    bot = Bot(
-        token=settings.BOT_TOKEN.get_secret_value(),
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+    bot = create_bot(session=session)
 
-    # 3. Инициализация диспетчера
-    dp = Dispatcher()
+    # 3. Инициализация диспетчера, middleware и роутеров
+    dp = create_dispatcher()
+    startup_timer.mark("bot")
 
-    # 4. Подключение Middleware
-    # Передаем фабрику сессий в мидлварь
-    dp.update.outer_middleware(LoggingMiddleware())
-    dp.update.middleware(DbSessionMiddleware(session_factory=db_manager.session_maker))
+    # Ленивый импорт: APScheduler нужен только к моменту запуска задач
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-    # 5. Регистрация роутеров
-    dp.include_routers(
-        user_router,
-        monitor_router,
+    scheduler = AsyncIOScheduler()
+    # Тик планировщика раздает проверки, срок которых наступил, в конвейер;
+    # каждый монитор проверяется по своему интервалу.
+    # Первый тик — сразу, чтобы после рестарта не было минутной паузы
+    scheduler.add_job(
+        monitoring_pipeline.dispatch,
+        "interval",
+        seconds=settings.SCHEDULER_TICK,
+        next_run_time=datetime.now(),
+    )
+    # Периодический снимок состояния на случай аварийного завершения
+    scheduler.add_job(
+        save_snapshot, "interval", seconds=settings.STATE_CHECKPOINT_INTERVAL
     )
+    # Раз в сутки чистим сырую историю проверок
+    scheduler.add_job(purge_check_results, "interval", days=1)
 
-    scheduler = AsyncIOScheduler()
-    # Добавляем задачу (раз в 60 секунд)
-    scheduler.add_job(monitoring_task, "interval", seconds=60, args=[bot])
-    scheduler.start()
-    # 6. Запуск polling
+    @dp.startup()
+    async def on_startup() -> None:
+        startup_timer.mark("ready")
+        startup_timer.report(settings.STARTUP_BUDGET_SECONDS)
+
+    # 4. Запуск приема обновлений
+    status_runner = None
     try:
-        # Удаляем вебхук и дропаем накопившиеся апдейты (чтобы бот не отвечал на старое)
-        await bot.delete_webhook(drop_pending_updates=True)
+        if settings.DIAGNOSTICS_ENABLED:
+            diagnostics.start()
+
         await db_manager.health_check()
-        logger.info("Бот начал прослушивание событий")
-        await dp.start_polling(bot)
+        # Теплый рестарт: сроки проверок и статусы из прошлого запуска
+        load_snapshot()
+        startup_timer.mark("db")
+        monitoring_pipeline.start(bot)
+        scheduler.start()
+
+        if status_board.enabled:
+            # Ленивый импорт: сервер страниц статуса нужен, только если задан секрет
+            from src.api import start_status_api
+
+            status_runner = await start_status_api()
+
+        if settings.BOT_MODE == "webhook":
+            # Ленивый импорт: aiohttp-сервер нужен только в режиме webhook
+            from src.bot.webhook import run_webhook
+
+            await run_webhook(bot, dp)
+        else:
+            # Удаляем вебхук и дропаем накопившиеся апдейты (чтобы бот не отвечал на старое)
+            await bot.delete_webhook(drop_pending_updates=True)
+            logger.info("Бот начал прослушивание событий")
+            await dp.start_polling(bot)
     finally:
         logger.info("Остановка приложения...")
+        started = scheduler.running
+        if started:
+            scheduler.shutdown(wait=False)
+        # Дообрабатываем уже снятые результаты до снимка и закрытия БД
+        await monitoring_pipeline.stop()
+        if started:
+            await save_snapshot()
+        if status_runner is not None:
+            await status_runner.cleanup()
+        await diagnostics.stop()
+        await shared_client.close()
         # Закрываем соединение с БД при выходе
         await db_manager.close()
         await bot.session.close()
@@ -0,0 +1,8 @@
+from .status import StatusPages, create_status_app, start_status_api
+
+
+__all__ = [
+    "StatusPages",
+    "create_status_app",
+    "start_status_api",
+]
@@ -0,0 +1,214 @@
+import json
+import hashlib
+from html import escape
+from datetime import datetime, timezone
+
+from loguru import logger
+from aiohttp import web
+from aiohttp.helpers import ETag
+
+from src.core.config import settings
+from src.infrastructure.scheduler.status_board import (
+    MonitorStatus,
+    StatusBoard,
+    UserView,
+    status_board,
+)
+
+
+_CONTENT_TYPES = {"json": "application/json", "html": "text/html"}
+
+_PAGE = """<!doctype html>
+<html lang="ru">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta http-equiv="refresh" content="60">
+<title>Статус</title>
+<style>
+body {{ font-family: sans-serif; max-width: 720px; margin: 2em auto; padding: 0 1em; }}
+td {{ padding: .4em .8em .4em 0; vertical-align: top; }}
+.up {{ color: #1a7f37; }} .down {{ color: #cf222e; }} .unknown {{ color: #6e7781; }}
+small {{ color: #6e7781; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<table>
+{rows}
+</table>
+</body>
+</html>
+"""
+
+_ROW = (
+    '<tr><td class="{state}">{icon}</td>'
+    "<td><code>{url}</code><br><small>{detail}</small></td></tr>"
+)
+
+_ICONS = {"up": "● работает", "down": "● недоступен", "unknown": "○ нет данных"}
+
+
+def _state(monitor: MonitorStatus) -> str:
+    if monitor.is_up is None:
+        return "unknown"
+    return "up" if monitor.is_up else "down"
+
+
+def _iso(moment: float | None) -> str | None:
+    if moment is None:
+        return None
+    return datetime.fromtimestamp(moment, timezone.utc).isoformat(timespec="seconds")
+
+
+def render_json(view: UserView) -> bytes:
+    monitors = [
+        {
+            "url": monitor.url,
+            "type": monitor.probe_type,
+            "status": _state(monitor),
+            "since": _iso(monitor.since),
+            "status_code": monitor.status_code,
+            "error": monitor.error,
+        }
+        for monitor in view.monitors
+    ]
+    return json.dumps(
+        {"monitors": monitors}, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def render_html(view: UserView) -> bytes:
+    rows = []
+    for monitor in view.monitors:
+        state = _state(monitor)
+        details = []
+        if monitor.since is not None:
+            details.append(
+                "с "
+                + datetime.fromtimestamp(monitor.since, timezone.utc).strftime(
+                    "%Y-%m-%d %H:%M UTC"
+                )
+            )
+        if monitor.error:
+            details.append(monitor.error)
+        rows.append(
+            _ROW.format(
+                state=state,
+                icon=_ICONS[state],
+                url=escape(monitor.url),
+                detail=escape(" · ".join(details)),
+            )
+        )
+    down = sum(1 for monitor in view.monitors if monitor.is_up is False)
+    title = "Все системы работают" if not down else f"Недоступно: {down}"
+    return _PAGE.format(title=title, rows="\n".join(rows)).encode()
+
+
+_RENDERERS = {"json": render_json, "html": render_html}
+
+
+class StatusPages:
+    """
+    Read-only API страниц статуса поверх StatusBoard.
+
+    Ответ рендерится один раз на версию среза пользователя и кэшируется
+    в StatusBoard вместе с ETag (хэш тела — он не зависит от перезапусков):
+    кэш сбрасывается при смене версии и удаляется вместе с последним
+    монитором пользователя. Повторный запрос с If-None-Match получает 304
+    без тела. База данных не используется.
+    """
+
+    def __init__(self, board: StatusBoard) -> None:
+        self.board = board
+
+        # Счетчики для логов и бенчмарков
+        self.served = 0
+        self.not_modified = 0
+        self.renders = 0
+
+    def register(self, app: web.Application) -> None:
+        # Маршрут .json регистрируется первым: иначе его поймает {token}
+        app.router.add_get("/status/{token}.json", self.handle_json)
+        app.router.add_get("/status/{token}", self.handle_html)
+
+    async def handle_json(self, request: web.Request) -> web.Response:
+        return self._respond(request, "json")
+
+    async def handle_html(self, request: web.Request) -> web.Response:
+        return self._respond(request, "html")
+
+    def _respond(self, request: web.Request, fmt: str) -> web.Response:
+        view = self.board.view(request.match_info["token"])
+        if view is None:
+            raise web.HTTPNotFound()
+
+        etag, body = self._render(view, fmt)
+        headers = {
+            # Кэшировать можно, но перед показом — сверка по ETag
+            "Cache-Control": "private, no-cache",
+            # Ссылка с токеном не должна попадать в поисковики
+            "X-Robots-Tag": "noindex",
+        }
+        if request.if_none_match and any(
+            tag.value in (etag, "*") for tag in request.if_none_match
+        ):
+            self.not_modified += 1
+            response = web.Response(status=304, headers=headers)
+        else:
+            self.served += 1
+            response = web.Response(
+                body=body,
+                content_type=_CONTENT_TYPES[fmt],
+                charset="utf-8",
+                headers=headers,
+            )
+        response.etag = ETag(value=etag)
+        return response
+
+    def _render(self, view: UserView, fmt: str) -> tuple[str, bytes]:
+        cached = self.board.rendered(view, fmt)
+        if cached is not None:
+            return cached
+
+        self.renders += 1
+        body = _RENDERERS[fmt](view)
+        etag = hashlib.blake2b(body, digest_size=12).hexdigest()
+        self.board.store_rendered(view, fmt, etag, body)
+        return etag, body
+
+
+def create_status_app(
+    board: StatusBoard = status_board,
+) -> tuple[web.Application, StatusPages]:
+    """Создаёт aiohttp-приложение страниц статуса.
+
+    Args:
+        board: Снимок статусов, который обновляет движок мониторинга.
+
+    Returns:
+        Приложение и обработчик (для доступа к счетчикам).
+    """
+    app = web.Application()
+    pages = StatusPages(board)
+    pages.register(app)
+    return app, pages
+
+
+async def start_status_api() -> web.AppRunner:
+    """
+    Поднимает HTTP-сервер страниц статуса. Останавливается через runner.cleanup().
+    """
+    app, _ = create_status_app()
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(
+        runner, host=settings.STATUS_API_HOST, port=settings.STATUS_API_PORT
+    )
+    await site.start()
+    logger.info(
+        "API страниц статуса запущено",
+        host=settings.STATUS_API_HOST,
+        port=settings.STATUS_API_PORT,
+    )
+    return runner
@@ -0,0 +1,64 @@
+from aiogram import Bot, Dispatcher
+from aiogram.enums import ParseMode
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.base import BaseSession
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+
+from src.core.config import settings
+from src.bot.middlewares import DbSessionMiddleware, LoggingMiddleware
+from src.infrastructure.database.manager import db_manager
+
+from src.bot.handlers import (
+    admin_router,
+    user_router,
+    monitor_router,
+    stats_router,
+)
+
+
+def create_bot(session: BaseSession | None = None) -> Bot:
+    """Создаёт экземпляр бота с настройками по умолчанию.
+
+    Args:
+        session: HTTP-сессия aiogram. Если не передана, используется
+            стандартная aiohttp-сессия (в бенчмарках подменяется фейковой).
+
+    Returns:
+        Настроенный объект Bot.
+    """
+    return Bot(
+        token=settings.BOT_TOKEN.get_secret_value(),
+        session=session,
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
+
+
+def create_dispatcher(
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> Dispatcher:
+    """Собирает диспетчер: middleware и роутеры.
+
+    Один и тот же стек используется и в polling, и в webhook режиме.
+
+    Args:
+        session_factory: Фабрика сессий БД. По умолчанию берётся из db_manager.
+
+    Returns:
+        Готовый к работе Dispatcher.
+    """
+    dp = Dispatcher()
+
+    # Передаем фабрику сессий в мидлварь
+    dp.update.outer_middleware(LoggingMiddleware())
+    dp.update.middleware(
+        DbSessionMiddleware(session_factory=session_factory or db_manager.session_maker)
+    )
+
+    dp.include_routers(
+        admin_router,
+        user_router,
+        monitor_router,
+        stats_router,
+    )
+    return dp
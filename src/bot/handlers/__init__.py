@@ -1,8 +1,12 @@
+from .admin import admin_router
 from .user import user_router
 from .monitor import monitor_router
+from .stats import stats_router
 
 
 __all__ = [
+    "admin_router",
     "user_router",
     "monitor_router",
+    "stats_router",
 ]
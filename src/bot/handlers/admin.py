@@ -0,0 +1,143 @@
+from datetime import datetime
+
+from aiogram import Bot, Router, F
+from aiogram.types import Message, BufferedInputFile
+from aiogram.filters import Command, CommandObject
+
+from src.bot.lexicon import Texts
+from src.bot.handlers.stats import send_export
+from src.core.config import settings
+from src.core.diagnostics import ProfilerBusyError, capture_profile, diagnostics
+from src.infrastructure.network.shared import shared_client
+from src.infrastructure.scheduler.tasks import monitoring_task
+from src.infrastructure.scheduler.adaptive import check_schedule
+from src.infrastructure.scheduler.pipeline import monitoring_pipeline
+from src.infrastructure.database.repos import MonitorRepository
+
+
+admin_router = Router()
+# Все хендлеры роутера доступны только администраторам из ADMIN_IDS
+admin_router.message.filter(F.from_user.id.in_(settings.ADMIN_IDS))
+
+
+@admin_router.message(Command("diag"))
+async def cmd_diag(message: Message, command: CommandObject) -> None:
+    """
+    Включение/выключение диагностики event loop'а и вывод статистики.
+    Использование: /diag [on|off]
+    """
+    arg = (command.args or "").strip().lower()
+    if arg == "on":
+        diagnostics.start()
+    elif arg == "off":
+        await diagnostics.stop()
+
+    stats = diagnostics.stats()
+    await message.answer(
+        text=Texts.Admin.DIAG_STATUS.format(
+            "включена" if diagnostics.enabled else "выключена",
+            stats["samples"],
+            stats["p50"],
+            stats["p99"],
+            stats["max"],
+            diagnostics.stalls,
+            diagnostics.max_stall * 1000,
+        )
+    )
+
+
+@admin_router.message(Command("profile"))
+async def cmd_profile(message: Message, command: CommandObject, bot: Bot) -> None:
+    """
+    Снимает профиль цикла проверок и отправляет отчет файлом.
+    Использование: /profile [секунды]
+    """
+    try:
+        seconds = int(command.args) if command.args else 30
+    except ValueError:
+        await message.answer(text=Texts.Admin.PROFILE_USAGE)
+        return
+    seconds = max(1, min(seconds, settings.PROFILE_MAX_SECONDS))
+
+    await message.answer(text=Texts.Admin.PROFILE_STARTED.format(seconds))
+    try:
+        report = await capture_profile(lambda: monitoring_task(bot), seconds)
+    except ProfilerBusyError:
+        await message.answer(text=Texts.Admin.PROFILE_BUSY)
+        return
+
+    await message.answer_document(
+        document=BufferedInputFile(
+            report.encode(),
+            filename=f"profile-{datetime.now():%Y%m%d-%H%M%S}.txt",
+        ),
+        caption=Texts.Admin.PROFILE_DONE,
+    )
+
+
+@admin_router.message(Command("schedule"))
+async def cmd_schedule(message: Message) -> None:
+    """
+    Статистика расписания: сколько проверок сэкономили адаптивные интервалы
+    и сколько запросов и трафика — кэш редиректов и условные запросы.
+    """
+    stats = check_schedule.stats()
+    client = shared_client.get()
+    redirects = client.redirects.stats()
+    conditional = client.validators.stats()
+    await message.answer(
+        text=Texts.Admin.SCHEDULE_STATUS.format(
+            stats.monitors,
+            stats.performed,
+            stats.saved,
+            stats.saved_percent,
+            redirects.cached,
+            redirects.hits,
+            redirects.hops_skipped,
+            redirects.revalidations,
+            conditional.conditional,
+            conditional.not_modified,
+            conditional.bytes_saved / 2**20,
+        )
+    )
+
+
+@admin_router.message(Command("pipeline"))
+async def cmd_pipeline(message: Message) -> None:
+    """
+    Состояние конвейера мониторинга: глубина очередей и пропускная способность стадий.
+    """
+    lines = [
+        Texts.Admin.PIPELINE_STAGE.format(
+            stage.name,
+            stage.workers,
+            stage.depth,
+            stage.capacity,
+            stage.processed,
+            stage.rate,
+            stage.utilization,
+            stage.shed,
+            stage.failed,
+        )
+        for stage in monitoring_pipeline.stats()
+    ]
+    await message.answer(
+        text=Texts.Admin.PIPELINE_STATUS.format(
+            "работает" if monitoring_pipeline.running else "остановлен",
+            "\n".join(lines),
+        )
+    )
+
+
+@admin_router.message(Command("export_all"))
+async def cmd_export_all(
+    message: Message, command: CommandObject, repo: MonitorRepository
+) -> None:
+    """
+    Выгрузка истории проверок всех мониторов (для анализа).
+    Использование: /export_all [дни] [csv|parquet]
+    """
+    urls = await repo.get_urls()
+    # Закрываем транзакцию чтения: выгрузка может идти минутами
+    await repo.session.commit()
+    await send_export(message, command.args, urls, monitor_ids=None)
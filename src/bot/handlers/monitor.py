@@ -1,17 +1,31 @@
-from urllib.parse import urlparse
+from html import escape
+from urllib.parse import urlsplit
 
 from loguru import logger
 
 from aiogram import Router, F
-from aiogram.types import Message
-from aiogram.filters import StateFilter
+from aiogram.types import CallbackQuery, Message
+from aiogram.filters import Command, CommandObject, StateFilter
 from aiogram.fsm.context import FSMContext
 
 from sqlalchemy.exc import IntegrityError
 
 from src.bot.states import MonitorAdd
 from src.bot.lexicon import Texts, Buttons
+from src.bot.markups.inline import CheckNowCallback, check_now_kb
+from src.core.config import settings
+from src.infrastructure.database.models import MonitorModel
 from src.infrastructure.database.repos import MonitorRepository
+from src.infrastructure.network.client import CheckResult, ProbeType
+from src.infrastructure.network.assertions import (
+    ContentRule,
+    RuleKind,
+    parse_rules,
+    validate_rule,
+)
+from src.infrastructure.scheduler.history import results_history
+from src.infrastructure.scheduler.adaptive import check_schedule
+from src.infrastructure.scheduler.check_now import RateLimitedError, check_now
 
 
 monitor_router = Router()
@@ -27,6 +41,38 @@ async def start_add_monitor(message: Message, state: FSMContext) -> None:
     await state.set_state(MonitorAdd.waiting_for_url)
 
 
+def _parse_target(raw: str) -> tuple[ProbeType, str] | None:
+    """
+    Определяет тип проверки по схеме адреса.
+    http(s):// или адрес без схемы — HTTP; tcp://host:port, dns://host,
+    tls://host[:port] — проверки без HTTP. Возвращает (тип, адрес) или None.
+    """
+    # Автоматическое добавление схемы, если отсутствует
+    target = raw if "://" in raw else f"https://{raw}"
+
+    # Строгая валидация структуры адреса
+    try:
+        parsed = urlsplit(target)
+        port = parsed.port
+    except ValueError:
+        return None
+
+    host = parsed.hostname
+    if not host or ("." not in host and ":" not in host):
+        return None
+
+    scheme = parsed.scheme.lower()
+    if scheme in {"http", "https"}:
+        return ProbeType.HTTP, target
+    if scheme == "tcp" and port:
+        return ProbeType.TCP, f"tcp://{parsed.netloc}"
+    if scheme == "dns" and port is None:
+        return ProbeType.DNS, f"dns://{host}"
+    if scheme == "tls":
+        return ProbeType.TLS, f"tls://{parsed.netloc}"
+    return None
+
+
 @monitor_router.message(StateFilter(MonitorAdd.waiting_for_url))
 async def process_url(
     message: Message, state: FSMContext, repo: MonitorRepository
@@ -46,35 +92,24 @@ async def process_url(
         await message.answer(text=Texts.MySites.INVALID_URL)
         return
 
-    # Автоматическое добавление схемы, если отсутствует
-    target_url = (
-        raw_url if raw_url.startswith(("http://", "https://")) else f"https://{raw_url}"
-    )
-
-    # Строгая валидация структуры URL
-    try:
-        parsed = urlparse(target_url)
-    except ValueError:
-        await message.answer(text=Texts.MySites.INVALID_URL)
-        return
-
-    if (
-        parsed.scheme not in {"http", "https"}
-        or not parsed.netloc
-        or "." not in parsed.netloc
-    ):
+    parsed_target = _parse_target(raw_url)
+    if parsed_target is None:
         await message.answer(text=Texts.MySites.INVALID_URL)
         return
+    probe_type, target_url = parsed_target
 
     try:
         # Попытка сохранения в БД
         monitor = await repo.add_monitor(
             user_id=user.id,
             url=target_url,
-            interval=300,
+            interval=settings.DEFAULT_CHECK_INTERVAL,
+            probe_type=probe_type,
         )
 
-        await message.answer(text=Texts.MySites.MONITOR_ADDED.format(monitor.url))
+        await message.answer(
+            text=Texts.MySites.MONITOR_ADDED.format(monitor.url, monitor.check_interval)
+        )
         await state.clear()
 
     except IntegrityError:
@@ -87,3 +122,227 @@ async def process_url(
         logger.exception("Ошбика при добавлении сайта в монитор: url={}", target_url)
         await message.answer(text=Texts.MySites.UNEXPECTED_ERROR)
         await state.clear()
+
+
+@monitor_router.message(F.text == Buttons.START["menu_my_sites"])
+async def show_my_sites(message: Message, repo: MonitorRepository) -> None:
+    """
+    Вывод списка мониторов пользователя.
+    """
+    user = message.from_user
+    if user is None:
+        return
+
+    monitors = await repo.get_user_monitors(user_id=user.id)
+    if not monitors:
+        await message.answer(text=Texts.MySites.EMPTY_LIST)
+        return
+
+    lines = [
+        Texts.MySites.LIST_ITEM.format(
+            index, _status_icon(monitor), escape(monitor.url)
+        )
+        for index, monitor in enumerate(monitors, start=1)
+    ]
+    await message.answer(
+        text=Texts.MySites.LIST_HEADER + "\n".join(lines),
+        reply_markup=check_now_kb(monitors),
+    )
+
+
+@monitor_router.message(Command("check"))
+async def cmd_check(
+    message: Message, command: CommandObject, repo: MonitorRepository
+) -> None:
+    """
+    Внеплановая проверка сайта по номеру в списке.
+    Формат: /check N
+    """
+    user = message.from_user
+    arg = (command.args or "").strip()
+    if user is None or not arg.isdigit():
+        await message.answer(text=Texts.MySites.CHECK_USAGE)
+        return
+
+    monitor = await repo.get_user_monitor(user_id=user.id, position=int(arg))
+    if monitor is None:
+        await message.answer(text=Texts.MySites.NOT_FOUND.format(arg))
+        return
+
+    await message.answer(text=await _check_now_text(monitor, user.id))
+
+
+@monitor_router.callback_query(CheckNowCallback.filter())
+async def on_check_now(
+    callback: CallbackQuery, callback_data: CheckNowCallback, repo: MonitorRepository
+) -> None:
+    """
+    Кнопка «проверить сейчас» под списком сайтов.
+    """
+    monitor = await repo.get_monitor_by_id(callback_data.monitor_id)
+    if monitor is None or monitor.user_id != callback.from_user.id:
+        await callback.answer(Texts.MySites.CHECK_GONE, show_alert=True)
+        return
+
+    # Ответ на callback сразу, чтобы у кнопки не крутились «часики»
+    await callback.answer(Texts.MySites.CHECK_STARTED)
+    text = await _check_now_text(monitor, callback.from_user.id)
+    if callback.message is not None:
+        await callback.message.answer(text=text)
+
+
+async def _check_now_text(monitor: MonitorModel, user_id: int) -> str:
+    try:
+        result, age = await check_now.check(monitor, user_id)
+    except RateLimitedError as e:
+        return Texts.MySites.CHECK_RATE_LIMITED.format(max(1, round(e.retry_after)))
+    return _format_check(monitor.url, result, age)
+
+
+def _format_check(url: str, result: CheckResult, age: float) -> str:
+    if result.is_up:
+        text = Texts.MySites.CHECK_UP.format(
+            escape(url), result.status_code or "—", result.response_time_ms
+        )
+        if result.redirects:
+            text += Texts.MySites.CHECK_REDIRECTS.format(
+                result.redirects, result.response_time_ms + result.redirect_time_ms
+            )
+    else:
+        text = Texts.MySites.CHECK_DOWN.format(
+            escape(url), escape(result.error or f"Status {result.status_code}")
+        )
+    if age >= 1:
+        text += Texts.MySites.CHECK_CACHED.format(round(age))
+    return text
+
+
+@monitor_router.message(Command("expect"))
+async def cmd_expect(
+    message: Message, command: CommandObject, repo: MonitorRepository
+) -> None:
+    """
+    Управление проверками содержимого страницы.
+    Формат: /expect N [contains|absent|regex шаблон | clear]
+    """
+    user = message.from_user
+    parts = (command.args or "").split(maxsplit=2)
+    if user is None or not parts or not parts[0].isdigit():
+        await message.answer(text=Texts.MySites.EXPECT_USAGE)
+        return
+
+    monitor = await repo.get_user_monitor(user_id=user.id, position=int(parts[0]))
+    if monitor is None:
+        await message.answer(text=Texts.MySites.NOT_FOUND.format(parts[0]))
+        return
+
+    url = escape(monitor.url)
+    rules = list(parse_rules(monitor.content_rules))
+
+    if len(parts) == 1:
+        if not rules:
+            await message.answer(text=Texts.MySites.EXPECT_EMPTY.format(url))
+            return
+        lines = [
+            Texts.MySites.EXPECT_RULE_ITEM.format(rule.kind.value, escape(rule.pattern))
+            for rule in rules
+        ]
+        await message.answer(
+            text=Texts.MySites.EXPECT_RULES.format(url, "\n".join(lines))
+        )
+        return
+
+    if parts[1].lower() == "clear":
+        await repo.set_content_rules(monitor, None)
+        await message.answer(text=Texts.MySites.EXPECT_CLEARED.format(url))
+        return
+
+    if len(parts) < 3 or parts[1].lower() not in set(RuleKind):
+        await message.answer(text=Texts.MySites.EXPECT_USAGE)
+        return
+
+    rule = ContentRule(RuleKind(parts[1].lower()), parts[2])
+    error = validate_rule(rule)
+    if error:
+        await message.answer(text=Texts.MySites.EXPECT_INVALID.format(escape(error)))
+        return
+    if len(rules) >= settings.CONTENT_MAX_RULES:
+        await message.answer(
+            text=Texts.MySites.EXPECT_TOO_MANY.format(settings.CONTENT_MAX_RULES)
+        )
+        return
+
+    rules.append(rule)
+    await repo.set_content_rules(monitor, [r.to_dict() for r in rules])
+    await message.answer(text=Texts.MySites.EXPECT_ADDED.format(url))
+
+
+@monitor_router.message(Command("interval"))
+async def cmd_interval(
+    message: Message, command: CommandObject, repo: MonitorRepository
+) -> None:
+    """
+    Настройка интервала проверки.
+    Формат: /interval N [секунды | мин макс]
+    """
+    low, high = settings.SCHEDULER_TICK, settings.MAX_CHECK_INTERVAL
+    user = message.from_user
+    parts = (command.args or "").split()
+    if (
+        user is None
+        or not 1 <= len(parts) <= 3
+        or not all(part.isdigit() for part in parts)
+    ):
+        await message.answer(text=Texts.MySites.INTERVAL_USAGE.format(low, high))
+        return
+
+    monitor = await repo.get_user_monitor(user_id=user.id, position=int(parts[0]))
+    if monitor is None:
+        await message.answer(text=Texts.MySites.NOT_FOUND.format(parts[0]))
+        return
+
+    if len(parts) > 1:
+        bounds = [int(part) for part in parts[1:]]
+        in_range = all(low <= value <= high for value in bounds)
+        if not in_range or bounds[0] > bounds[-1]:
+            await message.answer(text=Texts.MySites.INTERVAL_INVALID.format(low, high))
+            return
+        # Одинаковые границы — то же самое, что фиксированный интервал
+        max_interval = bounds[-1] if bounds[-1] > bounds[0] else None
+        await repo.set_interval(monitor, bounds[0], max_interval)
+        check_schedule.reset(monitor.id)
+
+    url = escape(monitor.url)
+    if check_schedule.is_adaptive(monitor):
+        await message.answer(
+            text=Texts.MySites.INTERVAL_ADAPTIVE.format(
+                url,
+                monitor.min_interval,
+                monitor.max_interval,
+                check_schedule.current_interval(monitor),
+            )
+        )
+    else:
+        await message.answer(
+            text=Texts.MySites.INTERVAL_FIXED.format(url, monitor.check_interval)
+        )
+
+
+def _status_icon(monitor: MonitorModel) -> str:
+    """
+    Иконка текущего статуса по последней проверке из in-memory истории.
+    """
+    if not monitor.is_active:
+        return "⏸"
+
+    ring = results_history.get(monitor.id)
+    latest = ring.latest() if ring else None
+    if latest is None:
+        # Истории еще нет (например, сразу после рестарта) — статус из снимка
+        state = check_schedule.get(monitor.id)
+        if state is None or state.is_up is None:
+            return "⚪"
+        return "🟢" if state.is_up else "🔴"
+
+    _, _, _, error = latest
+    return "🟢" if not error else "🔴"
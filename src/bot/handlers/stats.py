@@ -0,0 +1,189 @@
+import os
+import tempfile
+from html import escape
+from datetime import datetime, timedelta, timezone
+from collections import defaultdict
+
+from aiogram import Router, F
+from aiogram.types import FSInputFile, Message
+from aiogram.filters import Command, CommandObject
+
+from src.bot.lexicon import Texts, Buttons
+from src.core.config import settings
+from src.infrastructure.database.models import IncidentModel, as_utc
+from src.infrastructure.database.repos import IncidentRepository, MonitorRepository
+from src.infrastructure.database.export import (
+    ExportFormat,
+    ExportTooLargeError,
+    export_history,
+    parquet_available,
+)
+from src.infrastructure.network.client import ErrorCategory
+from src.infrastructure.scheduler.incidents import uptime_window
+from src.infrastructure.scheduler.status_board import status_board
+
+
+stats_router = Router()
+
+# Окна статистики; самое длинное определяет выборку инцидентов
+STATS_WINDOWS = (timedelta(days=1), timedelta(days=7), timedelta(days=30))
+
+
+@stats_router.message(F.text == Buttons.START["menu_stats"])
+async def show_stats(message: Message, repo: MonitorRepository) -> None:
+    """
+    Аптайм мониторов пользователя по таблице инцидентов:
+    одна выборка, стоимость пропорциональна числу сбоев, а не проверок.
+    """
+    user = message.from_user
+    if user is None:
+        return
+
+    monitors = await repo.get_user_monitors(user_id=user.id)
+    if not monitors:
+        await message.answer(text=Texts.Stats.EMPTY)
+        return
+
+    now = datetime.now(timezone.utc)
+    incidents = await IncidentRepository(repo.session).get_user_incidents(
+        user_id=user.id, since=now - STATS_WINDOWS[-1]
+    )
+    by_monitor: dict[int, list[IncidentModel]] = defaultdict(list)
+    for incident in incidents:
+        by_monitor[incident.monitor_id].append(incident)
+
+    blocks = []
+    for monitor in monitors:
+        own = by_monitor.get(monitor.id, [])
+        windows = [uptime_window(own, now - period, now) for period in STATS_WINDOWS]
+        text = Texts.Stats.ITEM.format(
+            "🔴" if own and own[-1].ended_at is None else "🟢",
+            escape(monitor.url),
+            *(f"{window.uptime_percent:.2f}%" for window in windows),
+            windows[-1].incidents,
+        )
+        if own:
+            text += _format_incident(own[-1], now)
+        blocks.append(text)
+
+    await message.answer(text=Texts.Stats.HEADER + "\n\n".join(blocks))
+
+
+def _format_incident(incident: IncidentModel, now: datetime) -> str:
+    started = as_utc(incident.started_at)
+    if incident.ended_at is None:
+        duration = Texts.Stats.ONGOING
+    else:
+        duration = _format_duration(as_utc(incident.ended_at) - started)
+    return Texts.Stats.LAST_INCIDENT.format(
+        started.strftime("%Y-%m-%d %H:%M UTC"),
+        duration,
+        Texts.Stats.CAUSES.get(incident.cause, Texts.Stats.CAUSES[ErrorCategory.OTHER]),
+    )
+
+
+def _format_duration(delta: timedelta) -> str:
+    minutes = max(1, round(delta.total_seconds() / 60))
+    if minutes < 60:
+        return f"{minutes} мин"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours} ч {minutes} мин"
+
+
+@stats_router.message(Command("status"))
+async def cmd_status(message: Message) -> None:
+    """
+    Ссылки на публичную страницу статуса и JSON пользователя.
+    """
+    user = message.from_user
+    token = status_board.token(user.id) if user is not None else None
+    if token is None or not settings.STATUS_API_URL:
+        await message.answer(text=Texts.Stats.STATUS_DISABLED)
+        return
+
+    base = f"{settings.STATUS_API_URL.rstrip('/')}/status/{token}"
+    await message.answer(text=Texts.Stats.STATUS_LINKS.format(base, base + ".json"))
+
+
+# Пользователи, у которых идет выгрузка: не больше одной на человека
+_exports_in_progress: set[int] = set()
+
+
+@stats_router.message(Command("export"))
+async def cmd_export(
+    message: Message, command: CommandObject, repo: MonitorRepository
+) -> None:
+    """
+    Выгрузка истории проверок пользователя файлом.
+    Формат: /export [дни] [csv|parquet]
+    """
+    user = message.from_user
+    if user is None:
+        return
+    urls = await repo.get_urls(user_id=user.id)
+    # Закрываем транзакцию чтения: выгрузка может идти минутами
+    await repo.session.commit()
+    if not urls:
+        await message.answer(text=Texts.Stats.EMPTY)
+        return
+    await send_export(message, command.args, urls, list(urls))
+
+
+async def send_export(
+    message: Message,
+    args: str | None,
+    urls: dict[int, str],
+    monitor_ids: list[int] | None,
+) -> None:
+    """
+    Разбирает аргументы /export, готовит файл во временном каталоге
+    и отправляет его документом. Общая часть /export и /export_all.
+    """
+    days, fmt = None, ExportFormat.CSV
+    for arg in (args or "").lower().split():
+        if arg.isdigit() and int(arg) > 0:
+            days = int(arg)
+        elif arg in set(ExportFormat):
+            fmt = ExportFormat(arg)
+        else:
+            await message.answer(
+                text=Texts.Export.USAGE.format(settings.CHECK_RESULTS_RETENTION_DAYS)
+            )
+            return
+
+    owner = message.chat.id
+    if owner in _exports_in_progress:
+        await message.answer(text=Texts.Export.BUSY)
+        return
+
+    if fmt is ExportFormat.PARQUET and not parquet_available():
+        await message.answer(text=Texts.Export.PARQUET_UNAVAILABLE)
+        fmt = ExportFormat.CSV
+
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(days=days) if days else None
+    filename = f"history-{now:%Y%m%d-%H%M%S}.{fmt.extension}"
+
+    _exports_in_progress.add(owner)
+    try:
+        await message.answer(text=Texts.Export.STARTED)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, filename)
+            try:
+                result = await export_history(path, fmt, urls, monitor_ids, since)
+            except ExportTooLargeError:
+                await message.answer(
+                    text=Texts.Export.TOO_LARGE.format(
+                        settings.EXPORT_MAX_BYTES // (1024 * 1024)
+                    )
+                )
+                return
+            if not result.rows:
+                await message.answer(text=Texts.Export.EMPTY)
+                return
+            await message.answer_document(
+                document=FSInputFile(path, filename=filename),
+                caption=Texts.Export.DONE.format(result.rows),
+            )
+    finally:
+        _exports_in_progress.discard(owner)
@@ -11,12 +11,16 @@ class Texts:
         ADD_SITE = (
             "🌐 <b>Добавление ресурса</b>\n\n"
             "Пришлите ссылку на сайт, который нужно отслеживать.\n"
-            "Пример: <code>https://example.com</code>"
+            "Пример: <code>https://example.com</code>\n\n"
+            "Другие типы проверок:\n"
+            "<code>tcp://example.com:22</code> — TCP-порт\n"
+            "<code>dns://example.com</code> — резолв имени\n"
+            "<code>tls://example.com</code> — TLS-рукопожатие и сертификат"
         )
         MONITOR_ADDED = (
             "✅ <b>Монитор успешно создан!</b>\n\n"
             "🔗 URL: <code>{}</code>\n"
-            "⏱ Интервал: 5 минут\n"
+            "⏱ Интервал: {} с\n"
             "🔍 Проверка начнется автоматически в течение минуты."
         )
         ALREADY_ADDED = (
@@ -27,6 +31,60 @@ class Texts:
             "❌ <b>Некорректный формат ссылки.</b>\n"
             "Пожалуйста, убедитесь, что адрес верен и повторите попытку."
         )
+        LIST_HEADER = "📋 <b>Ваши сайты</b>\n\n"
+        LIST_ITEM = "{}. {} <code>{}</code>"
+        EMPTY_LIST = (
+            "📭 <b>Список пуст.</b>\n"
+            "Жми <b>«Добавить сайт»</b>, чтобы начать мониторинг."
+        )
+        NOT_FOUND = "❌ Сайт с номером <b>{}</b> не найден в вашем списке."
+        EXPECT_USAGE = (
+            "🔎 <b>Проверка содержимого</b>\n\n"
+            "<code>/expect N contains текст</code> — страница должна содержать текст\n"
+            "<code>/expect N absent текст</code> — страница не должна содержать текст\n"
+            "<code>/expect N regex шаблон</code> — должно быть совпадение с регуляркой\n"
+            "<code>/expect N clear</code> — удалить все правила\n"
+            "<code>/expect N</code> — показать правила\n\n"
+            "N — номер сайта в списке «Мои сайты».\n"
+            "Для <code>tcp://</code> правила проверяют баннер сервиса, "
+            "для <code>dns://</code> — список полученных адресов."
+        )
+        EXPECT_RULES = "🔎 <b>Правила для</b> <code>{}</code>\n\n{}"
+        EXPECT_RULE_ITEM = "• {}: <code>{}</code>"
+        EXPECT_EMPTY = (
+            "🔎 Для <code>{}</code> правил нет, проверяется только код ответа."
+        )
+        EXPECT_ADDED = "✅ Правило добавлено для <code>{}</code>."
+        EXPECT_CLEARED = "🧹 Правила для <code>{}</code> удалены."
+        EXPECT_INVALID = "❌ Некорректное правило: {}"
+        EXPECT_TOO_MANY = "⚠️ Не больше {} правил на один сайт."
+        INTERVAL_USAGE = (
+            "⏱ <b>Интервал проверки</b>\n\n"
+            "<code>/interval N секунды</code> — фиксированный интервал\n"
+            "<code>/interval N мин макс</code> — адаптивный: стабильный сайт "
+            "проверяется реже (до макс), после сбоя или скачка задержки — снова "
+            "раз в мин секунд\n"
+            "<code>/interval N</code> — показать текущий\n\n"
+            "Допустимо от {} до {} секунд."
+        )
+        INTERVAL_FIXED = "⏱ <code>{}</code>: проверка каждые {} с."
+        INTERVAL_ADAPTIVE = (
+            "⏱ <code>{}</code>: адаптивный интервал {}–{} с, сейчас {} с."
+        )
+        INTERVAL_INVALID = (
+            "❌ Интервал должен быть от {} до {} секунд, минимум не больше максимума."
+        )
+        CHECK_USAGE = (
+            "Использование: <code>/check N</code>, где N — номер сайта "
+            "в списке «Мои сайты». Можно нажать 🔄 под списком."
+        )
+        CHECK_STARTED = "🔄 Проверяю..."
+        CHECK_GONE = "Сайт не найден — возможно, он уже удален."
+        CHECK_UP = "🟢 <code>{}</code> доступен\nКод ответа: {}, время ответа: {} мс"
+        CHECK_DOWN = "🔴 <code>{}</code> недоступен\n❌ {}"
+        CHECK_REDIRECTS = "\nС редиректами ({}): {} мс"
+        CHECK_CACHED = "\n<i>Результат {} с назад</i>"
+        CHECK_RATE_LIMITED = "⏳ Слишком много проверок. Повторите через {} с."
         UNAVAILABLE = (
             "🚨 <b>Сайт недоступен!</b>\n\n🔗 URL: <code>{}</code>\n❌ Ошибка: {}"
         )
@@ -40,6 +98,79 @@ class Texts:
             "⏳ Осталось дней: {}"
         )
 
+    class Stats:
+        HEADER = "📊 <b>Аптайм за 24 ч / 7 д / 30 д</b>\n\n"
+        ITEM = "{} <code>{}</code>\n{} / {} / {} · инцидентов за 30 д: {}"
+        LAST_INCIDENT = "\nПоследний: {} ({}, {})"
+        ONGOING = "продолжается"
+        EMPTY = (
+            "📭 <b>Статистики пока нет.</b>\n"
+            "Жми <b>«Добавить сайт»</b>, чтобы начать мониторинг."
+        )
+        STATUS_LINKS = (
+            "🌐 <b>Страница статуса</b>\n\n"
+            "{}\n"
+            "JSON: {}\n\n"
+            "Ссылки секретные: любой, у кого они есть, видит статус ваших сайтов."
+        )
+        STATUS_DISABLED = "Страницы статуса не включены на этом боте."
+        CAUSES = {
+            1: "таймаут",
+            2: "соединение",
+            3: "DNS",
+            4: "SSL",
+            5: "код ответа",
+            6: "содержимое",
+            255: "ошибка",
+        }
+
+    class Export:
+        USAGE = (
+            "📦 <b>Выгрузка истории проверок</b>\n\n"
+            "<code>/export [дни] [csv|parquet]</code>\n"
+            "По умолчанию — вся сохраненная история (до {} дней) в csv.gz."
+        )
+        STARTED = "⏳ Готовлю выгрузку..."
+        BUSY = "⏳ Предыдущая выгрузка еще не закончилась."
+        EMPTY = "📭 За выбранный период проверок нет."
+        PARQUET_UNAVAILABLE = (
+            "⚠️ Parquet недоступен на этом боте, выгрузка будет в csv.gz."
+        )
+        TOO_LARGE = (
+            "⚠️ Выгрузка больше {} МБ — Telegram не примет такой файл. "
+            "Укажите период короче: <code>/export 7</code>"
+        )
+        DONE = "📦 История проверок: {} строк"
+
+    class Admin:
+        DIAG_STATUS = (
+            "🩺 <b>Диагностика event loop</b>: {}\n\n"
+            "Замеров: {}\n"
+            "Задержка loop: p50 {:.1f} мс, p99 {:.1f} мс, max {:.1f} мс\n"
+            "Блокировок: {} (макс. {:.0f} мс)\n\n"
+            "<code>/diag on</code> — включить, <code>/diag off</code> — выключить"
+        )
+        PROFILE_USAGE = "Использование: <code>/profile [секунды]</code>"
+        PROFILE_STARTED = "⏱ Профилирую цикл проверок (не дольше {} с)..."
+        PROFILE_BUSY = "⚠️ Профилирование уже выполняется, попробуйте позже."
+        PROFILE_DONE = "📄 Профиль цикла проверок"
+        SCHEDULE_STATUS = (
+            "🗓 <b>Расписание проверок</b>\n\n"
+            "Мониторов в расписании: {}\n"
+            "Выполнено проверок: {}\n"
+            "Сэкономлено адаптивными интервалами: {} ({:.1f}%)\n\n"
+            "Адресов с известными редиректами: {}\n"
+            "Проверок сразу по конечному адресу: {}, пропущено редиректов: {}\n"
+            "Перепроверок цепочек: {}\n\n"
+            "Условных запросов: {}, ответов 304: {}\n"
+            "Не скачано благодаря 304: {:.1f} МБ"
+        )
+        PIPELINE_STATUS = "🛠 <b>Конвейер мониторинга</b>: {}\n\n{}"
+        PIPELINE_STAGE = (
+            "<b>{}</b> ×{}: очередь {}/{}, обработано {} ({:.1f}/с), "
+            "занятость {:.0f}%, отброшено {}, ошибок {}"
+        )
+
 
 class Buttons:
     START = {
@@ -48,3 +179,4 @@ class Buttons:
         "menu_stats": "📊 Статистика",
         "menu_help": "❓ Помощь",
     }
+    CHECK_NOW = "🔄 {}"
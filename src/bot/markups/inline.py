@@ -0,0 +1,34 @@
+from typing import Sequence
+
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+from src.bot.lexicon import Buttons
+from src.infrastructure.database.models import MonitorModel
+
+
+# Telegram допускает до 100 кнопок; остальные сайты доступны через /check N
+MAX_CHECK_BUTTONS = 50
+
+
+class CheckNowCallback(CallbackData, prefix="check"):
+    """Кнопка «проверить сейчас» для монитора."""
+
+    monitor_id: int
+
+
+def check_now_kb(monitors: Sequence[MonitorModel]) -> InlineKeyboardMarkup:
+    """
+    Кнопки «проверить сейчас» под списком сайтов, по номеру в списке.
+    """
+    builder = InlineKeyboardBuilder()
+
+    for index, monitor in enumerate(monitors[:MAX_CHECK_BUTTONS], start=1):
+        builder.button(
+            text=Buttons.CHECK_NOW.format(index),
+            callback_data=CheckNowCallback(monitor_id=monitor.id),
+        )
+
+    builder.adjust(5)
+    return builder.as_markup()
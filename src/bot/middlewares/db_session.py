@@ -33,8 +33,9 @@ class DbSessionMiddleware(BaseMiddleware):
                 # Вызываем хендлер
                 result = await handler(event, data)
 
-                # Коммит только если есть что коммитить
-                if session.new or session.dirty or session.deleted:
+                # Коммит только если транзакция была открыта. Проверять
+                # session.new/dirty нельзя: после flush() в репозитории они пусты
+                if session.in_transaction():
                     await session.commit()
 
                 return result
@@ -0,0 +1,199 @@
+import signal
+import asyncio
+import secrets
+
+from loguru import logger
+
+from aiohttp import web
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from aiogram.webhook.aiohttp_server import setup_application
+
+from src.core.config import settings
+
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class WebhookHandler:
+    """
+    Приём апдейтов от Telegram через webhook.
+    Запрос подтверждается сразу (200), а обработка уходит в ограниченный
+    пул воркеров через очередь. Если очередь заполнена, отвечаем 503 —
+    Telegram повторит доставку позже, и память не растёт бесконтрольно.
+    """
+
+    def __init__(
+        self,
+        dispatcher: Dispatcher,
+        bot: Bot,
+        secret_token: str | None = None,
+        workers: int = 16,
+        queue_size: int = 1000,
+    ) -> None:
+        self.dispatcher = dispatcher
+        self.bot = bot
+        self.secret_token = secret_token
+        self.workers = max(1, workers)
+        self._queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=queue_size)
+        self._tasks: list[asyncio.Task[None]] = []
+        self._overloaded = False
+
+        # Счетчики для логов и бенчмарков
+        self.accepted = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+
+    def register(self, app: web.Application, path: str) -> None:
+        """Регистрирует маршрут и хуки запуска/остановки воркеров в приложении."""
+        app.router.add_post(path, self.handle)
+        app.on_startup.append(self._on_startup)
+        app.on_shutdown.append(self._on_shutdown)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """
+        Обработчик POST-запроса от Telegram.
+        Не парсит тело: только проверяет секрет и кладет байты в очередь.
+        """
+        if self.secret_token and not secrets.compare_digest(
+            request.headers.get(SECRET_HEADER, ""), self.secret_token
+        ):
+            return web.Response(status=401)
+
+        body = await request.read()
+        try:
+            self._queue.put_nowait(body)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            # Пишем в лог один раз на эпизод перегрузки, а не на каждый запрос
+            if not self._overloaded:
+                self._overloaded = True
+                logger.warning("Очередь webhook переполнена, апдейты отклоняются")
+            return web.Response(status=503)
+
+        self._overloaded = False
+        self.accepted += 1
+        return web.Response(status=200)
+
+    async def start(self) -> None:
+        """Запускает пул воркеров."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"webhook-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def join(self) -> None:
+        """Ждет, пока все принятые апдейты будут обработаны."""
+        await self._queue.join()
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """
+        Останавливает воркеров, предварительно дав им дообработать очередь.
+        """
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Не удалось дообработать очередь webhook", left=self._queue.qsize()
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            body = await self._queue.get()
+            try:
+                update = Update.model_validate_json(body, context={"bot": self.bot})
+                await self.dispatcher.feed_update(self.bot, update)
+                self.processed += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Ошибка при обработке апдейта из webhook")
+            finally:
+                self._queue.task_done()
+
+    async def _on_startup(self, app: web.Application) -> None:
+        await self.start()
+
+    async def _on_shutdown(self, app: web.Application) -> None:
+        await self.stop()
+
+
+def create_webhook_app(
+    bot: Bot,
+    dispatcher: Dispatcher,
+    secret_token: str | None = None,
+) -> tuple[web.Application, WebhookHandler]:
+    """Создаёт aiohttp-приложение с webhook-обработчиком.
+
+    Args:
+        bot: Экземпляр бота.
+        dispatcher: Диспетчер с подключенными роутерами.
+        secret_token: Ожидаемое значение заголовка X-Telegram-Bot-Api-Secret-Token.
+
+    Returns:
+        Приложение и обработчик (для доступа к счетчикам).
+    """
+    app = web.Application()
+    handler = WebhookHandler(
+        dispatcher=dispatcher,
+        bot=bot,
+        secret_token=secret_token,
+        workers=settings.WEBHOOK_WORKERS,
+        queue_size=settings.WEBHOOK_QUEUE_SIZE,
+    )
+    handler.register(app, path=settings.WEBHOOK_PATH)
+    setup_application(app, dispatcher, bot=bot)
+    return app, handler
+
+
+async def run_webhook(bot: Bot, dispatcher: Dispatcher) -> None:
+    """
+    Запуск бота в режиме webhook.
+    Поднимает HTTP-сервер, регистрирует webhook в Telegram и ждет сигнала остановки.
+    """
+    if not settings.WEBHOOK_URL:
+        raise RuntimeError("Для режима webhook необходимо указать WEBHOOK_URL")
+
+    secret_token = (
+        settings.WEBHOOK_SECRET.get_secret_value() if settings.WEBHOOK_SECRET else None
+    )
+    app, _ = create_webhook_app(bot, dispatcher, secret_token=secret_token)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, host=settings.WEBHOOK_HOST, port=settings.WEBHOOK_PORT)
+    await site.start()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    try:
+        await bot.set_webhook(
+            url=settings.WEBHOOK_URL.rstrip("/") + settings.WEBHOOK_PATH,
+            secret_token=secret_token,
+            max_connections=settings.WEBHOOK_MAX_CONNECTIONS,
+            allowed_updates=dispatcher.resolve_used_update_types(),
+            drop_pending_updates=True,
+        )
+        logger.info(
+            "Бот слушает webhook",
+            host=settings.WEBHOOK_HOST,
+            port=settings.WEBHOOK_PORT,
+            path=settings.WEBHOOK_PATH,
+        )
+        await stop_event.wait()
+    finally:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+        await runner.cleanup()
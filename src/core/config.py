@@ -1,3 +1,4 @@
+from typing import Literal
 from functools import lru_cache
 
 from pydantic import SecretStr, Field
@@ -16,6 +17,28 @@ class Settings(BaseSettings):
         default_factory=set
     )  # Формат JSON в .env: ADMIN_IDS=[123, 456]
 
+    # Режим получения обновлений: long polling или webhook
+    BOT_MODE: Literal["polling", "webhook"] = "polling"
+
+    # Webhook
+    # Публичный адрес бота, например https://bot.example.com
+    WEBHOOK_URL: str | None = None
+    WEBHOOK_PATH: str = "/webhook"
+    # Сверяется с заголовком X-Telegram-Bot-Api-Secret-Token
+    WEBHOOK_SECRET: SecretStr | None = None
+    WEBHOOK_HOST: str = "0.0.0.0"
+    WEBHOOK_PORT: int = 8080
+    WEBHOOK_WORKERS: int = 16  # Количество параллельных обработчиков апдейтов
+    WEBHOOK_QUEUE_SIZE: int = 1000  # При переполнении отвечаем 503, Telegram повторит
+    WEBHOOK_MAX_CONNECTIONS: int = 40  # Параллельные соединения со стороны Telegram
+
+    # Публичные страницы статуса (read-only API); выключены, пока не задан секрет
+    STATUS_API_SECRET: SecretStr | None = None  # Из него выводятся токены ссылок
+    STATUS_API_HOST: str = "0.0.0.0"
+    STATUS_API_PORT: int = 8081
+    # Внешний адрес API для ссылок в боте, например https://status.example.com
+    STATUS_API_URL: str | None = None
+
     # Database
     DB_URL: str = "sqlite+aiosqlite:///uptime.db"
     DB_ECHO: bool = False
@@ -23,6 +46,59 @@ class Settings(BaseSettings):
     # Monitoring defaults
     DEFAULT_CHECK_INTERVAL: int = 300  # 5 минут
     REQUEST_TIMEOUT: int = 10  # Таймаут HTTP запроса в секундах
+    SCHEDULER_TICK: int = 60  # Период цикла планировщика, он же минимальный интервал
+
+    # Адаптивные интервалы (включаются для монитора командой /interval N мин макс)
+    MAX_CHECK_INTERVAL: int = 24 * 60 * 60  # Верхняя граница, которую можно задать
+    ADAPTIVE_STABLE_CHECKS: int = 10  # Успешных проверок подряд до растяжения
+    ADAPTIVE_GROWTH: float = 1.5  # Множитель интервала для стабильного монитора
+    ADAPTIVE_LATENCY_SPIKE: float = 3.0  # Во сколько раз выше среднего — всплеск
+
+    # Конвейер мониторинга: probe → evaluate → persist / notify
+    PIPELINE_PROBE_WORKERS: int = 100  # Параллельных проверок, как пул соединений
+    PIPELINE_NOTIFY_WORKERS: int = 4  # Параллельная отправка алертов в Telegram
+    PIPELINE_QUEUE_SIZE: int = 1000  # Емкость очереди каждой стадии
+    PIPELINE_PERSIST_BATCH: int = 500  # Результатов на одну транзакцию
+    PIPELINE_PERSIST_LINGER: float = 0.5  # Сколько ждать добора пачки, секунды
+
+    # «Проверить сейчас»
+    CHECK_NOW_FRESHNESS: int = 30  # Результат моложе — отдаем из кэша, секунды
+    CHECK_NOW_USER_LIMIT: int = 5  # Новых проверок на пользователя за окно
+    CHECK_NOW_USER_WINDOW: int = 60  # Окно лимита, секунды
+
+    # Снимок состояния расписания для теплого рестарта
+    STATE_SNAPSHOT_PATH: str = "state/schedule.json"
+    STATE_CHECKPOINT_INTERVAL: int = 300  # Периодическое сохранение, секунды
+    STATE_SNAPSHOT_MAX_AGE: int = 24 * 60 * 60  # Более старый снимок игнорируется
+    RESTART_CATCHUP_TICKS: int = 5  # Догон просроченного после простоя, тиков
+
+    # Сырая история проверок (инциденты хранятся без ограничения срока)
+    CHECK_RESULTS_RETENTION_DAYS: int = 90
+
+    # Выгрузка истории проверок (/export)
+    EXPORT_BATCH_SIZE: int = 5000  # Строк на страницу; больше в памяти не бывает
+    EXPORT_MAX_BYTES: int = 50 * 1024 * 1024  # Лимит Telegram на файл от бота
+
+    # Проверка содержимого страниц
+    CONTENT_MAX_BYTES: int = 1024 * 1024  # Дальше этого тело не читаем
+    CONTENT_REGEX_WINDOW: int = 1024  # Перекрытие кусков для регулярок, байты
+    CONTENT_MAX_RULES: int = 10  # Правил на один монитор
+
+    # Кэш редиректов: проверки идут сразу на конечный адрес цепочки
+    REDIRECT_CACHE_TTL: int = 60 * 60  # Полная перепроверка цепочки, секунды
+
+    # In-memory история последних проверок (кольцевые буферы)
+    HISTORY_CAPACITY: int = 512  # Результатов на монитор
+    HISTORY_MEMORY_LIMIT_MB: int = 64  # Сверх лимита история каждого монитора короче
+
+    # Диагностика event loop'а (можно включать/выключать командой /diag)
+    DIAGNOSTICS_ENABLED: bool = False
+    LOOP_LAG_INTERVAL: float = 0.5  # Период замера задержки loop'а, секунды
+    SLOW_CALLBACK_THRESHOLD: float = 0.25  # Блокировка дольше — пишем стек в лог
+    PROFILE_MAX_SECONDS: int = 60  # Верхняя граница для /profile
+
+    # Бюджет холодного старта: дольше — предупреждение в логе, бенчмарк падает
+    STARTUP_BUDGET_SECONDS: float = 5.0
 
     # Настройки загрузки
     model_config = SettingsConfigDict(
@@ -0,0 +1,209 @@
+import io
+import sys
+import time
+import asyncio
+import threading
+import traceback
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from loguru import logger
+
+from src.core.config import settings
+
+
+class LoopDiagnostics:
+    """
+    Диагностика здоровья event loop'а.
+
+    Фоновая задача раз в interval измеряет задержку планирования (loop lag).
+    Вторая обновляет heartbeat с шагом в четверть threshold, а сторожевой
+    поток сравнивает с threshold время с последнего heartbeat: если loop
+    не отвечает дольше, в лог пишется стек основного потока — видно, какой
+    синхронный вызов его держит. Блокировку, которая кончилась между
+    опросами сторожа, замечает сам heartbeat и пишет ее без стека.
+    Шаг heartbeat не зависит от interval, поэтому ловятся и блокировки
+    короче интервала замера. Включение и выключение идемпотентны,
+    накладные расходы — две короткие задачи и один поток.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        threshold: float = 0.25,
+        history: int = 1200,
+    ) -> None:
+        self.interval = interval
+        self.threshold = threshold
+        self._lags: deque[float] = deque(maxlen=history)
+        self._task: asyncio.Task[None] | None = None
+        self._beat_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._beat = 0.0
+        self._reported_beat = 0.0  # Heartbeat, после которого остановка уже учтена
+        self._loop_thread_id = 0
+
+        self.stalls = 0
+        self.max_stall = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """Включает мониторинг; должен вызываться из работающего event loop'а."""
+        if self._task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._sample(), name="loop-lag-monitor")
+        self._beat_task = asyncio.create_task(self._heartbeat(), name="loop-heartbeat")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(
+            "Диагностика event loop включена",
+            interval=self.interval,
+            threshold=self.threshold,
+        )
+
+    async def stop(self) -> None:
+        """Выключает мониторинг и дожидается остановки сторожевого потока."""
+        if self._task is None:
+            return
+        self._stop.set()
+        tasks = [task for task in (self._task, self._beat_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = self._beat_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+        logger.info("Диагностика event loop выключена")
+
+    def stats(self) -> dict[str, float]:
+        """Сводка по задержкам в миллисекундах за последние замеры."""
+        lags = sorted(self._lags)
+        if not lags:
+            return {"samples": 0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "samples": len(lags),
+            "p50": lags[len(lags) // 2] * 1000,
+            "p99": lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000,
+            "max": lags[-1] * 1000,
+        }
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._lags.append(lag)
+
+    async def _heartbeat(self) -> None:
+        # Между ударами проходит не больше четверти threshold, поэтому
+        # пауза дольше threshold — это блокировка loop'а, а не ожидание
+        step = self.threshold / 4
+        previous = self._beat = time.monotonic()
+        while True:
+            await asyncio.sleep(step)
+            now = time.monotonic()
+            stalled_for = now - previous
+            if stalled_for > self.threshold:
+                if self._reported_beat != previous:
+                    # Сторож не успел снять стек: блокировка уже закончилась
+                    self._report(previous, stalled_for, "<блокировка закончилась>")
+                # Сторож видит остановку в начале, полная длина известна здесь
+                self.max_stall = max(self.max_stall, stalled_for)
+            previous = self._beat = now
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.threshold / 4):
+            beat = self._beat
+            stalled_for = time.monotonic() - beat
+            if stalled_for <= self.threshold or beat == self._reported_beat:
+                continue
+
+            # Фиксируем стек один раз на каждую остановку loop'а
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<нет стека>"
+            self._report(beat, stalled_for, stack)
+
+    def _report(self, beat: float, stalled_for: float, stack: str) -> None:
+        self._reported_beat = beat
+        self.stalls += 1
+        self.max_stall = max(self.max_stall, stalled_for)
+        logger.warning(
+            "Event loop заблокирован дольше {threshold:.0f} мс\n{stack}",
+            threshold=self.threshold * 1000,
+            stack=stack,
+            stalled_ms=int(stalled_for * 1000),
+        )
+
+
+class ProfilerBusyError(RuntimeError):
+    """Профилирование уже запущено (cProfile не допускает вложенных сессий)."""
+
+
+_profile_lock = asyncio.Lock()
+
+
+async def capture_profile(
+    target: Callable[[], Awaitable[object]], seconds: float, limit: int = 80
+) -> str:
+    """Профилирует event loop, пока выполняется target, но не дольше seconds.
+
+    Профиль снимается со всего потока loop'а, поэтому попадают и соседние
+    задачи — это и нужно, чтобы увидеть, кто мешает циклу проверок.
+
+    Args:
+        target: Фабрика корутины, работа которой профилируется
+            (например, цикл проверок).
+        seconds: Ограничение по времени; по его истечении target отменяется.
+        limit: Сколько строк выводить в отчете.
+
+    Returns:
+        Текстовый отчет pstats, отсортированный по cumulative time.
+
+    Raises:
+        ProfilerBusyError: Если другое профилирование еще не завершено.
+    """
+    # Профилировщик нужен только по команде /profile — не грузим его на старте
+    import pstats
+    import cProfile
+
+    if _profile_lock.locked():
+        raise ProfilerBusyError("Профилирование уже выполняется")
+
+    async with _profile_lock:
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            await asyncio.wait_for(target(), timeout=seconds)
+            finished = True
+        except asyncio.TimeoutError:
+            finished = False
+        finally:
+            profiler.disable()
+        elapsed = time.perf_counter() - started
+
+    stream = io.StringIO()
+    stream.write(
+        f"Длительность: {elapsed:.2f} с, "
+        f"{'завершено' if finished else 'прервано по таймауту'}\n\n"
+    )
+    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue()
+
+
+# Глобальный экземпляр диагностики
+diagnostics = LoopDiagnostics(
+    interval=settings.LOOP_LAG_INTERVAL,
+    threshold=settings.SLOW_CALLBACK_THRESHOLD,
+)
@@ -80,7 +80,10 @@ def _format_json(record: dict[str, Any]) -> str:
         "location": f"{record['name']}:{record['function']}:{record['line']}",
         "extra": record["extra"],
     }
-    return json.dumps(payload, ensure_ascii=False, default=str) + "\n"
+    # Результат format-функции loguru разбирает как шаблон (скобки, <теги>),
+    # поэтому готовый JSON передаем через extra, а не вставляем в строку
+    record["extra"]["_json"] = json.dumps(payload, ensure_ascii=False, default=str)
+    return "{extra[_json]}\n"
 
 
 class InterceptHandler(logging.Handler):
@@ -158,7 +161,5 @@ def configure_logger() -> None:
     logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
 
 
-# Конфигурируем при импорте
-configure_logger()
-# Экспортируем логгер
+# Экспортируем логгер (настраивается явным вызовом configure_logger при старте)
 logger = _logger
@@ -0,0 +1,51 @@
+import time
+
+from loguru import logger
+
+
+class StartupTimer:
+    """
+    Замер фаз холодного старта.
+
+    Отсчет идет от импорта модуля, поэтому src.__main__ импортирует его
+    первым. mark() закрывает текущую фазу и открывает следующую; итог
+    пишется в лог одной строкой, с предупреждением при превышении бюджета.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self._last = self._started
+        self.phases: dict[str, float] = {}
+        self.reported = False
+
+    def mark(self, phase: str) -> float:
+        """Фиксирует окончание фазы и возвращает ее длительность в секундах."""
+        now = time.perf_counter()
+        self.phases[phase] = now - self._last
+        self._last = now
+        return self.phases[phase]
+
+    @property
+    def total(self) -> float:
+        return self._last - self._started
+
+    def report(self, budget: float) -> None:
+        """Пишет фазы старта в лог (один раз за жизнь процесса)."""
+        if self.reported:
+            return
+        self.reported = True
+
+        phases = {name: round(seconds * 1000) for name, seconds in self.phases.items()}
+        if budget and self.total > budget:
+            logger.warning(
+                "Старт дольше бюджета",
+                total_ms=round(self.total * 1000),
+                budget_ms=round(budget * 1000),
+                **phases,
+            )
+        else:
+            logger.info("Бот готов", total_ms=round(self.total * 1000), **phases)
+
+
+# Глобальный таймер старта процесса
+startup_timer = StartupTimer()
@@ -0,0 +1,58 @@
+"""
+Пересборка таблицы incidents из сырой истории check_results.
+
+    python -m src.infrastructure.database.backfill [--monitor ID ...]
+
+Нужна после первого развертывания (если история уже накоплена) или после
+ручной правки check_results. Повторный запуск дает тот же результат.
+Заменяются только инциденты в пределах сохраненной сырой истории;
+более ранние остаются.
+
+Запускать при остановленном боте: конвейер пишет результаты и инциденты
+параллельно, и пересборка поверх живой записи дала бы дубли.
+"""
+
+import asyncio
+import argparse
+
+from loguru import logger
+
+from src.core.logger import configure_logger
+from src.infrastructure.database.manager import db_manager
+from src.infrastructure.scheduler.incidents import rebuild_incidents
+
+
+async def backfill(monitor_ids: list[int] | None, batch_size: int) -> None:
+    try:
+        async with db_manager.session_maker() as session:
+            checks, incidents = await rebuild_incidents(
+                session, monitor_ids, batch_size=batch_size
+            )
+        logger.info(
+            "Инциденты пересобраны",
+            checks=checks,
+            incidents=incidents,
+            monitors=monitor_ids or "все",
+        )
+    finally:
+        await db_manager.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--monitor",
+        type=int,
+        action="append",
+        dest="monitor_ids",
+        help="ID монитора (можно несколько раз); по умолчанию — все",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    configure_logger()
+    asyncio.run(backfill(args.monitor_ids, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+import io
+import os
+import csv
+import gzip
+import asyncio
+import importlib.util
+from enum import StrEnum
+from typing import Any, AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from dataclasses import dataclass
+
+from sqlalchemy import Row
+
+from src.core.config import settings
+from src.infrastructure.database.manager import db_manager
+from src.infrastructure.database.models import as_utc
+from src.infrastructure.database.repos import CheckResultRepository
+from src.infrastructure.network.client import ErrorCategory
+
+
+COLUMNS = (
+    "monitor_id",
+    "url",
+    "checked_at",
+    "is_up",
+    "status_code",
+    "response_time_ms",
+    "redirect_time_ms",
+    "error_category",
+    "error",
+)
+
+
+class ExportFormat(StrEnum):
+    CSV = "csv"  # csv.gz — открывается чем угодно
+    PARQUET = "parquet"  # Колоночный формат для pandas/DuckDB, нужен pyarrow
+
+    @property
+    def extension(self) -> str:
+        return "csv.gz" if self is ExportFormat.CSV else "parquet"
+
+
+class ExportTooLargeError(Exception):
+    """Выгрузка превысила допустимый размер файла."""
+
+
+@dataclass(slots=True, frozen=True)
+class ExportResult:
+    rows: int
+    size: int
+
+
+def parquet_available() -> bool:
+    """pyarrow — необязательная зависимость (pip install .[parquet])."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+async def iter_batches(
+    monitor_ids: Sequence[int] | None,
+    since: datetime | None,
+    batch_size: int,
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """
+    Генератор страниц истории проверок (keyset-пагинация).
+
+    Каждая страница читается в своей короткой сессии: выгрузка может идти
+    минутами, и долгая транзакция чтения мешала бы движку писать результаты.
+    """
+    after = None
+    while True:
+        async with db_manager.session_maker() as session:
+            batch = await CheckResultRepository(session).fetch_batch(
+                monitor_ids, since, after, batch_size
+            )
+        if not batch:
+            return
+        yield batch
+        if len(batch) < batch_size:
+            return
+        last = batch[-1]
+        after = (last.monitor_id, last.checked_at, last.id)
+
+
+def _category(code: int) -> str:
+    try:
+        return ErrorCategory(code).name.lower()
+    except ValueError:
+        return str(code)
+
+
+class _CsvGzipWriter:
+    def __init__(self, path: str) -> None:
+        self._raw = open(path, "wb")
+        self._gzip = gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=6)
+        self._text = io.TextIOWrapper(self._gzip, encoding="utf-8", newline="")
+        self._csv = csv.writer(self._text)
+        self._csv.writerow(COLUMNS)
+
+    def write(self, batch: Sequence[Row[Any]], urls: Mapping[int, str]) -> None:
+        self._csv.writerows(
+            (
+                row.monitor_id,
+                urls.get(row.monitor_id, ""),
+                as_utc(row.checked_at).isoformat(),
+                int(row.is_up),
+                row.status_code,
+                row.response_time_ms,
+                row.redirect_time_ms,
+                _category(row.error_category),
+                row.error,
+            )
+            for row in batch
+        )
+
+    def size(self) -> int:
+        # Сжатых байт на диске (без еще не сброшенного буфера gzip)
+        return self._raw.tell()
+
+    def close(self) -> None:
+        self._text.close()
+        self._raw.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: str) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._path = path
+        self._schema = pa.schema(
+            [
+                ("monitor_id", pa.int32()),
+                ("url", pa.string()),
+                ("checked_at", pa.timestamp("ms", tz="UTC")),
+                ("is_up", pa.bool_()),
+                ("status_code", pa.int16()),
+                ("response_time_ms", pa.int32()),
+                ("redirect_time_ms", pa.int32()),
+                ("error_category", pa.string()),
+                ("error", pa.string()),
+            ]
+        )
+        # Каждая страница — отдельная row group: в памяти только она
+        self._writer = pq.ParquetWriter(path, self._schema, compression="zstd")
+
+    def write(self, batch: Sequence[Row[Any]], urls: Mapping[int, str]) -> None:
+        columns = {
+            "monitor_id": [row.monitor_id for row in batch],
+            "url": [urls.get(row.monitor_id, "") for row in batch],
+            "checked_at": [as_utc(row.checked_at) for row in batch],
+            "is_up": [row.is_up for row in batch],
+            "status_code": [row.status_code for row in batch],
+            "response_time_ms": [row.response_time_ms for row in batch],
+            "redirect_time_ms": [row.redirect_time_ms for row in batch],
+            "error_category": [_category(row.error_category) for row in batch],
+            "error": [row.error for row in batch],
+        }
+        self._writer.write_table(
+            self._pa.Table.from_pydict(columns, schema=self._schema)
+        )
+
+    def size(self) -> int:
+        return os.path.getsize(self._path)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+async def export_history(
+    path: str,
+    fmt: ExportFormat,
+    urls: Mapping[int, str],
+    monitor_ids: Sequence[int] | None,
+    since: datetime | None = None,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+    max_bytes: int = settings.EXPORT_MAX_BYTES,
+) -> ExportResult:
+    """
+    Выгружает историю проверок в файл path. Память ограничена одной
+    страницей (batch_size строк) независимо от объема выгрузки.
+
+    Args:
+        urls: Адреса мониторов для колонки url.
+        monitor_ids: Чьи проверки выгружать; None — всех мониторов.
+
+    Raises:
+        ExportTooLargeError: Файл вырос больше max_bytes.
+    """
+    writer_cls = _ParquetWriter if fmt is ExportFormat.PARQUET else _CsvGzipWriter
+    writer = await asyncio.to_thread(writer_cls, path)
+    rows = 0
+    try:
+        async for batch in iter_batches(monitor_ids, since, batch_size):
+            # Сжатие и кодирование — в потоке, чтобы не блокировать event loop
+            await asyncio.to_thread(writer.write, batch, urls)
+            rows += len(batch)
+            if writer.size() > max_bytes:
+                raise ExportTooLargeError(f"больше {max_bytes} байт")
+    finally:
+        await asyncio.to_thread(writer.close)
+
+    # Проверка по ходу не видит хвост, дописанный при закрытии
+    # (буфер gzip, футер Parquet): окончательный размер — по файлу
+    size = os.path.getsize(path)
+    if size > max_bytes:
+        raise ExportTooLargeError(f"больше {max_bytes} байт")
+    return ExportResult(rows=rows, size=size)
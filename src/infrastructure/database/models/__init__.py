@@ -1,8 +1,13 @@
-from .base_model import BaseModel
+from .base_model import BaseModel, as_utc
 from .monitor_model import MonitorModel
+from .check_result_model import CheckResultModel
+from .incident_model import IncidentModel
 
 
 __all__ = [
     "BaseModel",
     "MonitorModel",
+    "CheckResultModel",
+    "IncidentModel",
+    "as_utc",
 ]
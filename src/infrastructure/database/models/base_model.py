@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -5,3 +7,13 @@ class BaseModel(DeclarativeBase):
     """Базовый класс для всех ORM моделей."""
 
     pass
+
+
+def as_utc(moment: datetime) -> datetime:
+    """
+    Время из колонки DateTime(timezone=True) с tzinfo UTC.
+
+    SQLite отдает DateTime без tzinfo, хотя пишем мы UTC; PostgreSQL
+    возвращает aware-значение, оно не меняется.
+    """
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
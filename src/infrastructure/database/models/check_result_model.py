@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.models import BaseModel
+
+
+class CheckResultModel(BaseModel):
+    """
+    Сырая история проверок: одна строка на проверку.
+    Пишется пачкой в конце цикла; источник для пересборки инцидентов и выгрузки.
+    """
+
+    __tablename__ = "check_results"
+    __table_args__ = (
+        Index("ix_check_results_monitor_time", "monitor_id", "checked_at"),
+    )
+
+    # BIGINT в PostgreSQL; в SQLite автоинкремент работает только у INTEGER
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+
+    monitor_id: Mapped[int] = mapped_column(
+        ForeignKey("monitors.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Время проверки (UTC)
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    is_up: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+    # HTTP-код; None — ответа не было или проверка не HTTP
+    status_code: Mapped[int | None] = mapped_column(SmallInteger, nullable=True)
+
+    # Время ответа конечного адреса, без редиректов
+    response_time_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Время на редиректы до конечного адреса (0 — их нет)
+    redirect_time_ms: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # ErrorCategory
+    error_category: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
+
+    error: Mapped[str | None] = mapped_column(String(512), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CheckResult(monitor={self.monitor_id}, at={self.checked_at}, "
+            f"up={self.is_up})>"
+        )
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database.models import BaseModel
+
+
+class IncidentModel(BaseModel):
+    """
+    Инцидент — непрерывный период недоступности монитора.
+    Хранятся только переходы состояния (run-length encoding истории), поэтому
+    аптайм за любое окно считается по нескольким строкам, а не по всем проверкам.
+    """
+
+    __tablename__ = "incidents"
+    __table_args__ = (
+        Index("ix_incidents_monitor_started", "monitor_id", "started_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+
+    monitor_id: Mapped[int] = mapped_column(
+        ForeignKey("monitors.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Первая неудачная проверка
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    # Первая успешная проверка после сбоя; None — инцидент продолжается
+    ended_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, index=True
+    )
+
+    # Причина (ErrorCategory первой неудачной проверки)
+    cause: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+
+    first_error: Mapped[str | None] = mapped_column(String(512), nullable=True)
+
+    # Сколько неудачных проверок вошло в инцидент
+    failed_checks: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    def __repr__(self) -> str:
+        return (
+            f"<Incident(monitor={self.monitor_id}, "
+            f"{self.started_at} — {self.ended_at or '...'})>"
+        )
@@ -1,9 +1,11 @@
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import BigInteger, String, Boolean, DateTime
+from sqlalchemy import BigInteger, String, Boolean, DateTime, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.core.config import settings
 from src.infrastructure.database.models import BaseModel
 
 
@@ -23,12 +25,27 @@ class MonitorModel(BaseModel):
     # URL для проверки
     url: Mapped[str] = mapped_column(String(2048), nullable=False)
 
+    # Тип проверки: http, tcp, dns, tls (см. ProbeType)
+    probe_type: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="http", server_default="http"
+    )
+
     # Интервал проверки в секундах
-    check_interval: Mapped[int] = mapped_column(default=300)
+    check_interval: Mapped[int] = mapped_column(default=settings.DEFAULT_CHECK_INTERVAL)
+
+    # Границы адаптивного интервала; если заданы обе, интервал подбирается
+    # по стабильности монитора (см. AdaptiveIntervalPolicy)
+    min_interval: Mapped[int | None] = mapped_column(nullable=True, default=None)
+    max_interval: Mapped[int | None] = mapped_column(nullable=True, default=None)
 
     # Активен ли мониторинг
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # Правила проверки содержимого: [{"kind": "contains", "pattern": "..."}]
+    content_rules: Mapped[list[dict[str, Any]] | None] = mapped_column(
+        JSON, nullable=True, default=None
+    )
+
     # Дата создания записи (автоматически ставится базой данных)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
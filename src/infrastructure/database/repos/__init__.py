@@ -1,6 +1,10 @@
 from .monitors_repo import MonitorRepository
+from .check_results_repo import CheckResultRepository
+from .incidents_repo import IncidentRepository
 
 
 __all__ = [
     "MonitorRepository",
+    "CheckResultRepository",
+    "IncidentRepository",
 ]
@@ -0,0 +1,102 @@
+from typing import Any, AsyncIterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import CheckResultModel
+
+
+class CheckResultRepository:
+    """
+    Репозиторий для работы с таблицей check_results (сырая история проверок).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add_many(self, rows: Sequence[dict[str, Any]]) -> None:
+        """
+        Добавляет результаты цикла одним executemany, без ORM-объектов.
+        """
+        if rows:
+            await self.session.execute(insert(CheckResultModel), list(rows))
+
+    async def stream_results(
+        self,
+        monitor_ids: Sequence[int] | None = None,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[CheckResultModel]:
+        """
+        Потоково отдает результаты в порядке (монитор, время) — для пересборки
+        инцидентов. В памяти одновременно не больше batch_size строк.
+        """
+        stmt = select(CheckResultModel).order_by(
+            CheckResultModel.monitor_id, CheckResultModel.checked_at
+        )
+        if monitor_ids:
+            stmt = stmt.where(CheckResultModel.monitor_id.in_(monitor_ids))
+        result = await self.session.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    async def fetch_batch(
+        self,
+        monitor_ids: Sequence[int] | None,
+        since: datetime | None,
+        after: tuple[int, datetime, int] | None,
+        limit: int,
+    ) -> Sequence[Row[Any]]:
+        """
+        Очередная страница для выгрузки в порядке (монитор, время, id).
+
+        Keyset-пагинация: after — ключ последней строки прошлой страницы,
+        страница начинается строго после него. Без OFFSET стоимость страницы
+        не растет с ее номером, а порядок совпадает с индексом
+        ix_check_results_monitor_time. Возвращает кортежи колонок, а не
+        ORM-объекты.
+        """
+        stmt = (
+            select(
+                CheckResultModel.monitor_id,
+                CheckResultModel.checked_at,
+                CheckResultModel.id,
+                CheckResultModel.is_up,
+                CheckResultModel.status_code,
+                CheckResultModel.response_time_ms,
+                CheckResultModel.redirect_time_ms,
+                CheckResultModel.error_category,
+                CheckResultModel.error,
+            )
+            .order_by(
+                CheckResultModel.monitor_id,
+                CheckResultModel.checked_at,
+                CheckResultModel.id,
+            )
+            .limit(limit)
+        )
+        if monitor_ids is not None:
+            stmt = stmt.where(CheckResultModel.monitor_id.in_(monitor_ids))
+        if since is not None:
+            stmt = stmt.where(CheckResultModel.checked_at >= since)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(
+                    CheckResultModel.monitor_id,
+                    CheckResultModel.checked_at,
+                    CheckResultModel.id,
+                )
+                > tuple_(*after)
+            )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def delete_older_than(self, moment: datetime) -> int:
+        """
+        Удаляет результаты старше moment. Возвращает число удаленных строк.
+        """
+        stmt = delete(CheckResultModel).where(CheckResultModel.checked_at < moment)
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
@@ -0,0 +1,95 @@
+from typing import Sequence
+from datetime import datetime
+
+from sqlalchemy import ScalarSelect, delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database.models import (
+    CheckResultModel,
+    IncidentModel,
+    MonitorModel,
+)
+
+
+class IncidentRepository:
+    """
+    Репозиторий для работы с таблицей incidents.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_open(self, monitor_ids: Sequence[int]) -> dict[int, IncidentModel]:
+        """
+        Незакрытые инциденты по мониторам: {monitor_id: инцидент}.
+        """
+        if not monitor_ids:
+            return {}
+        stmt = select(IncidentModel).where(
+            IncidentModel.ended_at.is_(None),
+            IncidentModel.monitor_id.in_(monitor_ids),
+        )
+        result = await self.session.execute(stmt)
+        return {incident.monitor_id: incident for incident in result.scalars()}
+
+    async def get_user_incidents(
+        self, user_id: int, since: datetime
+    ) -> Sequence[IncidentModel]:
+        """
+        Инциденты мониторов пользователя, пересекающиеся с периодом [since, сейчас].
+        """
+        stmt = (
+            select(IncidentModel)
+            .join(MonitorModel, MonitorModel.id == IncidentModel.monitor_id)
+            .where(
+                MonitorModel.user_id == user_id,
+                or_(IncidentModel.ended_at.is_(None), IncidentModel.ended_at >= since),
+            )
+            .order_by(IncidentModel.monitor_id, IncidentModel.started_at)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_spanning_history_start(
+        self, monitor_ids: Sequence[int] | None = None
+    ) -> dict[int, IncidentModel]:
+        """
+        Инциденты, начавшиеся до самой ранней сохраненной проверки монитора
+        и не закончившиеся к ней: {monitor_id: инцидент}.
+        """
+        first = _first_check_at()
+        stmt = select(IncidentModel).where(
+            IncidentModel.started_at < first,
+            or_(IncidentModel.ended_at.is_(None), IncidentModel.ended_at >= first),
+        )
+        if monitor_ids:
+            stmt = stmt.where(IncidentModel.monitor_id.in_(monitor_ids))
+        result = await self.session.execute(stmt)
+        return {incident.monitor_id: incident for incident in result.scalars()}
+
+    async def delete_within_history(
+        self, monitor_ids: Sequence[int] | None = None
+    ) -> int:
+        """
+        Удаляет инциденты указанных мониторов (всех, если None), начавшиеся
+        не раньше самой ранней сохраненной проверки, — те, что можно
+        пересобрать из check_results. Более старые инциденты (их сырая
+        история уже удалена) не трогаются.
+        """
+        stmt = delete(IncidentModel).where(
+            IncidentModel.started_at >= _first_check_at()
+        )
+        if monitor_ids:
+            stmt = stmt.where(IncidentModel.monitor_id.in_(monitor_ids))
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+
+def _first_check_at() -> ScalarSelect[datetime]:
+    # Время самой ранней сохраненной проверки монитора инцидента
+    # (NULL, если сырой истории нет); берется по ix_check_results_monitor_time
+    return (
+        select(func.min(CheckResultModel.checked_at))
+        .where(CheckResultModel.monitor_id == IncidentModel.monitor_id)
+        .scalar_subquery()
+    )
@@ -1,8 +1,9 @@
-from typing import Sequence
+from typing import Any, Sequence
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.infrastructure.database.models import MonitorModel
 
 
@@ -19,7 +20,8 @@ class MonitorRepository:
         self,
         url: str,
         user_id: int,
-        interval: int = 300,
+        interval: int = settings.DEFAULT_CHECK_INTERVAL,
+        probe_type: str = "http",
     ) -> MonitorModel:
         """
         Добавляет новый монитор в базу данных.
@@ -28,6 +30,7 @@ class MonitorRepository:
             user_id=user_id,
             url=url,
             check_interval=interval,
+            probe_type=probe_type,
             is_active=True,
         )
         self.session.add(monitor)
@@ -46,12 +49,67 @@ class MonitorRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
+    async def get_urls(self, user_id: int | None = None) -> dict[int, str]:
+        """
+        Адреса мониторов {id: url} — пользователя или всех (user_id=None).
+        Только две колонки, без ORM-объектов.
+        """
+        stmt = select(MonitorModel.id, MonitorModel.url)
+        if user_id is not None:
+            stmt = stmt.where(MonitorModel.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return {monitor_id: url for monitor_id, url in result.all()}
+
     async def get_monitor_by_id(self, monitor_id: int) -> MonitorModel | None:
         """
         Получает монитор по ID.
         """
         return await self.session.get(MonitorModel, monitor_id)
 
+    async def get_user_monitor(
+        self, user_id: int, position: int
+    ) -> MonitorModel | None:
+        """
+        Получает монитор пользователя по номеру в списке «Мои сайты» (начиная с 1).
+        """
+        if position < 1:
+            return None
+        stmt = (
+            select(MonitorModel)
+            .where(MonitorModel.user_id == user_id)
+            .order_by(MonitorModel.id)
+            .offset(position - 1)
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def set_content_rules(
+        self, monitor: MonitorModel, rules: list[dict[str, Any]] | None
+    ) -> None:
+        """
+        Заменяет правила проверки содержимого монитора.
+        """
+        monitor.content_rules = rules or None
+        await self.session.flush()
+
+    async def set_interval(
+        self,
+        monitor: MonitorModel,
+        interval: int,
+        max_interval: int | None = None,
+    ) -> None:
+        """
+        Задает фиксированный интервал или, если передан max_interval,
+        границы адаптивного интервала [interval, max_interval].
+        """
+        monitor.check_interval = interval
+        if max_interval is None:
+            monitor.min_interval = monitor.max_interval = None
+        else:
+            monitor.min_interval, monitor.max_interval = interval, max_interval
+        await self.session.flush()
+
     async def delete_monitor(self, monitor_id: int, user_id: int) -> bool:
         """
         Удаляет монитор. Проверяет, что монитор принадлежит пользователю.
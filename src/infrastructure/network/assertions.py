@@ -0,0 +1,212 @@
+import re
+from enum import StrEnum
+from typing import Any, Sequence
+from functools import lru_cache
+from dataclasses import dataclass
+
+
+class RuleKind(StrEnum):
+    CONTAINS = "contains"  # Страница обязана содержать строку
+    ABSENT = "absent"  # Страница не должна содержать строку
+    REGEX = "regex"  # Страница обязана содержать совпадение с регуляркой
+
+
+@dataclass(slots=True, frozen=True)
+class ContentRule:
+    kind: RuleKind
+    pattern: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {"kind": self.kind.value, "pattern": self.pattern}
+
+
+def parse_rules(raw: Sequence[dict[str, Any]] | None) -> tuple[ContentRule, ...]:
+    """Преобразует правила из JSON-колонки монитора; битые записи пропускаются."""
+    rules = []
+    for item in raw or ():
+        try:
+            rules.append(ContentRule(RuleKind(item["kind"]), str(item["pattern"])))
+        except (KeyError, ValueError, TypeError):
+            continue
+    return tuple(rules)
+
+
+def validate_rule(rule: ContentRule) -> str | None:
+    """Возвращает текст ошибки, если правило невалидно, иначе None."""
+    if not rule.pattern:
+        return "пустой шаблон"
+    if rule.kind is RuleKind.REGEX:
+        try:
+            re.compile(rule.pattern.encode())
+        except re.error as e:
+            return str(e)
+    return None
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class _Plan:
+    """Скомпилированный набор правил, переиспользуется между проверками."""
+
+    rules: tuple[ContentRule, ...]
+    # Для каждого правила — regex по байтам
+    patterns: tuple[re.Pattern[bytes], ...]
+    # Общая альтернация по правилам, которые можно искать одним проходом
+    combinable: tuple[int, ...]
+    # Правила, которые приходится искать отдельно (группы/обратные ссылки)
+    separate: tuple[int, ...]
+    overlap: int
+
+
+def _is_combinable(pattern: re.Pattern[bytes]) -> bool:
+    if pattern.groups:
+        return False
+    try:
+        re.compile(b"(?P<r0>%s)" % pattern.pattern)
+    except re.error:
+        return False
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _compile_plan(rules: tuple[ContentRule, ...], regex_window: int) -> _Plan:
+    patterns = []
+    combinable = []
+    separate = []
+    overlap = 0
+
+    for index, rule in enumerate(rules):
+        if rule.kind is RuleKind.REGEX:
+            pattern = re.compile(rule.pattern.encode())
+            overlap = max(overlap, regex_window)
+        else:
+            literal = rule.pattern.encode()
+            pattern = re.compile(re.escape(literal))
+            overlap = max(overlap, len(literal) - 1)
+        patterns.append(pattern)
+        # Группы в пользовательской регулярке сломают нумерацию в общей
+        # альтернации, а глобальные флаги вида (?i) в ней недопустимы
+        (combinable if _is_combinable(pattern) else separate).append(index)
+
+    return _Plan(
+        rules=rules,
+        patterns=tuple(patterns),
+        combinable=tuple(combinable),
+        separate=tuple(separate),
+        overlap=overlap,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _alternation(plan: _Plan, pending: frozenset[int]) -> re.Pattern[bytes] | None:
+    indexes = [i for i in plan.combinable if i in pending]
+    if not indexes:
+        return None
+    return re.compile(
+        b"|".join(b"(?P<r%d>%s)" % (i, plan.patterns[i].pattern) for i in indexes)
+    )
+
+
+class ContentScanner:
+    """
+    Потоковая проверка содержимого ответа.
+
+    Тело подается кусками через feed(); все правила ищутся за один проход
+    общей регуляркой-альтернацией. Между кусками хранится только хвост
+    длиной в самый длинный шаблон (или regex_window для регулярок), поэтому
+    память не зависит от размера страницы. feed() возвращает True, как
+    только вердикт известен, — дальше тело можно не читать.
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[ContentRule],
+        max_bytes: int = 1024 * 1024,
+        regex_window: int = 1024,
+    ) -> None:
+        self._plan = _compile_plan(tuple(rules), regex_window)
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self._pending = frozenset(range(len(self._plan.rules)))
+        self._required_left = sum(
+            1 for rule in self._plan.rules if rule.kind is not RuleKind.ABSENT
+        )
+        self._has_absent = self._required_left < len(self._plan.rules)
+        self._tail = b""
+        self._violation: ContentRule | None = None
+        self._finished = False
+
+    @property
+    def done(self) -> bool:
+        return self._finished or self._violation is not None or self._all_satisfied
+
+    @property
+    def _all_satisfied(self) -> bool:
+        # Если есть запрещенные строки, «всё найдено» не означает конца:
+        # отсутствие можно подтвердить только дочитав тело (или до лимита)
+        return not self._required_left and not self._has_absent
+
+    def feed(self, chunk: bytes) -> bool:
+        """Обрабатывает очередной кусок тела. Возвращает True, если вердикт готов."""
+        if self.done:
+            return True
+
+        budget = self.max_bytes - self.bytes_read
+        if len(chunk) >= budget:
+            chunk = chunk[:budget]
+            self._finished = True
+        self.bytes_read += len(chunk)
+
+        buffer = self._tail + chunk
+        self._scan(buffer)
+
+        overlap = self._plan.overlap
+        self._tail = buffer[-overlap:] if overlap else b""
+        return self.done
+
+    def finish(self) -> None:
+        """Отмечает конец тела: дальнейших данных не будет."""
+        self._finished = True
+
+    def verdict(self) -> tuple[bool, str | None]:
+        """Итог проверки: (успех, причина неудачи)."""
+        if self._violation is not None:
+            return False, f"найдено запрещенное «{self._violation.pattern}»"
+
+        missing = [
+            self._plan.rules[i]
+            for i in sorted(self._pending)
+            if self._plan.rules[i].kind is not RuleKind.ABSENT
+        ]
+        if missing:
+            where = (
+                f"в первых {self.bytes_read} байт"
+                if self.bytes_read >= self.max_bytes
+                else "в ответе"
+            )
+            return False, f"не найдено «{missing[0].pattern}» {where}"
+        return True, None
+
+    def _resolve(self, index: int) -> None:
+        self._pending = self._pending - {index}
+        rule = self._plan.rules[index]
+        if rule.kind is RuleKind.ABSENT:
+            self._violation = rule
+        else:
+            self._required_left -= 1
+
+    def _scan(self, buffer: bytes) -> None:
+        # Общая альтернация находит самое левое совпадение; найденное правило
+        # исключается, и поиск повторяется, чтобы перекрывающиеся шаблоны
+        # не маскировали друг друга
+        while self._violation is None:
+            regex = _alternation(self._plan, self._pending)
+            match = regex.search(buffer) if regex is not None else None
+            if match is None or match.lastgroup is None:
+                break
+            self._resolve(int(match.lastgroup[1:]))
+
+        for index in self._plan.separate:
+            if self._violation is not None:
+                return
+            if index in self._pending and self._plan.patterns[index].search(buffer):
+                self._resolve(index)
@@ -0,0 +1,58 @@
+from typing import Iterator
+from datetime import datetime, timezone
+
+
+# Теги DER, которые встречаются на пути до срока действия
+_UTC_TIME = 0x17
+_GENERALIZED_TIME = 0x18
+_EXPLICIT_VERSION = 0xA0  # [0] EXPLICIT Version в TBSCertificate
+
+
+def _read(data: bytes, pos: int) -> tuple[int, int, int]:
+    """Элемент DER с позиции pos: (тег, начало содержимого, конец содержимого)."""
+    tag = data[pos]
+    length = data[pos + 1]
+    pos += 2
+    if length & 0x80:
+        size = length & 0x7F
+        length = int.from_bytes(data[pos : pos + size], "big")
+        pos += size
+    if pos + length > len(data):
+        raise ValueError("Обрезанный DER")
+    return tag, pos, pos + length
+
+
+def _children(data: bytes, start: int, end: int) -> Iterator[tuple[int, int, int]]:
+    pos = start
+    while pos < end:
+        item = _read(data, pos)
+        yield item
+        pos = item[2]
+
+
+def certificate_not_after(der: bytes) -> datetime | None:
+    """
+    Срок действия (notAfter) из сертификата в DER.
+
+    Нужен для соединений без проверки цепочки (CERT_NONE): там
+    getpeercert() возвращает пустой словарь, а getpeercert(binary_form=True) —
+    сам сертификат. Разбирается только путь
+    Certificate → TBSCertificate → Validity (RFC 5280), без внешних
+    зависимостей. None — сертификат не удалось разобрать.
+    """
+    try:
+        _, start, end = _read(der, 0)
+        _, start, end = _read(der, start)  # TBSCertificate
+        fields = list(_children(der, start, end))
+        if fields and fields[0][0] == _EXPLICIT_VERSION:
+            fields = fields[1:]
+        # serialNumber, signature, issuer, validity, ...
+        _, start, end = fields[3]
+        _, (tag, start, end) = _children(der, start, end)
+        if tag not in (_UTC_TIME, _GENERALIZED_TIME):
+            return None
+        value = der[start:end].decode("ascii")
+        fmt = "%y%m%d%H%M%SZ" if tag == _UTC_TIME else "%Y%m%d%H%M%SZ"
+        return datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+    except (IndexError, ValueError):
+        return None
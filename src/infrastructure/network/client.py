@@ -3,9 +3,32 @@ import time
 import asyncio
 import aiohttp
 
-from typing import Final
+from enum import IntEnum, StrEnum
+from typing import Final, Sequence
 from datetime import datetime, timezone
 from dataclasses import dataclass
+from urllib.parse import urljoin, urlsplit
+
+from src.infrastructure.network.assertions import ContentRule, ContentScanner
+from src.infrastructure.network.certificates import certificate_not_after
+from src.infrastructure.network.redirects import RedirectCache, RedirectChain
+from src.infrastructure.network.validators import ConditionalCache
+
+
+class ErrorCategory(IntEnum):
+    """
+    Категория сбоя проверки.
+    Компактный числовой код (помещается в байт) для хранения истории.
+    """
+
+    NONE = 0
+    TIMEOUT = 1
+    CONNECTION = 2
+    DNS = 3
+    SSL = 4
+    HTTP_STATUS = 5
+    CONTENT = 6
+    OTHER = 255
 
 
 @dataclass(slots=True)
@@ -15,8 +38,50 @@ class CheckResult:
     status_code: int | None = None
     response_time_ms: int = 0
     error: str | None = None
+    error_category: ErrorCategory = ErrorCategory.NONE
     ssl_expires_at: datetime | None = None
     ssl_days_left: int | None = None
+    bytes_read: int = 0
+    redirects: int = 0  # Редиректов до конечного адреса
+    # Время на редиректы; полное время проверки — response_time_ms + redirect_time_ms
+    redirect_time_ms: int = 0
+
+
+class ProbeType(StrEnum):
+    """Тип проверки монитора (колонка monitors.probe_type)."""
+
+    HTTP = "http"  # GET по http(s)://
+    TCP = "tcp"  # TCP connect (+ чтение баннера): tcp://host:port
+    DNS = "dns"  # Резолв имени (+ ожидаемые записи): dns://host
+    TLS = "tls"  # Только TLS-рукопожатие: tls://host[:port]
+
+
+_CERT_TIME_FMT: Final[str] = "%b %d %H:%M:%S %Y %Z"
+
+# Сбои конечного адреса, после которых цепочка редиректов проходится заново
+_CHAIN_BROKEN: Final[frozenset[ErrorCategory]] = frozenset(
+    {ErrorCategory.CONNECTION, ErrorCategory.DNS, ErrorCategory.SSL}
+)
+
+
+def apply_certificate(result: CheckResult, ssl_object: ssl.SSLObject) -> None:
+    """
+    Заполняет срок действия SSL сертификата соединения.
+    Без проверки цепочки (CERT_NONE) getpeercert() пуст, и срок
+    читается из DER-формы сертификата.
+    """
+    cert = ssl_object.getpeercert()
+    if cert and cert.get("notAfter"):
+        expires_at = datetime.strptime(cert["notAfter"], _CERT_TIME_FMT).replace(
+            tzinfo=timezone.utc
+        )
+    else:
+        der = ssl_object.getpeercert(binary_form=True)
+        expires_at = certificate_not_after(der) if der else None
+    if expires_at is None:
+        return
+    result.ssl_expires_at = expires_at
+    result.ssl_days_left = (expires_at - datetime.now(timezone.utc)).days
 
 
 class NetworkClient:
@@ -25,10 +90,27 @@ class NetworkClient:
     и получения информации об SSL сертификатах.
     """
 
-    _CERT_TIME_FMT: Final[str] = "%b %d %H:%M:%S %Y %Z"
+    _CHUNK_SIZE: Final[int] = 16 * 1024
+    _REDIRECT_STATUSES: Final[frozenset[int]] = frozenset({301, 302, 303, 307, 308})
+    _MAX_REDIRECTS: Final[int] = 10
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        content_max_bytes: int = 1024 * 1024,
+        content_regex_window: int = 1024,
+        redirect_max_age: float = 60 * 60,
+    ) -> None:
+        self.timeout = timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self.content_max_bytes = content_max_bytes
+        self.content_regex_window = content_regex_window
+        self.redirects = RedirectCache(max_age=redirect_max_age)
+        self.validators = ConditionalCache()
 
-    def __init__(self, timeout: int = 10) -> None:
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # Контекст с полной проверкой цепочки и имени для TLS-проверок;
+        # создание дорогое (загрузка корневых сертификатов), поэтому один на клиент
+        self.tls_context = ssl.create_default_context()
 
         ssl_context = ssl.create_default_context()
         ssl_context.check_hostname = False
@@ -43,45 +125,278 @@ class NetworkClient:
         await self._session.close()
         await self._connector.close()
 
-    async def check_url(self, url: str) -> CheckResult:
+    async def probe(
+        self,
+        probe_type: str,
+        target: str,
+        rules: Sequence[ContentRule] | None = None,
+    ) -> CheckResult:
+        """Выполняет проверку нужного типа; результат всегда CheckResult."""
+        if probe_type == ProbeType.HTTP:
+            return await self.check_url(target, rules)
+        if probe_type == ProbeType.TCP:
+            return await self.check_tcp(target, rules)
+        if probe_type == ProbeType.DNS:
+            return await self.check_dns(target, rules)
+        if probe_type == ProbeType.TLS:
+            return await self.check_tls(target)
+        return CheckResult(
+            url=target,
+            error=f"Неизвестный тип проверки: {probe_type}",
+            error_category=ErrorCategory.OTHER,
+        )
+
+    async def check_tcp(
+        self, target: str, rules: Sequence[ContentRule] | None = None
+    ) -> CheckResult:
+        """TCP connect; при наличии rules читает и проверяет баннер сервиса."""
+        from src.infrastructure.network import probes
+
+        return await probes.check_tcp(self, target, rules)
+
+    async def check_dns(
+        self, target: str, rules: Sequence[ContentRule] | None = None
+    ) -> CheckResult:
+        """Резолв имени; rules проверяются по списку полученных адресов."""
+        from src.infrastructure.network import probes
+
+        return await probes.check_dns(self, target, rules)
+
+    async def check_tls(self, target: str) -> CheckResult:
+        """TLS-рукопожатие с проверкой сертификата, без HTTP-запроса."""
+        from src.infrastructure.network import probes
+
+        return await probes.check_tls(self, target)
+
+    async def check_url(
+        self, url: str, rules: Sequence[ContentRule] | None = None
+    ) -> CheckResult:
+        """
+        Проверяет URL; при наличии rules потоково сканирует тело ответа.
+
+        Редиректы проходятся вручную: так их время замеряется отдельно,
+        а конечный адрес запоминается, и следующие проверки идут сразу
+        на него. response_time_ms — время ответа конечного адреса,
+        redirect_time_ms — время на редиректы (при проверке по кэшу —
+        замеренное при последнем проходе цепочки). Таймаут общий на всю
+        проверку, как и раньше.
+        """
+        deadline = time.monotonic() + self.timeout
+        chain = self.redirects.get(url)
+        if chain is not None:
+            result, location = await self._request(
+                url, chain.final_url, rules, deadline
+            )
+            if location is None and result.error_category not in _CHAIN_BROKEN:
+                # Ответ конечного адреса — это и есть результат проверки,
+                # в том числе 5xx, таймаут или несовпадение содержимого:
+                # повторный проход цепочки пришел бы к тому же адресу
+                self.redirects.hit(chain)
+                result.redirects = len(chain.hops)
+                result.redirect_time_ms = chain.chain_ms
+                return result
+
+            # Конечный адрес сам стал редиректом или недостижим
+            # (соединение, DNS, SSL): цепочка могла измениться
+            self.redirects.invalidate(url)
+
+        return await self._follow(url, rules, deadline)
+
+    async def _follow(
+        self,
+        url: str,
+        rules: Sequence[ContentRule] | None,
+        deadline: float,
+    ) -> CheckResult:
+        """Проходит цепочку редиректов целиком и запоминает конечный адрес."""
+        hops: list[str] = []
+        chain_ms = 0
+        target = url
+        while True:
+            result, location = await self._request(url, target, rules, deadline)
+            if location is None:
+                break
+            if len(hops) >= self._MAX_REDIRECTS:
+                result.is_up = False
+                result.error = "Too many redirects"
+                result.error_category = ErrorCategory.CONNECTION
+                break
+            hops.append(target)
+            chain_ms += result.response_time_ms
+            target = location
+
+        result.redirects = len(hops)
+        result.redirect_time_ms = chain_ms
+        if hops and result.is_up:
+            self.redirects.put(
+                url,
+                RedirectChain(
+                    final_url=target,
+                    hops=tuple(hops),
+                    chain_ms=chain_ms,
+                    validated_at=time.monotonic(),
+                ),
+            )
+        return result
+
+    async def _request(
+        self,
+        url: str,
+        target: str,
+        rules: Sequence[ContentRule] | None,
+        deadline: float,
+        conditional: bool = True,
+    ) -> tuple[CheckResult, str | None]:
+        """
+        Один GET без следования редиректам.
+        Возвращает результат и адрес редиректа (None — ответ конечный).
+        conditional=False — без валидаторов, даже если они сохранены.
+        """
         result = CheckResult(url=url)
+        location = None
+        refetch = False
         start_time = time.perf_counter()
 
         try:
-            # Используем GET, чтобы получить и заголовки, и тело
-            async with self._session.get(url) as response:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError
+
+            # Используем GET, чтобы получить и заголовки, и тело.
+            # Тело нужно только для правил, поэтому и условный запрос — только с ними
+            async with self._session.get(
+                target,
+                allow_redirects=False,
+                headers=(
+                    self.validators.headers(target, rules)
+                    if rules and conditional
+                    else None
+                ),
+                timeout=aiohttp.ClientTimeout(total=remaining),
+            ) as response:
                 result.status_code = response.status
                 # Считаем сайт живым, если код < 500
                 result.is_up = 200 <= response.status < 500
+                if not result.is_up:
+                    result.error_category = ErrorCategory.HTTP_STATUS
 
-                # Извлечение SSL сертификата
-                if (
-                    url.startswith("https://")
-                    and response.connection
-                    and response.connection.transport
-                ):
-                    ssl_object = response.connection.transport.get_extra_info(
-                        "ssl_object"
+                location = self._redirect_location(response)
+                if location is None:
+                    # Извлечение SSL сертификата
+                    ssl_object = (
+                        self._ssl_object(response)
+                        if target.startswith("https://")
+                        else None
                     )
                     if ssl_object:
-                        cert = ssl_object.getpeercert(binary_form=False)
-                        not_after = cert.get("notAfter") if cert else None
-                        if not_after:
-                            expires_at = datetime.strptime(
-                                not_after, self._CERT_TIME_FMT
-                            ).replace(tzinfo=timezone.utc)
-                            result.ssl_expires_at = expires_at
-                            result.ssl_days_left = (
-                                expires_at - datetime.now(timezone.utc)
-                            ).days
+                        apply_certificate(result, ssl_object)
+
+                    if rules and response.status == 304:
+                        # Страница не менялась: тело не качаем, вердикт прежний
+                        cached = self.validators.reuse(target, rules)
+                        if cached is not None:
+                            result.status_code = cached.status_code
+                            self._apply_verdict(result, cached.ok, cached.reason)
+                        elif conditional:
+                            # Вердикта нет (вытеснен, сменились правила, 304
+                            # без условного запроса): запрашиваем тело заново
+                            refetch = True
+                        else:
+                            self._apply_verdict(
+                                result, False, "304 без тела на обычный запрос"
+                            )
+                    # Проверка содержимого имеет смысл, только если сайт ответил
+                    elif rules and result.is_up:
+                        ok, reason = await self._check_content(response, rules, result)
+                        if response.status == 200:
+                            self.validators.remember(
+                                target,
+                                response.headers,
+                                response.status,
+                                rules,
+                                ok,
+                                reason,
+                                result.bytes_read,
+                            )
 
         except asyncio.TimeoutError:
             result.error = "Connection timed out"
+            result.error_category = ErrorCategory.TIMEOUT
+        except aiohttp.ClientConnectorDNSError as e:
+            result.error = str(e)
+            result.error_category = ErrorCategory.DNS
+        except (aiohttp.ClientSSLError, ssl.SSLError) as e:
+            result.error = str(e)
+            result.error_category = ErrorCategory.SSL
         except aiohttp.ClientError as e:
             result.error = str(e)
+            result.error_category = ErrorCategory.CONNECTION
         except Exception as e:
             result.error = str(e)
+            result.error_category = ErrorCategory.OTHER
         finally:
             result.response_time_ms = int((time.perf_counter() - start_time) * 1000)
 
-        return result
+        if refetch:
+            return await self._request(url, target, rules, deadline, conditional=False)
+        return result, location
+
+    @staticmethod
+    def _ssl_object(response: aiohttp.ClientResponse) -> ssl.SSLObject | None:
+        # Короткий ответ приходит вместе с заголовками, и соединение сразу
+        # уходит обратно в пул (response.connection уже None), но протокол
+        # ответа еще держит транспорт — берем сертификат через него
+        connection = response.connection
+        protocol = (
+            connection.protocol if connection else getattr(response, "_protocol", None)
+        )
+        # Протокол — очередь данных: пустой он ложен, поэтому «is not None»
+        transport = protocol.transport if protocol is not None else None
+        if transport is None:
+            return None
+        return transport.get_extra_info("ssl_object")
+
+    def _redirect_location(self, response: aiohttp.ClientResponse) -> str | None:
+        """Абсолютный адрес редиректа; None — ответ не редирект (или не на http)."""
+        if response.status not in self._REDIRECT_STATUSES:
+            return None
+        location = response.headers.get("Location")
+        if not location:
+            return None
+        absolute = urljoin(str(response.url), location)
+        if urlsplit(absolute).scheme not in {"http", "https"}:
+            return None
+        return absolute
+
+    async def _check_content(
+        self,
+        response: aiohttp.ClientResponse,
+        rules: Sequence[ContentRule],
+        result: CheckResult,
+    ) -> tuple[bool, str | None]:
+        """
+        Читает тело кусками, пока не станет известен вердикт или не исчерпан лимит.
+        В памяти одновременно держится только текущий кусок и короткий хвост.
+        Возвращает вердикт (успех, причина неудачи).
+        """
+        scanner = ContentScanner(
+            rules,
+            max_bytes=self.content_max_bytes,
+            regex_window=self.content_regex_window,
+        )
+        async for chunk in response.content.iter_chunked(self._CHUNK_SIZE):
+            if scanner.feed(chunk):
+                break
+        scanner.finish()
+
+        result.bytes_read = scanner.bytes_read
+        ok, reason = scanner.verdict()
+        self._apply_verdict(result, ok, reason)
+        return ok, reason
+
+    @staticmethod
+    def _apply_verdict(result: CheckResult, ok: bool, reason: str | None) -> None:
+        if not ok:
+            result.is_up = False
+            result.error = f"Проверка содержимого: {reason}"
+            result.error_category = ErrorCategory.CONTENT
@@ -0,0 +1,207 @@
+import ssl
+import time
+import socket
+import asyncio
+from typing import TYPE_CHECKING, Sequence
+from urllib.parse import urlsplit
+
+from src.infrastructure.network.assertions import ContentRule, ContentScanner
+from src.infrastructure.network.client import (
+    CheckResult,
+    ErrorCategory,
+    apply_certificate,
+)
+
+if TYPE_CHECKING:
+    from src.infrastructure.network.client import NetworkClient
+
+
+# Сколько ждать баннер после успешного connect (часть общего таймаута)
+_BANNER_TIMEOUT: float = 3.0
+_BANNER_CHUNK: int = 4096
+_DEFAULT_TLS_PORT: int = 443
+
+
+def _split_target(target: str, default_port: int | None = None) -> tuple[str, int]:
+    """Разбирает tcp://host:port, tls://host[:port] или dns://host."""
+    parts = urlsplit(target if "://" in target else f"tcp://{target}")
+    if not parts.hostname:
+        raise ValueError(f"Не указан хост: {target}")
+    port = parts.port or default_port
+    if port is None:
+        raise ValueError(f"Не указан порт: {target}")
+    return parts.hostname, port
+
+
+def _elapsed_ms(start_time: float) -> int:
+    return int((time.perf_counter() - start_time) * 1000)
+
+
+def _fail(result: CheckResult, error: str, category: ErrorCategory) -> None:
+    result.is_up = False
+    result.error = error
+    result.error_category = category
+
+
+def _apply_scan(result: CheckResult, scanner: ContentScanner, what: str) -> None:
+    result.bytes_read = scanner.bytes_read
+    ok, reason = scanner.verdict()
+    if not ok:
+        _fail(result, f"Проверка {what}: {reason}", ErrorCategory.CONTENT)
+
+
+def _new_scanner(
+    client: "NetworkClient", rules: Sequence[ContentRule]
+) -> ContentScanner:
+    return ContentScanner(
+        rules,
+        max_bytes=client.content_max_bytes,
+        regex_window=client.content_regex_window,
+    )
+
+
+def _classify(result: CheckResult, error: BaseException) -> None:
+    if isinstance(error, asyncio.TimeoutError):
+        _fail(result, "Connection timed out", ErrorCategory.TIMEOUT)
+    elif isinstance(error, socket.gaierror):
+        _fail(result, str(error), ErrorCategory.DNS)
+    elif isinstance(error, ssl.SSLError):
+        _fail(result, str(error), ErrorCategory.SSL)
+    elif isinstance(error, OSError):
+        _fail(result, str(error) or type(error).__name__, ErrorCategory.CONNECTION)
+    else:
+        _fail(result, str(error), ErrorCategory.OTHER)
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except (OSError, ssl.SSLError):
+        pass
+
+
+async def check_tcp(
+    client: "NetworkClient", target: str, rules: Sequence[ContentRule] | None
+) -> CheckResult:
+    """
+    Проверка TCP-порта.
+    Время ответа — время установки соединения. Если заданы правила,
+    читается баннер (SSH, SMTP, FTP и т.п.) до вердикта или таймаута.
+    """
+    result = CheckResult(url=target)
+    start_time = time.perf_counter()
+
+    try:
+        host, port = _split_target(target)
+    except ValueError as e:
+        _fail(result, str(e), ErrorCategory.OTHER)
+        return result
+
+    try:
+        async with asyncio.timeout(client.timeout):
+            reader, writer = await asyncio.open_connection(host, port)
+        result.response_time_ms = _elapsed_ms(start_time)
+        result.is_up = True
+
+        try:
+            if rules:
+                scanner = _new_scanner(client, rules)
+                try:
+                    async with asyncio.timeout(min(_BANNER_TIMEOUT, client.timeout)):
+                        while chunk := await reader.read(_BANNER_CHUNK):
+                            if scanner.feed(chunk):
+                                break
+                except asyncio.TimeoutError:
+                    # Сервис молчит: проверяем то, что успели получить
+                    pass
+                scanner.finish()
+                _apply_scan(result, scanner, "баннера")
+        finally:
+            await _close(writer)
+
+    except Exception as e:
+        _classify(result, e)
+        # Ответа не было: время до ошибки (таймаута, отказа в соединении)
+        if not result.response_time_ms:
+            result.response_time_ms = _elapsed_ms(start_time)
+
+    return result
+
+
+async def check_dns(
+    client: "NetworkClient", target: str, rules: Sequence[ContentRule] | None
+) -> CheckResult:
+    """
+    Проверка DNS-резолва имени.
+    Правила применяются к списку адресов (по одному на строку),
+    например contains 93.184.216.34.
+    """
+    result = CheckResult(url=target)
+    start_time = time.perf_counter()
+
+    try:
+        host = urlsplit(target if "://" in target else f"dns://{target}").hostname
+    except ValueError:
+        host = None
+    if not host:
+        _fail(result, f"Не указан хост: {target}", ErrorCategory.OTHER)
+        return result
+
+    try:
+        loop = asyncio.get_running_loop()
+        async with asyncio.timeout(client.timeout):
+            infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        result.response_time_ms = _elapsed_ms(start_time)
+
+        addresses = sorted({str(info[4][0]) for info in infos})
+        result.is_up = bool(addresses)
+        if not addresses:
+            _fail(result, "Пустой ответ DNS", ErrorCategory.DNS)
+        elif rules:
+            scanner = _new_scanner(client, rules)
+            scanner.feed("\n".join(addresses).encode())
+            scanner.finish()
+            _apply_scan(result, scanner, "DNS")
+
+    except Exception as e:
+        _classify(result, e)
+        if not result.response_time_ms:
+            result.response_time_ms = _elapsed_ms(start_time)
+
+    return result
+
+
+async def check_tls(client: "NetworkClient", target: str) -> CheckResult:
+    """
+    Проверка TLS без HTTP-запроса: соединение, рукопожатие с полной
+    проверкой цепочки и имени, срок действия сертификата.
+    """
+    result = CheckResult(url=target)
+    start_time = time.perf_counter()
+
+    try:
+        host, port = _split_target(target, default_port=_DEFAULT_TLS_PORT)
+    except ValueError as e:
+        _fail(result, str(e), ErrorCategory.OTHER)
+        return result
+
+    try:
+        async with asyncio.timeout(client.timeout):
+            _, writer = await asyncio.open_connection(
+                host, port, ssl=client.tls_context, server_hostname=host
+            )
+        result.response_time_ms = _elapsed_ms(start_time)
+        result.is_up = True
+
+        ssl_object = writer.get_extra_info("ssl_object")
+        if ssl_object:
+            apply_certificate(result, ssl_object)
+        await _close(writer)
+
+    except Exception as e:
+        _classify(result, e)
+        if not result.response_time_ms:
+            result.response_time_ms = _elapsed_ms(start_time)
+
+    return result
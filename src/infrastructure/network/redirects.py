@@ -0,0 +1,82 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class RedirectChain:
+    """Разрешенная цепочка редиректов адреса монитора."""
+
+    final_url: str
+    hops: tuple[str, ...]  # Адреса, ответившие редиректом, начиная с исходного
+    chain_ms: int  # Время на редиректы при последней проверке цепочки
+    validated_at: float  # time.monotonic() проверки цепочки
+
+
+@dataclass(slots=True, frozen=True)
+class RedirectStats:
+    cached: int  # Адресов с известной цепочкой
+    hits: int  # Проверок сразу по конечному адресу
+    revalidations: int  # Перепроверок цепочки: по сроку или после сбоя цели
+    hops_skipped: int  # Сэкономленных запросов-редиректов
+
+
+class RedirectCache:
+    """
+    Кэш конечных адресов после редиректов (http→https, apex→www, локали).
+
+    Проверка адреса с известной цепочкой идет сразу по конечному адресу,
+    без промежуточных запросов и лишних TLS-рукопожатий. Цепочка
+    проверяется заново целиком раз в max_age секунд и сразу, если конечный
+    адрес сам стал редиректом или недостижим (соединение, DNS, SSL).
+
+    Ключ — исходный адрес: у мониторов с одинаковым URL цепочка общая.
+    Число записей ограничено max_entries: сверх него вытесняются давно
+    не использовавшиеся (адреса удаленных мониторов).
+    """
+
+    def __init__(self, max_age: float, max_entries: int = 100_000) -> None:
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._chains: dict[str, RedirectChain] = {}
+
+        self.hits = 0
+        self.revalidations = 0
+        self.hops_skipped = 0
+
+    def get(self, url: str, now: float | None = None) -> RedirectChain | None:
+        """Цепочка адреса, если она известна и не устарела."""
+        chain = self._chains.get(url)
+        if chain is None:
+            return None
+        now = time.monotonic() if now is None else now
+        if now - chain.validated_at >= self.max_age:
+            del self._chains[url]
+            self.revalidations += 1
+            return None
+        # Порядок словаря — порядок использования: в начале самые давние
+        self._chains[url] = self._chains.pop(url)
+        return chain
+
+    def hit(self, chain: RedirectChain) -> None:
+        """Учитывает проверку, прошедшую сразу по конечному адресу."""
+        self.hits += 1
+        self.hops_skipped += len(chain.hops)
+
+    def put(self, url: str, chain: RedirectChain) -> None:
+        self._chains.pop(url, None)
+        self._chains[url] = chain
+        while len(self._chains) > self.max_entries:
+            del self._chains[next(iter(self._chains))]
+
+    def invalidate(self, url: str) -> None:
+        """Сбрасывает цепочку: следующая проверка пройдет ее целиком."""
+        if self._chains.pop(url, None) is not None:
+            self.revalidations += 1
+
+    def stats(self) -> RedirectStats:
+        return RedirectStats(
+            cached=len(self._chains),
+            hits=self.hits,
+            revalidations=self.revalidations,
+            hops_skipped=self.hops_skipped,
+        )
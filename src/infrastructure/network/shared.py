@@ -0,0 +1,32 @@
+from src.core.config import settings
+from src.infrastructure.network.client import NetworkClient
+
+
+class SharedNetworkClient:
+    """
+    Один NetworkClient на процесс.
+    Плановые проверки и «проверить сейчас» используют общий пул соединений
+    и DNS-кэш aiohttp. Клиент создается лениво — внутри работающего loop'а.
+    """
+
+    def __init__(self) -> None:
+        self._client: NetworkClient | None = None
+
+    def get(self) -> NetworkClient:
+        if self._client is None:
+            self._client = NetworkClient(
+                timeout=settings.REQUEST_TIMEOUT,
+                content_max_bytes=settings.CONTENT_MAX_BYTES,
+                content_regex_window=settings.CONTENT_REGEX_WINDOW,
+                redirect_max_age=settings.REDIRECT_CACHE_TTL,
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+# Глобальный сетевой клиент
+shared_client = SharedNetworkClient()
@@ -0,0 +1,113 @@
+from typing import Mapping, Sequence
+from dataclasses import dataclass
+
+from src.infrastructure.network.assertions import ContentRule
+
+
+@dataclass(slots=True, frozen=True)
+class CachedVerdict:
+    """Валидаторы последнего полного ответа и вердикт по его содержимому."""
+
+    etag: str | None
+    last_modified: str | None
+    status_code: int  # Код полного ответа: его и показываем вместо 304
+    rules: tuple[ContentRule, ...]  # Правила, по которым получен вердикт
+    ok: bool
+    reason: str | None
+    bytes_read: int  # Сколько тела понадобилось прочитать для вердикта
+
+
+@dataclass(slots=True, frozen=True)
+class ConditionalStats:
+    cached: int  # Адресов с сохраненными валидаторами
+    conditional: int  # Отправлено условных запросов
+    not_modified: int  # Из них получено 304
+    bytes_saved: int  # Не скачано байт тела благодаря 304
+
+
+class ConditionalCache:
+    """
+    Валидаторы (ETag, Last-Modified) страниц, содержимое которых проверяется.
+
+    Проверка такой страницы отправляет If-None-Match / If-Modified-Since;
+    на 304 тело не скачивается и не сканируется, а берется сохраненный
+    вердикт вместе с кодом полного ответа — в истории и /stats страница,
+    которая не менялась, выглядит так же, как при последней загрузке.
+    Вердикт привязан к набору правил: после /expect страница сканируется
+    заново. Для мониторов без правил тело и так не читается, поэтому
+    условные запросы им не нужны.
+
+    Ключ — адрес запроса (конечный, после редиректов). Число записей
+    ограничено max_entries: сверх него вытесняются самые старые.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._verdicts: dict[str, CachedVerdict] = {}
+
+        self.conditional = 0
+        self.not_modified = 0
+        self.bytes_saved = 0
+
+    def headers(self, url: str, rules: Sequence[ContentRule]) -> dict[str, str]:
+        """Заголовки условного запроса; пустой словарь — запрос обычный."""
+        verdict = self._get(url, rules)
+        if verdict is None:
+            return {}
+        headers = {}
+        if verdict.etag:
+            headers["If-None-Match"] = verdict.etag
+        if verdict.last_modified:
+            headers["If-Modified-Since"] = verdict.last_modified
+        self.conditional += 1
+        return headers
+
+    def reuse(self, url: str, rules: Sequence[ContentRule]) -> CachedVerdict | None:
+        """Вердикт для ответа 304; учитывает сэкономленные байты."""
+        verdict = self._get(url, rules)
+        if verdict is not None:
+            self.not_modified += 1
+            self.bytes_saved += verdict.bytes_read
+        return verdict
+
+    def remember(
+        self,
+        url: str,
+        headers: Mapping[str, str],
+        status_code: int,
+        rules: Sequence[ContentRule],
+        ok: bool,
+        reason: str | None,
+        bytes_read: int,
+    ) -> None:
+        """Сохраняет вердикт полного ответа, если сервер отдал валидаторы."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        self._verdicts.pop(url, None)
+        if not etag and not last_modified:
+            return
+        self._verdicts[url] = CachedVerdict(
+            etag=etag,
+            last_modified=last_modified,
+            status_code=status_code,
+            rules=tuple(rules),
+            ok=ok,
+            reason=reason,
+            bytes_read=bytes_read,
+        )
+        while len(self._verdicts) > self.max_entries:
+            del self._verdicts[next(iter(self._verdicts))]
+
+    def stats(self) -> ConditionalStats:
+        return ConditionalStats(
+            cached=len(self._verdicts),
+            conditional=self.conditional,
+            not_modified=self.not_modified,
+            bytes_saved=self.bytes_saved,
+        )
+
+    def _get(self, url: str, rules: Sequence[ContentRule]) -> CachedVerdict | None:
+        verdict = self._verdicts.get(url)
+        if verdict is None or verdict.rules != tuple(rules):
+            return None
+        return verdict
@@ -0,0 +1,259 @@
+from typing import Any, Iterable
+from dataclasses import astuple, dataclass
+
+from src.core.config import settings
+from src.infrastructure.database.models import MonitorModel
+from src.infrastructure.network.client import CheckResult
+
+
+@dataclass(slots=True)
+class MonitorState:
+    """Состояние расписания одного монитора (в памяти процесса)."""
+
+    interval: int
+    next_due: float = 0.0  # unix-время следующей проверки; 0 — проверить сразу
+    ok_streak: int = 0  # Успешных проверок подряд
+    latency_ewma: float | None = None  # Сглаженное время ответа, мс
+    is_up: bool | None = None  # Статус последней проверки; None — еще не проверялся
+    ssl_alert_days: int | None = None  # Остаток дней в последнем SSL-алерте
+
+
+@dataclass(slots=True, frozen=True)
+class ScheduleStats:
+    monitors: int
+    performed: int  # Выполнено проверок
+    baseline: float  # Сколько было бы при проверке каждого монитора с его минимумом
+
+    @property
+    def saved(self) -> int:
+        return max(0, round(self.baseline - self.performed))
+
+    @property
+    def saved_percent(self) -> float:
+        return 100.0 * self.saved / self.baseline if self.baseline else 0.0
+
+
+class AdaptiveIntervalPolicy:
+    """
+    Правило пересчета интервала после проверки.
+
+    Сбой или всплеск задержки сразу возвращают монитор к минимальному
+    интервалу. После stable_checks успешных проверок подряд интервал
+    растягивается в growth раз на каждой следующей успешной проверке,
+    но не выше максимума.
+    """
+
+    def __init__(
+        self,
+        stable_checks: int = 10,
+        growth: float = 1.5,
+        latency_spike: float = 3.0,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        self.stable_checks = stable_checks
+        self.growth = growth
+        self.latency_spike = latency_spike
+        self.ewma_alpha = ewma_alpha
+
+    def next_interval(
+        self,
+        state: MonitorState,
+        result: CheckResult,
+        min_interval: int,
+        max_interval: int,
+    ) -> int:
+        latency = result.response_time_ms
+        spike = (
+            state.latency_ewma is not None
+            and state.latency_ewma > 0
+            and latency > state.latency_ewma * self.latency_spike
+        )
+
+        if result.is_up:
+            # Всплески не подмешиваем в среднее, иначе оно быстро «привыкает»
+            if state.latency_ewma is None:
+                state.latency_ewma = float(latency)
+            elif not spike:
+                state.latency_ewma += self.ewma_alpha * (latency - state.latency_ewma)
+
+        if not result.is_up or spike:
+            state.ok_streak = 0
+            return min_interval
+
+        state.ok_streak += 1
+        if state.ok_streak < self.stable_checks:
+            return max(min_interval, min(state.interval, max_interval))
+        return max(min_interval, min(int(state.interval * self.growth), max_interval))
+
+
+class CheckSchedule:
+    """
+    Расписание проверок поверх тика планировщика.
+
+    Цикл мониторинга запускается раз в SCHEDULER_TICK секунд и проверяет
+    только мониторы, чей срок наступил. Монитор с фиксированным интервалом
+    проверяется раз в check_interval; монитор с заданными границами
+    min_interval/max_interval — по AdaptiveIntervalPolicy.
+    """
+
+    def __init__(
+        self, policy: AdaptiveIntervalPolicy, tick: int, catchup_ticks: int = 5
+    ) -> None:
+        self.policy = policy
+        self.tick = tick
+        self.catchup_ticks = catchup_ticks
+        self._states: dict[int, MonitorState] = {}
+        self.performed = 0
+        self.baseline = 0.0
+
+    def bounds(self, monitor: MonitorModel) -> tuple[int, int]:
+        """Границы интервала монитора; для фиксированного они совпадают."""
+        if monitor.min_interval and monitor.max_interval:
+            low, high = monitor.min_interval, monitor.max_interval
+        else:
+            low = high = monitor.check_interval
+        low = max(low, self.tick)
+        return low, max(low, high)
+
+    @staticmethod
+    def is_adaptive(monitor: MonitorModel) -> bool:
+        return bool(
+            monitor.min_interval
+            and monitor.max_interval
+            and monitor.min_interval < monitor.max_interval
+        )
+
+    def get(self, monitor_id: int) -> MonitorState | None:
+        return self._states.get(monitor_id)
+
+    def current_interval(self, monitor: MonitorModel) -> int:
+        low, high = self.bounds(monitor)
+        state = self._states.get(monitor.id)
+        return low if state is None else max(low, min(state.interval, high))
+
+    def is_due(self, monitor: MonitorModel, now: float) -> bool:
+        state = self._states.get(monitor.id)
+        # Срок сравнивается с запасом в полтика: цикл может стартовать
+        # чуть раньше, и тогда проверка ушла бы на целый тик позже
+        return state is None or state.next_due <= now + self.tick / 2
+
+    def record(self, monitor: MonitorModel, result: CheckResult, now: float) -> int:
+        """Учитывает результат проверки и возвращает новый интервал."""
+        low, high = self.bounds(monitor)
+        state = self._states.get(monitor.id)
+        if state is None:
+            state = self._states[monitor.id] = MonitorState(interval=low)
+
+        # Проверка «покрыла» state.interval секунд; с минимальным
+        # интервалом на тот же период ушло бы interval / low проверок
+        self.performed += 1
+        self.baseline += max(low, min(state.interval, high)) / low
+
+        state.interval = self.policy.next_interval(state, result, low, high)
+        state.next_due = self._next_due(monitor.id, state, now)
+        state.is_up = result.is_up
+        return state.interval
+
+    def _next_due(self, monitor_id: int, state: MonitorState, now: float) -> float:
+        planned = state.next_due
+        if planned == 0.0:
+            # Первая проверка: следующая — не раньше чем через тик и не позже
+            # чем через интервал, в точке, постоянной для монитора. Мониторы,
+            # стартовавшие вместе (первый запуск, рестарт без снимка),
+            # расходятся по фазам и не проверяются потом толпой в один тик
+            spread = max(0, state.interval - self.tick)
+            return now + self.tick + spread * _phase(monitor_id)
+        if abs(now - planned) <= self.tick:
+            # Срок отсчитывается от плана, а не от тика, на котором прошла
+            # проверка: иначе интервал округлялся бы вниз до кратного тику
+            # (90 с превращались в 60)
+            return planned + state.interval
+        # Сильное опоздание (перегрузка, простой): без якоря, чтобы не
+        # догонять пропущенное залпом
+        return now + state.interval
+
+    def reset(self, monitor_id: int) -> None:
+        """Сбрасывает состояние (например, после смены границ пользователем)."""
+        self._states.pop(monitor_id, None)
+
+    def retain(self, monitor_ids: Iterable[int]) -> None:
+        """Удаляет состояние мониторов, которых больше нет среди активных."""
+        keep = set(monitor_ids)
+        for monitor_id in [i for i in self._states if i not in keep]:
+            del self._states[monitor_id]
+
+    def dump(self) -> dict[str, Any]:
+        """Состояние расписания в виде, пригодном для JSON-снимка."""
+        return {
+            "performed": self.performed,
+            "baseline": self.baseline,
+            "monitors": {
+                str(monitor_id): astuple(state)
+                for monitor_id, state in self._states.items()
+            },
+        }
+
+    def restore(self, data: dict[str, Any], now: float) -> int:
+        """
+        Восстанавливает состояние из снимка. Возвращает число мониторов.
+
+        Непросроченные сроки сохраняются как есть. Мониторы, чей срок прошел
+        за время простоя, проверяются в ближайшие catchup_ticks тиков (но не
+        позже чем через свой интервал): точка в окне постоянна для монитора,
+        так что догон размазан по окну, а не идет залпом на первом тике,
+        и ни одна проверка не пропускается. Битые записи мониторов
+        пропускаются.
+
+        Raises:
+            ValueError: Если не разбирается заголовок снимка (performed,
+                baseline, monitors).
+        """
+        # Заголовок разбираем до изменения состояния: если он битый,
+        # ValueError уходит вызывающему, а расписание остается нетронутым
+        performed = int(data.get("performed", 0))
+        baseline = float(data.get("baseline", 0.0))
+        monitors = data.get("monitors", {})
+        if not isinstance(monitors, dict):
+            raise ValueError("monitors в снимке — не словарь")
+
+        catchup = self.catchup_ticks * self.tick
+        self.performed = performed
+        self.baseline = baseline
+        for monitor_id, fields in monitors.items():
+            # Битая запись пропускается, остальные восстанавливаются
+            try:
+                key = int(monitor_id)
+                state = MonitorState(*fields)
+                if state.interval <= 0:
+                    continue
+                if state.next_due < now:
+                    window = min(state.interval, catchup)
+                    state.next_due = now + window * _phase(key)
+            except (TypeError, ValueError):
+                continue
+            self._states[key] = state
+        return len(self._states)
+
+    def stats(self) -> ScheduleStats:
+        return ScheduleStats(
+            monitors=len(self._states),
+            performed=self.performed,
+            baseline=self.baseline,
+        )
+
+
+def _phase(monitor_id: int) -> float:
+    """Детерминированная доля [0, 1) по id (мультипликативный хэш Кнута)."""
+    return (monitor_id * 2654435761 % 2**32) / 2**32
+
+
+# Глобальное расписание проверок
+check_schedule = CheckSchedule(
+    policy=AdaptiveIntervalPolicy(
+        stable_checks=settings.ADAPTIVE_STABLE_CHECKS,
+        growth=settings.ADAPTIVE_GROWTH,
+        latency_spike=settings.ADAPTIVE_LATENCY_SPIKE,
+    ),
+    tick=settings.SCHEDULER_TICK,
+    catchup_ticks=settings.RESTART_CATCHUP_TICKS,
+)
@@ -0,0 +1,161 @@
+import time
+import asyncio
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit, urlunsplit
+
+from src.core.config import settings
+from src.infrastructure.database.models import MonitorModel
+from src.infrastructure.network.assertions import ContentRule, parse_rules
+from src.infrastructure.network.client import CheckResult, ErrorCategory, ProbeType
+from src.infrastructure.network.shared import SharedNetworkClient, shared_client
+from src.infrastructure.scheduler.history import results_history
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+CheckKey = tuple[str, str, tuple[ContentRule, ...]]
+
+
+class RateLimitedError(Exception):
+    """Пользователь исчерпал лимит ручных проверок."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Повторите через {retry_after:.0f} с")
+        self.retry_after = retry_after
+
+
+def canonical_url(url: str) -> str:
+    """
+    Приводит адрес к каноническому виду для ключа кэша:
+    схема и хост в нижнем регистре, без порта по умолчанию и фрагмента,
+    пустой путь — «/».
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or ("/" if scheme in _DEFAULT_PORTS else "")
+    return urlunsplit((scheme, host, path, parts.query, ""))
+
+
+class CheckNowService:
+    """
+    Внеплановая проверка монитора по запросу пользователя.
+
+    - Свежий результат (моложе freshness секунд) отдается из кэша; кэш
+      пополняют и плановые проверки.
+    - Одновременные запросы одного адреса схлопываются в одну проверку,
+      результат получают все ожидающие.
+    - Новые проверки ограничены limit штуками на пользователя за window
+      секунд; ответы из кэша и присоединение к идущей проверке не считаются.
+    """
+
+    def __init__(
+        self,
+        client: SharedNetworkClient,
+        freshness: float = 30.0,
+        limit: int = 5,
+        window: float = 60.0,
+        cache_size: int = 10_000,
+    ) -> None:
+        self.client = client
+        self.freshness = freshness
+        self.limit = limit
+        self.window = window
+        self.cache_size = cache_size
+        self._cache: OrderedDict[CheckKey, tuple[float, CheckResult]] = OrderedDict()
+        self._inflight: dict[CheckKey, asyncio.Task[CheckResult]] = {}
+        self._user_hits: dict[int, deque[float]] = {}
+        self.probes = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(monitor: MonitorModel) -> CheckKey:
+        # Правила проверки содержимого меняют результат, поэтому входят в ключ
+        return (
+            monitor.probe_type,
+            canonical_url(monitor.url),
+            parse_rules(monitor.content_rules),
+        )
+
+    def remember(self, monitor: MonitorModel, result: CheckResult) -> None:
+        """Кладет результат проверки (в том числе плановой) в кэш."""
+        self._store(self.key(monitor), result)
+
+    async def check(
+        self, monitor: MonitorModel, user_id: int
+    ) -> tuple[CheckResult, float]:
+        """
+        Возвращает (результат, возраст в секундах).
+
+        Raises:
+            RateLimitedError: Если нужна новая проверка, а лимит исчерпан.
+        """
+        key = self.key(monitor)
+        now = time.monotonic()
+
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] <= self.freshness:
+            self.cache_hits += 1
+            return cached[1], now - cached[0]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self._take_quota(user_id, now)
+            task = asyncio.create_task(self._probe(key, monitor.id, monitor.url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # shield: если пользователь «ушел», проверка доживает для остальных
+        result = await asyncio.shield(task)
+        return result, 0.0
+
+    async def _probe(self, key: CheckKey, monitor_id: int, url: str) -> CheckResult:
+        self.probes += 1
+        probe_type, _, rules = key
+        client = self.client.get()
+        try:
+            result = await client.probe(probe_type or ProbeType.HTTP, url, rules)
+        except Exception as e:
+            result = CheckResult(
+                url=url, error=str(e), error_category=ErrorCategory.OTHER
+            )
+        self._store(key, result)
+        results_history.record(monitor_id, result)
+        return result
+
+    def _store(self, key: CheckKey, result: CheckResult) -> None:
+        self._cache[key] = (time.monotonic(), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _take_quota(self, user_id: int, now: float) -> None:
+        hits = self._user_hits.setdefault(user_id, deque())
+        while hits and now - hits[0] > self.window:
+            hits.popleft()
+        if len(hits) >= self.limit:
+            raise RateLimitedError(self.window - (now - hits[0]))
+        hits.append(now)
+        # Не даем словарю расти за счет давно неактивных пользователей
+        if len(self._user_hits) > self.cache_size:
+            stale = [
+                uid
+                for uid, times in self._user_hits.items()
+                if not times or now - times[-1] > self.window
+            ]
+            for uid in stale:
+                del self._user_hits[uid]
+
+
+# Глобальный сервис ручных проверок
+check_now = CheckNowService(
+    client=shared_client,
+    freshness=settings.CHECK_NOW_FRESHNESS,
+    limit=settings.CHECK_NOW_USER_LIMIT,
+    window=settings.CHECK_NOW_USER_WINDOW,
+)
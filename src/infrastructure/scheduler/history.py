@@ -0,0 +1,246 @@
+import time
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+from dataclasses import dataclass
+
+from loguru import logger
+
+from src.core.config import settings
+from src.infrastructure.network.client import CheckResult, ErrorCategory
+
+
+# Колонки кольцевого буфера и их typecode в array:
+#   ts — unix-время в секундах, status — HTTP-код (0 — ответа не было),
+#   latency — миллисекунды, error — ErrorCategory
+_COLUMNS: dict[str, str] = {"ts": "I", "status": "H", "latency": "I", "error": "B"}
+BYTES_PER_RESULT = sum(array(code).itemsize for code in _COLUMNS.values())
+
+
+@dataclass(slots=True, frozen=True)
+class WindowStats:
+    total: int
+    up: int
+    avg_latency_ms: float
+    max_latency_ms: int
+
+    @property
+    def uptime_percent(self) -> float:
+        return 100.0 * self.up / self.total if self.total else 100.0
+
+
+class ResultRing:
+    """
+    Кольцевой буфер последних результатов одного монитора.
+
+    Данные лежат в колонках фиксированной ширины (array), а не в объектах
+    CheckResult: ~11 байт на проверку вместо сотен. Добавление за O(1),
+    окна отдаются как memoryview без копирования (до двух сегментов,
+    если окно пересекает границу кольца).
+    """
+
+    __slots__ = ("capacity", "_head", "_size", "ts", "status", "latency", "error")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._head = 0  # Индекс, куда будет записан следующий результат
+        self._size = 0
+        self.ts = array(_COLUMNS["ts"], [0]) * capacity
+        self.status = array(_COLUMNS["status"], [0]) * capacity
+        self.latency = array(_COLUMNS["latency"], [0]) * capacity
+        self.error = array(_COLUMNS["error"], [0]) * capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, ts: int, status: int, latency_ms: int, error: int) -> None:
+        i = self._head
+        self.ts[i] = ts
+        self.status[i] = min(status, 0xFFFF)
+        self.latency[i] = min(latency_ms, 0xFFFFFFFF)
+        self.error[i] = error
+        self._head = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def shrink(self, capacity: int) -> "ResultRing":
+        """Копия меньшей емкости: сохраняются последние capacity записей."""
+        ring = ResultRing(capacity)
+        count = min(self._size, capacity)
+        for column, code in _COLUMNS.items():
+            values = array(code)
+            for segment in self.window(column, count):
+                values.frombytes(segment.tobytes())
+            getattr(ring, column)[:count] = values
+        ring._size = count
+        ring._head = count % capacity
+        return ring
+
+    def latest(self) -> tuple[int, int, int, int] | None:
+        """Последний результат: (ts, status, latency_ms, error)."""
+        if not self._size:
+            return None
+        i = (self._head - 1) % self.capacity
+        return self.ts[i], self.status[i], self.latency[i], self.error[i]
+
+    def _segments(self, count: int) -> list[tuple[int, int]]:
+        """Диапазоны индексов последних count записей в хронологическом порядке."""
+        count = min(count, self._size)
+        if not count:
+            return []
+        start = (self._head - count) % self.capacity
+        end = start + count
+        if end <= self.capacity:
+            return [(start, end)]
+        return [(start, self.capacity), (0, end - self.capacity)]
+
+    def window(self, column: str, last: int | None = None) -> list[memoryview]:
+        """Zero-copy срез колонки за последние last записей (по умолчанию — все).
+
+        Args:
+            column: Имя колонки: "ts", "status", "latency" или "error".
+            last: Количество последних записей.
+
+        Returns:
+            Один или два memoryview в хронологическом порядке.
+        """
+        view = memoryview(getattr(self, column))
+        count = self._size if last is None else last
+        return [view[a:b] for a, b in self._segments(count)]
+
+    def count_since(self, since_ts: int) -> int:
+        """Сколько записей сделано начиная с момента since_ts (бинарный поиск)."""
+        count = 0
+        for segment in reversed(self.window("ts")):
+            pos = bisect_left(segment, since_ts)
+            count += len(segment) - pos
+            if pos:
+                break
+        return count
+
+    def stats(
+        self, last: int | None = None, since_ts: int | None = None
+    ) -> WindowStats:
+        """Статистика окна: по количеству последних проверок или по времени."""
+        count = self._size if last is None else min(last, self._size)
+        if since_ts is not None:
+            count = min(count, self.count_since(since_ts))
+
+        up = 0
+        for segment in self.window("error", count):
+            up += len(segment) - sum(1 for code in segment if code)
+
+        latency_sum = 0
+        latency_max = 0
+        for segment in self.window("latency", count):
+            if len(segment):
+                latency_sum += sum(segment)
+                latency_max = max(latency_max, max(segment))
+
+        return WindowStats(
+            total=count,
+            up=up,
+            avg_latency_ms=latency_sum / count if count else 0.0,
+            max_latency_ms=latency_max,
+        )
+
+
+class ResultHistory:
+    """
+    Хранилище кольцевых буферов по мониторам с ограничением по памяти.
+
+    Когда бюджет исчерпан, емкость всех буферов уменьшается вдвое
+    (сохраняются последние записи), но не ниже min_capacity: при росте
+    числа мониторов у каждого остается более короткая история, а не
+    вытесняются целые буферы. Если и на минимальной емкости места нет,
+    новые мониторы в историю не попадают (пишется предупреждение).
+    """
+
+    def __init__(
+        self, capacity: int, memory_limit_bytes: int, min_capacity: int = 32
+    ) -> None:
+        self.capacity = capacity  # Емкость буфера для новых мониторов
+        self.min_capacity = min(min_capacity, capacity)
+        self.memory_limit_bytes = memory_limit_bytes
+        self._rings: dict[int, ResultRing] = {}
+        self._bytes = 0
+        self.rejected = 0  # Результатов, не попавших в историю из-за лимита
+        self._full_warned = False
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+    def get(self, monitor_id: int) -> ResultRing | None:
+        return self._rings.get(monitor_id)
+
+    def record(
+        self, monitor_id: int, result: CheckResult, ts: int | None = None
+    ) -> None:
+        """Добавляет результат проверки в буфер монитора."""
+        ring = self._rings.get(monitor_id)
+        if ring is None:
+            if not self._make_room():
+                self.rejected += 1
+                if not self._full_warned:
+                    self._full_warned = True
+                    logger.warning(
+                        "Лимит памяти истории исчерпан, новые мониторы без истории",
+                        monitors=len(self._rings),
+                        capacity=self.capacity,
+                    )
+                return
+            ring = self._rings[monitor_id] = ResultRing(self.capacity)
+            self._bytes += ring.capacity * BYTES_PER_RESULT
+
+        if result.is_up:
+            error = ErrorCategory.NONE
+        else:
+            error = result.error_category or ErrorCategory.OTHER
+
+        ring.append(
+            int(time.time()) if ts is None else ts,
+            result.status_code or 0,
+            result.response_time_ms,
+            error,
+        )
+
+    def retain(self, monitor_ids: Iterable[int]) -> None:
+        """Удаляет буферы мониторов, которых больше нет среди активных."""
+        keep = set(monitor_ids)
+        for monitor_id in [i for i in self._rings if i not in keep]:
+            ring = self._rings.pop(monitor_id)
+            self._bytes -= ring.capacity * BYTES_PER_RESULT
+        self._full_warned = False
+
+    @property
+    def memory_bytes(self) -> int:
+        """Объем памяти, занятый данными колонок."""
+        return self._bytes
+
+    def _make_room(self) -> bool:
+        """Освобождает место под еще один буфер; False — места нет."""
+        while self._bytes + self.capacity * BYTES_PER_RESULT > self.memory_limit_bytes:
+            if self.capacity <= self.min_capacity:
+                return False
+            self._shrink(max(self.min_capacity, self.capacity // 2))
+        return True
+
+    def _shrink(self, capacity: int) -> None:
+        logger.info(
+            "История проверок сокращена из-за лимита памяти",
+            capacity=capacity,
+            monitors=len(self._rings),
+        )
+        self.capacity = capacity
+        for monitor_id, ring in self._rings.items():
+            if ring.capacity > capacity:
+                self._rings[monitor_id] = ring.shrink(capacity)
+        self._bytes = sum(ring.capacity for ring in self._rings.values())
+        self._bytes *= BYTES_PER_RESULT
+
+
+# Глобальная история последних проверок
+results_history = ResultHistory(
+    capacity=settings.HISTORY_CAPACITY,
+    memory_limit_bytes=settings.HISTORY_MEMORY_LIMIT_MB * 1024 * 1024,
+)
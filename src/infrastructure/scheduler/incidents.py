@@ -0,0 +1,221 @@
+from typing import Sequence
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.infrastructure.database.manager import db_manager
+from src.infrastructure.database.models import IncidentModel, MonitorModel, as_utc
+from src.infrastructure.database.repos import CheckResultRepository, IncidentRepository
+from src.infrastructure.network.client import CheckResult, ErrorCategory
+
+
+# Длина сохраняемого текста ошибки (колонки check_results.error и first_error)
+_ERROR_MAX_LEN = 512
+
+
+def _error_text(error: str | None) -> str | None:
+    return error[:_ERROR_MAX_LEN] if error else None
+
+
+class IncidentBuilder:
+    """
+    Автомат «up/down» поверх последовательности проверок.
+
+    Открывает инцидент на первой неудачной проверке, считает последующие
+    и закрывает его на первой успешной. Один и тот же автомат используется
+    и при обработке цикла (стартуя с открытых инцидентов из БД), и при
+    пересборке из сырой истории.
+    """
+
+    def __init__(self, open_incidents: dict[int, IncidentModel] | None = None) -> None:
+        self.open = dict(open_incidents or {})
+        self.opened = 0
+        self.closed = 0
+
+    def feed(
+        self,
+        monitor_id: int,
+        checked_at: datetime,
+        is_up: bool,
+        cause: int,
+        error: str | None,
+    ) -> IncidentModel | None:
+        """Учитывает проверку. Возвращает новый инцидент, если он открылся."""
+        incident = self.open.get(monitor_id)
+        if is_up:
+            if incident is not None:
+                incident.ended_at = checked_at
+                del self.open[monitor_id]
+                self.closed += 1
+            return None
+
+        if incident is not None:
+            incident.failed_checks += 1
+            return None
+
+        incident = IncidentModel(
+            monitor_id=monitor_id,
+            started_at=checked_at,
+            cause=cause or ErrorCategory.OTHER,
+            first_error=_error_text(error),
+            failed_checks=1,
+        )
+        self.open[monitor_id] = incident
+        self.opened += 1
+        return incident
+
+
+async def record_results(
+    session: AsyncSession,
+    items: Sequence[tuple[MonitorModel, CheckResult, datetime]],
+) -> None:
+    """
+    Сохраняет пачку результатов (монитор, результат, время проверки):
+    сырые строки одним executemany и инкрементальное обновление
+    инцидентов (только переходы состояния). Порядок элементов —
+    порядок проверок.
+    """
+    if not items:
+        return
+
+    await CheckResultRepository(session).add_many(
+        [
+            {
+                "monitor_id": monitor.id,
+                "checked_at": checked_at,
+                "is_up": result.is_up,
+                "status_code": result.status_code,
+                "response_time_ms": result.response_time_ms,
+                "redirect_time_ms": result.redirect_time_ms,
+                "error_category": (
+                    ErrorCategory.NONE
+                    if result.is_up
+                    else result.error_category or ErrorCategory.OTHER
+                ),
+                "error": None if result.is_up else _error_text(result.error),
+            }
+            for monitor, result, checked_at in items
+        ]
+    )
+
+    repo = IncidentRepository(session)
+    builder = IncidentBuilder(
+        await repo.get_open(list({monitor.id for monitor, _, _ in items}))
+    )
+    for monitor, result, checked_at in items:
+        incident = builder.feed(
+            monitor.id,
+            checked_at,
+            result.is_up,
+            result.error_category,
+            result.error
+            or (f"Status {result.status_code}" if result.status_code else None),
+        )
+        if incident is not None:
+            session.add(incident)
+
+    await session.commit()
+
+
+async def rebuild_incidents(
+    session: AsyncSession,
+    monitor_ids: Sequence[int] | None = None,
+    batch_size: int = 5000,
+) -> tuple[int, int]:
+    """
+    Пересобирает инциденты из сырой истории check_results (всех мониторов,
+    если monitor_ids не задан). Проверки читаются потоково, в памяти —
+    только инциденты. Старые инциденты заменяются одной транзакцией.
+
+    Сырая история хранится CHECK_RESULTS_RETENTION_DAYS дней, поэтому
+    заменяются только инциденты, начавшиеся в ее пределах; более ранние
+    остаются как есть. Инцидент, начавшийся до первой сохраненной проверки
+    и продолжавшийся после нее, тоже сохраняется: проверки до его конца
+    пропускаются, а если он еще открыт — монитор не пересобирается.
+
+    Параллельная запись результатов (работающий конвейер) не учитывается:
+    запускать при остановленном боте.
+
+    Returns:
+        (число просмотренных проверок, число инцидентов).
+    """
+    repo = IncidentRepository(session)
+    spanning = await repo.get_spanning_history_start(monitor_ids)
+    builder = IncidentBuilder()
+    incidents: list[IncidentModel] = []
+    checks = 0
+    async for row in CheckResultRepository(session).stream_results(
+        monitor_ids, batch_size=batch_size
+    ):
+        kept = spanning.get(row.monitor_id)
+        if kept is not None and (
+            kept.ended_at is None or row.checked_at <= kept.ended_at
+        ):
+            continue
+        checks += 1
+        incident = builder.feed(
+            row.monitor_id,
+            row.checked_at,
+            row.is_up,
+            row.error_category,
+            row.error or (f"Status {row.status_code}" if row.status_code else None),
+        )
+        if incident is not None:
+            incidents.append(incident)
+
+    await repo.delete_within_history(monitor_ids)
+    session.add_all(incidents)
+    await session.commit()
+    return checks, len(incidents)
+
+
+async def purge_check_results(
+    days: int = settings.CHECK_RESULTS_RETENTION_DAYS,
+) -> None:
+    """
+    Задача планировщика: удаляет сырые проверки старше days дней.
+    Аптайм считается по инцидентам, поэтому от этого не меняется.
+    """
+    moment = datetime.now(timezone.utc) - timedelta(days=days)
+    async with db_manager.session_maker() as session:
+        deleted = await CheckResultRepository(session).delete_older_than(moment)
+        await session.commit()
+    logger.info("Старая история проверок удалена", deleted=deleted, days=days)
+
+
+@dataclass(slots=True, frozen=True)
+class UptimeWindow:
+    uptime_percent: float
+    downtime: timedelta
+    incidents: int
+
+
+def uptime_window(
+    incidents: Sequence[IncidentModel],
+    start: datetime,
+    end: datetime,
+) -> UptimeWindow:
+    """
+    Аптайм за окно [start, end] по инцидентам одного монитора.
+    Стоимость — O(число инцидентов), а не O(число проверок).
+    """
+    total = (end - start).total_seconds()
+    downtime = 0.0
+    count = 0
+    for incident in incidents:
+        started = as_utc(incident.started_at)
+        ended = as_utc(incident.ended_at) if incident.ended_at else end
+        overlap = (min(ended, end) - max(started, start)).total_seconds()
+        if overlap > 0 or start <= started <= end:
+            count += 1
+            downtime += max(overlap, 0.0)
+
+    uptime = 100.0 * (1 - downtime / total) if total > 0 else 100.0
+    return UptimeWindow(
+        uptime_percent=max(0.0, uptime),
+        downtime=timedelta(seconds=downtime),
+        incidents=count,
+    )
@@ -0,0 +1,461 @@
+import time
+import asyncio
+from html import escape
+from typing import Awaitable, Callable, Generic, TypeVar
+from datetime import datetime, timezone
+from dataclasses import dataclass
+
+from loguru import logger
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+
+from src.bot.lexicon import Texts
+from src.core.config import settings
+from src.infrastructure.database.manager import db_manager
+from src.infrastructure.database.models import MonitorModel
+from src.infrastructure.database.repos import MonitorRepository
+from src.infrastructure.network.assertions import parse_rules
+from src.infrastructure.network.client import CheckResult, ErrorCategory
+from src.infrastructure.network.shared import shared_client
+from src.infrastructure.scheduler.history import results_history
+from src.infrastructure.scheduler.adaptive import check_schedule
+from src.infrastructure.scheduler.check_now import check_now
+from src.infrastructure.scheduler.incidents import record_results
+from src.infrastructure.scheduler.status_board import status_board
+
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True, frozen=True)
+class StageStats:
+    name: str
+    workers: int
+    depth: int  # Элементов в очереди сейчас
+    capacity: int
+    processed: int
+    shed: int  # Отброшено при полной очереди (только низкоприоритетное)
+    failed: int
+    rate: float  # Обработано в секунду с момента запуска
+    utilization: float  # Доля времени, когда воркеры заняты, %
+
+
+class Stage(Generic[T]):
+    """
+    Стадия конвейера: ограниченная очередь и пул воркеров.
+
+    put() ждет места в очереди — задержка распространяется вверх по
+    конвейеру (обратное давление), память не растет. offer() при полной
+    очереди отбрасывает элемент — для работы, которую можно не делать.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[T], Awaitable[None]],
+        workers: int,
+        queue_size: int,
+    ) -> None:
+        self.name = name
+        self.workers = max(1, workers)
+        self._handler = handler
+        self._queue: asyncio.Queue[T] = asyncio.Queue(maxsize=queue_size)
+        self._tasks: list[asyncio.Task[None]] = []
+        self._overloaded = False
+        self._started_at = 0.0
+        self._uptime = 0.0  # Время работы в прошлых запусках
+        self._busy = 0.0
+
+        self.processed = 0
+        self.shed = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def put(self, item: T) -> None:
+        await self._queue.put(item)
+
+    def offer(self, item: T) -> bool:
+        """Кладет элемент, если есть место. Возвращает False, если отброшен."""
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.shed += 1
+            # Пишем в лог один раз на эпизод перегрузки, а не на каждый элемент
+            if not self._overloaded:
+                self._overloaded = True
+                logger.warning(
+                    "Очередь стадии переполнена, работа отбрасывается", stage=self.name
+                )
+            return False
+        self._overloaded = False
+        return True
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._started_at = time.monotonic()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self.name}-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def join(self) -> None:
+        """Ждет, пока все принятые элементы будут обработаны."""
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._tasks:
+            self._uptime += time.monotonic() - self._started_at
+        self._tasks = []
+
+    def stats(self) -> StageStats:
+        elapsed = self._uptime
+        if self._tasks:
+            elapsed += time.monotonic() - self._started_at
+        return StageStats(
+            name=self.name,
+            workers=self.workers,
+            depth=self._queue.qsize(),
+            capacity=self._queue.maxsize,
+            processed=self.processed,
+            shed=self.shed,
+            failed=self.failed,
+            rate=self.processed / elapsed if elapsed else 0.0,
+            utilization=(
+                100.0 * self._busy / (elapsed * self.workers) if elapsed else 0.0
+            ),
+        )
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            started = time.monotonic()
+            try:
+                await self._handler(item)
+                self.processed += 1
+            except Exception:
+                self.failed += 1
+                logger.exception("Ошибка в стадии конвейера", stage=self.name)
+            finally:
+                self._busy += time.monotonic() - started
+                self._queue.task_done()
+
+
+class BatchStage(Stage[T]):
+    """
+    Стадия, которая забирает из очереди пачку и обрабатывает ее одним
+    вызовом — для записи в БД. После первого элемента ждет остальные
+    не дольше linger секунд (или до batch_size): иначе в начале цикла,
+    когда результаты приходят по одному, каждый уходил бы отдельной
+    транзакцией.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[list[T]], Awaitable[None]],
+        workers: int,
+        queue_size: int,
+        batch_size: int,
+        linger: float,
+    ) -> None:
+        super().__init__(name, handler, workers, queue_size)  # type: ignore[arg-type]
+        self._batch_handler = handler
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+
+    async def _worker(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.linger
+            try:
+                async with asyncio.timeout_at(deadline):
+                    while len(batch) < self.batch_size:
+                        batch.append(await self._queue.get())
+            except TimeoutError:
+                pass
+            started = time.monotonic()
+            try:
+                await self._batch_handler(batch)
+                self.processed += len(batch)
+            except Exception:
+                self.failed += len(batch)
+                logger.exception("Ошибка в стадии конвейера", stage=self.name)
+            finally:
+                self._busy += time.monotonic() - started
+                for _ in batch:
+                    self._queue.task_done()
+
+
+@dataclass(slots=True)
+class CheckJob:
+    """Проверка монитора, проходящая по стадиям конвейера."""
+
+    monitor: MonitorModel
+    now: float  # Время раздачи: от него отсчитывается расписание
+    result: CheckResult | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class Alert:
+    user_id: int
+    text: str
+
+
+class MonitoringPipeline:
+    """
+    Движок мониторинга как конвейер стадий с ограниченными очередями:
+
+        dispatch → probe → evaluate → persist
+                                   ↘ notify
+
+    - dispatch (по тику планировщика) выбирает мониторы со сроком и кладет
+      их в очередь probe; при полной очереди ждет. Монитор, который еще
+      в конвейере, повторно не раздается.
+    - probe — сетевые проверки, PIPELINE_PROBE_WORKERS параллельно.
+    - evaluate — обновление состояния в памяти (расписание, история, кэш,
+      страницы статуса) и решение об алертах; один воркер, порядок сохранен.
+    - persist — запись сырых результатов и инцидентов пачками; один
+      воркер: record_results достраивает открытые инциденты, и две пачки
+      с одним монитором параллельно открыли бы дубли.
+    - notify — отправка в Telegram; при flood control ждет retry_after,
+      не останавливая проверки.
+
+    Приоритеты при перегрузке: алерты о падении и запись в БД задерживаются,
+    но не теряются; предупреждения о сертификате отбрасываются (и будут
+    повторены на следующей проверке).
+    """
+
+    def __init__(
+        self,
+        probe_workers: int,
+        notify_workers: int,
+        queue_size: int,
+        persist_batch: int,
+        persist_linger: float,
+    ) -> None:
+        self.probe: Stage[CheckJob] = Stage(
+            "probe", self._probe, probe_workers, queue_size
+        )
+        self.evaluate: Stage[CheckJob] = Stage(
+            "evaluate", self._evaluate, 1, queue_size
+        )
+        self.persist: BatchStage[CheckJob] = BatchStage(
+            "persist",
+            self._persist,
+            1,
+            queue_size,
+            persist_batch,
+            persist_linger,
+        )
+        self.notify: Stage[Alert] = Stage(
+            "notify", self._notify, notify_workers, queue_size
+        )
+        # Порядок важен для join(): каждая стадия кладет работу только в следующие
+        self.stages: tuple[Stage, ...] = (
+            self.probe,
+            self.evaluate,
+            self.persist,
+            self.notify,
+        )
+        self._bot: Bot | None = None
+        self._in_flight: set[int] = set()
+        self._dispatch_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.probe.running
+
+    def start(self, bot: Bot) -> None:
+        self._bot = bot
+        for stage in self.stages:
+            stage.start()
+
+    async def join(self) -> None:
+        """Ждет, пока все розданные проверки пройдут все стадии."""
+        for stage in self.stages:
+            await stage.join()
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """Останавливает воркеров, предварительно дав конвейеру опустеть."""
+        if not self.running:
+            return
+        try:
+            await asyncio.wait_for(self.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Не удалось дообработать конвейер",
+                left={stage.name: stage.stats().depth for stage in self.stages},
+            )
+        for stage in self.stages:
+            await stage.stop()
+        self._in_flight.clear()
+
+    def stats(self) -> list[StageStats]:
+        return [stage.stats() for stage in self.stages]
+
+    async def dispatch(self) -> int:
+        """
+        Стадия dispatch: раздача проверок, срок которых наступил.
+        Возвращает число розданных мониторов.
+        """
+        async with self._dispatch_lock:
+            async with db_manager.session_maker() as session:
+                active_monitors = await MonitorRepository(session).get_active_monitors()
+
+            check_schedule.retain(monitor.id for monitor in active_monitors)
+            results_history.retain(monitor.id for monitor in active_monitors)
+            status_board.sync(active_monitors, check_schedule)
+            if not active_monitors:
+                logger.debug("Не найдено активных сайтов для мониторинга")
+                return 0
+
+            now = time.time()
+            due_monitors = [
+                monitor
+                for monitor in active_monitors
+                if monitor.id not in self._in_flight
+                and check_schedule.is_due(monitor, now)
+            ]
+            for monitor in due_monitors:
+                self._in_flight.add(monitor.id)
+                try:
+                    # Ждет места в очереди: раздача притормаживает вместе с проверками
+                    await self.probe.put(CheckJob(monitor=monitor, now=now))
+                except BaseException:
+                    # Отмена посреди раздачи (/profile, остановка): монитор
+                    # в очередь не попал и не должен числиться в конвейере
+                    self._in_flight.discard(monitor.id)
+                    raise
+
+        logger.debug(
+            "Проверки розданы",
+            dispatched=len(due_monitors),
+            active=len(active_monitors),
+            in_flight=len(self._in_flight),
+            saved_checks=check_schedule.stats().saved,
+            queues={stage.name: stage.stats().depth for stage in self.stages},
+        )
+        return len(due_monitors)
+
+    async def _probe(self, job: CheckJob) -> None:
+        monitor = job.monitor
+        try:
+            job.result = await shared_client.get().probe(
+                monitor.probe_type,
+                monitor.url,
+                rules=parse_rules(monitor.content_rules),
+            )
+        except Exception as e:
+            job.result = CheckResult(
+                url=monitor.url, error=str(e), error_category=ErrorCategory.OTHER
+            )
+        await self.evaluate.put(job)
+
+    async def _evaluate(self, job: CheckJob) -> None:
+        monitor, result = job.monitor, job.result
+        assert result is not None
+        self._in_flight.discard(monitor.id)
+
+        results_history.record(monitor.id, result)
+        check_now.remember(monitor, result)
+        previous = check_schedule.get(monitor.id)
+        was_up = previous.is_up if previous else None
+        check_schedule.record(monitor, result, job.now)
+        status_board.record(monitor, result, job.now)
+
+        # Сырая история не теряется: при медленной БД ждем места в очереди
+        await self.persist.put(job)
+
+        if not result.is_up:
+            # О продолжающемся сбое уже сообщили при переходе в down
+            if was_up is False:
+                return
+            # Сообщение уходит с parse_mode=HTML, а в причине может быть
+            # шаблон пользователя (например, «</body>»)
+            message_text = Texts.MySites.UNAVAILABLE.format(
+                escape(monitor.url),
+                escape(result.error or f"Status {result.status_code}"),
+            )
+            await self.notify.put(Alert(monitor.user_id, message_text))
+            return
+
+        state = check_schedule.get(monitor.id)
+        if (
+            result.ssl_days_left is not None
+            and result.ssl_days_left < 7
+            and state is not None
+            and state.ssl_alert_days != result.ssl_days_left
+        ):
+            message_text = Texts.MySites.CERTIFICATE_EXPIRE.format(
+                escape(monitor.url),
+                (
+                    result.ssl_expires_at.strftime("%Y-%m-%d")
+                    if result.ssl_expires_at
+                    else "unknown"
+                ),
+                result.ssl_days_left,
+            )
+            # Низкий приоритет: при полной очереди не ждем, а повторим
+            # на следующей проверке (остаток дней не помечается отправленным)
+            if self.notify.offer(Alert(monitor.user_id, message_text)):
+                state.ssl_alert_days = result.ssl_days_left
+
+    async def _persist(self, jobs: list[CheckJob]) -> None:
+        async with db_manager.session_maker() as session:
+            await record_results(
+                session,
+                [
+                    (
+                        job.monitor,
+                        job.result,
+                        datetime.fromtimestamp(job.now, timezone.utc),
+                    )
+                    for job in jobs
+                    if job.result is not None
+                ],
+            )
+
+    async def _notify(self, alert: Alert) -> None:
+        if self._bot is None:
+            return
+        try:
+            await self._bot.send_message(chat_id=alert.user_id, text=alert.text)
+        except TelegramRetryAfter as e:
+            # Flood control: ждем сколько сказано и пробуем еще раз;
+            # проверки в это время продолжаются
+            await asyncio.sleep(e.retry_after)
+            await self._send_safely(alert)
+        except TelegramAPIError as e:
+            self._log_send_error(alert, e)
+
+    async def _send_safely(self, alert: Alert) -> None:
+        assert self._bot is not None
+        try:
+            await self._bot.send_message(chat_id=alert.user_id, text=alert.text)
+        except TelegramAPIError as e:
+            self._log_send_error(alert, e)
+
+    @staticmethod
+    def _log_send_error(alert: Alert, error: TelegramAPIError) -> None:
+        logger.warning(
+            "Не удалось отправить алерт пользователю",
+            user_id=alert.user_id,
+            error=str(error),
+        )
+
+
+# Глобальный конвейер мониторинга
+monitoring_pipeline = MonitoringPipeline(
+    probe_workers=settings.PIPELINE_PROBE_WORKERS,
+    notify_workers=settings.PIPELINE_NOTIFY_WORKERS,
+    queue_size=settings.PIPELINE_QUEUE_SIZE,
+    persist_batch=settings.PIPELINE_PERSIST_BATCH,
+    persist_linger=settings.PIPELINE_PERSIST_LINGER,
+)
@@ -0,0 +1,94 @@
+import os
+import json
+import math
+import time
+import asyncio
+from pathlib import Path
+
+from loguru import logger
+
+from src.core.config import settings
+from src.infrastructure.scheduler.adaptive import CheckSchedule, check_schedule
+
+
+SNAPSHOT_VERSION = 1
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    # Пишем во временный файл и подменяем: при падении посреди записи
+    # на диске останется предыдущий целый снимок
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+async def save_snapshot(
+    schedule: CheckSchedule = check_schedule,
+    path: str | Path = settings.STATE_SNAPSHOT_PATH,
+) -> None:
+    """
+    Сохраняет состояние расписания в файл.
+    Сериализация — в event loop'е (согласованный срез), запись — в потоке.
+    """
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "saved_at": time.time(),
+        **schedule.dump(),
+    }
+    payload = json.dumps(snapshot, separators=(",", ":")).encode()
+    try:
+        await asyncio.to_thread(_write_atomic, Path(path), payload)
+    except OSError as e:
+        logger.warning("Не удалось сохранить снимок состояния", error=str(e))
+        return
+    logger.debug(
+        "Снимок состояния сохранен",
+        monitors=len(snapshot["monitors"]),
+        size=len(payload),
+    )
+
+
+def load_snapshot(
+    schedule: CheckSchedule = check_schedule,
+    path: str | Path = settings.STATE_SNAPSHOT_PATH,
+) -> int:
+    """
+    Восстанавливает расписание из файла. Возвращает число мониторов.
+    Отсутствующий, битый или устаревший снимок — не ошибка: старт с нуля.
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshot = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        logger.warning("Снимок состояния не прочитан", error=str(e))
+        return 0
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        logger.warning("Снимок состояния другой версии, пропускаем")
+        return 0
+
+    try:
+        saved_at = float(snapshot.get("saved_at", 0))
+        if not math.isfinite(saved_at):
+            raise ValueError(f"saved_at={saved_at}")
+    except (TypeError, ValueError) as e:
+        logger.warning("Снимок состояния битый, пропускаем", error=str(e))
+        return 0
+    age = time.time() - saved_at
+    if age > settings.STATE_SNAPSHOT_MAX_AGE:
+        logger.info("Снимок состояния устарел, пропускаем", age=int(age))
+        return 0
+
+    try:
+        restored = schedule.restore(snapshot, now=time.time())
+    except (TypeError, ValueError) as e:
+        logger.warning("Снимок состояния битый, пропускаем", error=str(e))
+        return 0
+    logger.info("Состояние восстановлено из снимка", monitors=restored, age=int(age))
+    return restored
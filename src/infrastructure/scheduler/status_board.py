@@ -0,0 +1,186 @@
+import hmac
+import base64
+import hashlib
+from typing import Iterable
+from dataclasses import dataclass
+
+from src.core.config import settings
+from src.infrastructure.database.models import MonitorModel
+from src.infrastructure.network.client import CheckResult
+from src.infrastructure.scheduler.adaptive import CheckSchedule
+
+
+@dataclass(slots=True)
+class MonitorStatus:
+    """Публичное состояние монитора на странице статуса."""
+
+    monitor_id: int
+    url: str
+    probe_type: str
+    is_up: bool | None = None  # None — еще не проверялся
+    since: float | None = None  # Время последней смены состояния (unix)
+    status_code: int | None = None
+    error: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class UserView:
+    """Срез страницы пользователя; version меняется при любом видимом изменении."""
+
+    user_id: int
+    version: int
+    monitors: tuple[MonitorStatus, ...]
+
+
+class StatusBoard:
+    """
+    In-memory снимок статусов для публичного API.
+
+    Движок обновляет его инкрементально (sync по списку активных мониторов
+    и record по каждому результату), а API только читает — в БД чтения
+    не ходят. Версия пользователя растет лишь при изменении того, что видно
+    на странице (состояние, код, ошибка, состав мониторов), поэтому время
+    ответа в снимок не входит: иначе каждая проверка сбрасывала бы кэш.
+
+    Токены доступа выводятся из секрета HMAC'ом и нигде не хранятся;
+    смена секрета отзывает все ссылки.
+    """
+
+    def __init__(self, secret: str | None) -> None:
+        self._secret = secret.encode() if secret else None
+        self._monitors: dict[int, MonitorStatus] = {}
+        self._by_user: dict[int, dict[int, MonitorStatus]] = {}
+        self._owner: dict[int, int] = {}
+        self._versions: dict[int, int] = {}
+        self._tokens: dict[str, int] = {}
+        # Готовые ответы API по пользователю и формату: (ETag, тело).
+        # Сбрасываются там же, где меняется версия, и удаляются вместе
+        # с последним монитором пользователя
+        self._rendered: dict[int, dict[str, tuple[str, bytes]]] = {}
+        # Общий счетчик: версия не повторяется, даже если пользователь
+        # удалил все мониторы и добавил новые
+        self._clock = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._secret is not None
+
+    def token(self, user_id: int) -> str | None:
+        """Неугадываемый токен страницы пользователя (None, если API выключен)."""
+        if self._secret is None:
+            return None
+        digest = hmac.new(self._secret, f"status:{user_id}".encode(), hashlib.sha256)
+        return base64.urlsafe_b64encode(digest.digest()[:16]).rstrip(b"=").decode()
+
+    def sync(
+        self, monitors: Iterable[MonitorModel], schedule: CheckSchedule | None = None
+    ) -> None:
+        """
+        Приводит состав мониторов к списку активных: удаленные и выключенные
+        убираются, новые добавляются со статусом из расписания (после
+        теплого рестарта он уже известен) или «нет данных».
+        """
+        seen: set[int] = set()
+        for monitor in monitors:
+            seen.add(monitor.id)
+            entry = self._monitors.get(monitor.id)
+            if entry is not None and (entry.url, entry.probe_type) == (
+                monitor.url,
+                monitor.probe_type,
+            ):
+                continue
+            if entry is not None:
+                self._remove(monitor.id)
+            entry = self._add(monitor)
+            state = schedule.get(monitor.id) if schedule is not None else None
+            if state is not None:
+                entry.is_up = state.is_up
+
+        for monitor_id in [i for i in self._monitors if i not in seen]:
+            self._remove(monitor_id)
+
+    def record(self, monitor: MonitorModel, result: CheckResult, now: float) -> None:
+        """Учитывает результат проверки; версия растет только при изменениях."""
+        entry = self._monitors.get(monitor.id)
+        if entry is None:
+            entry = self._add(monitor)
+
+        error = None if result.is_up else result.error
+        if (entry.is_up, entry.status_code, entry.error) == (
+            result.is_up,
+            result.status_code,
+            error,
+        ):
+            return
+        if entry.is_up != result.is_up:
+            entry.since = now
+        entry.is_up = result.is_up
+        entry.status_code = result.status_code
+        entry.error = error
+        self._bump(monitor.user_id)
+
+    def view(self, token: str) -> UserView | None:
+        """Срез страницы по токену; None — токен неизвестен."""
+        user_id = self._tokens.get(token)
+        if user_id is None:
+            return None
+        return UserView(
+            user_id=user_id,
+            version=self._versions[user_id],
+            monitors=tuple(self._by_user[user_id].values()),
+        )
+
+    def rendered(self, view: UserView, fmt: str) -> tuple[str, bytes] | None:
+        """Сохраненный ответ для этой версии среза (ETag, тело) или None."""
+        if self._versions.get(view.user_id) != view.version:
+            return None
+        return self._rendered.get(view.user_id, {}).get(fmt)
+
+    def store_rendered(self, view: UserView, fmt: str, etag: str, body: bytes) -> None:
+        """Запоминает ответ, если срез за время рендера не устарел."""
+        if self._versions.get(view.user_id) == view.version:
+            self._rendered.setdefault(view.user_id, {})[fmt] = (etag, body)
+
+    def _add(self, monitor: MonitorModel) -> MonitorStatus:
+        entry = MonitorStatus(
+            monitor_id=monitor.id, url=monitor.url, probe_type=monitor.probe_type
+        )
+        self._monitors[monitor.id] = entry
+        self._owner[monitor.id] = monitor.user_id
+        user_monitors = self._by_user.setdefault(monitor.user_id, {})
+        if not user_monitors:
+            token = self.token(monitor.user_id)
+            if token is not None:
+                self._tokens[token] = monitor.user_id
+        user_monitors[monitor.id] = entry
+        self._bump(monitor.user_id)
+        return entry
+
+    def _remove(self, monitor_id: int) -> None:
+        del self._monitors[monitor_id]
+        user_id = self._owner.pop(monitor_id)
+        user_monitors = self._by_user[user_id]
+        del user_monitors[monitor_id]
+        self._bump(user_id)
+        if not user_monitors:
+            # Без мониторов страница не нужна: ссылка отвечает 404
+            del self._by_user[user_id]
+            del self._versions[user_id]
+            token = self.token(user_id)
+            if token is not None:
+                self._tokens.pop(token, None)
+
+    def _bump(self, user_id: int) -> None:
+        self._clock += 1
+        self._versions[user_id] = self._clock
+        self._rendered.pop(user_id, None)
+
+
+# Глобальный снимок статусов для публичного API
+status_board = StatusBoard(
+    secret=(
+        settings.STATUS_API_SECRET.get_secret_value()
+        if settings.STATUS_API_SECRET
+        else None
+    )
+)